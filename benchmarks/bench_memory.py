@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""Memory benchmark of the parsed OpenDRIVE element model.
+
+Parses a synthetic map with the tree parser, which holds the whole XML
+tree next to the parsed objects, and with the streaming parser, which
+clears each element once parsed, and reports the peak RSS of the
+process as well as the memory held by the resulting OpenDrive object.
+Each measurement runs in a fresh interpreter. If the streaming parser
+is not available, e.g. on an older version, only the tree parser is
+measured.
+
+Usage:
+  python benchmarks/bench_memory.py [-n NUM_ROADS]
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import resource
+import tempfile
+import tracemalloc
+
+from lxml import etree
+
+from opendrive2lanelet.opendriveparser.parser import parse_opendrive
+
+try:
+    from opendrive2lanelet.opendriveparser.parser import parse_opendrive_stream
+except ImportError:
+    parse_opendrive_stream = None
+
+# the generator of synthetic files is shared with the tests
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test"))
+from synthetic_xodr import write_synthetic_xodr  # noqa: E402 pylint: disable=C0413
+
+__author__ = "Benjamin Orthen"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["Priority Program SPP 1835 Cooperative Interacting Automobiles"]
+__version__ = "1.1.2"
+__maintainer__ = "Benjamin Orthen"
+__email__ = "commonroad-i06@in.tum.de"
+__status__ = "Released"
+
+
+def parse_opendrive_tree(xodr_file: str):
+    """Parse a file with the tree parser."""
+    return parse_opendrive(etree.parse(xodr_file).getroot())
+
+
+PARSERS = {"tree": parse_opendrive_tree}
+if parse_opendrive_stream is not None:
+    PARSERS["stream"] = parse_opendrive_stream
+
+
+def measure_peak_rss(parser_name: str, xodr_file: str):
+    """Parse a file and return the RSS before parsing and the peak RSS in MiB."""
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    opendrive = PARSERS[parser_name](xodr_file)
+    rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    del opendrive
+
+    # ru_maxrss is in KiB on Linux
+    return rss_before / 1024, rss_peak / 1024
+
+
+def measure_held_memory(parser_name: str, xodr_file: str):
+    """Parse a file and return the memory held by the OpenDrive object in MiB."""
+    tracemalloc.start()
+    opendrive = PARSERS[parser_name](xodr_file)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del opendrive
+
+    return held / 1024 ** 2
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the memory usage of parsed OpenDRIVE files."
+    )
+    parser.add_argument("-n", "--num-roads", type=int, default=20000)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        xodr_file = os.path.join(tmp_dir, "synthetic.xodr")
+        write_synthetic_xodr(xodr_file, args.num_roads)
+
+        results = {}
+        with context.Pool(1, maxtasksperchild=1) as pool:
+            for parser_name in PARSERS:
+                rss_before, rss_peak = pool.apply(
+                    measure_peak_rss, (parser_name, xodr_file)
+                )
+                held = pool.apply(measure_held_memory, (parser_name, xodr_file))
+                results[parser_name] = (rss_before, rss_peak, held)
+
+    print(f"roads                {args.num_roads:>10}")
+    print("parser               " + "".join(f"{name:>10}" for name in results))
+    for row, label in enumerate(
+        ("RSS before parsing", "peak RSS", "held by OpenDrive")
+    ):
+        values = "".join(f"{result[row]:10.1f}" for result in results.values())
+        print(f"{label:<21}{values} MiB")
+
+
+if __name__ == "__main__":
+    main()
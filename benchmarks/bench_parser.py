@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+
+"""Micro-benchmark of the OpenDRIVE parser.
+
+Measures the cost of parsing a single geometry and a single lane
+with the former parser, which looks up the child elements with
+repeated find calls, and with the current parser, which visits each
+child element once, as well as of parsing the whole document,
+on the same synthetic file.
+
+Usage:
+  python benchmarks/bench_parser.py [-n NUM_ROADS] [-r REPEAT]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from lxml import etree
+
+from opendrive2lanelet.opendriveparser.elements.road import Road
+from opendrive2lanelet.opendriveparser.elements.roadLanes import (
+    Lane as RoadLaneSectionLane,
+    LaneSection as RoadLanesSection,
+    LaneWidth as RoadLaneSectionLaneWidth,
+    LaneBorder as RoadLaneSectionLaneBorder,
+)
+from opendrive2lanelet.opendriveparser.parser import (
+    parse_opendrive,
+    parse_opendrive_road_geometry,
+    parse_opendrive_road_lane_section,
+)
+
+# the generator of synthetic files is shared with the tests
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test"))
+from synthetic_xodr import write_synthetic_xodr  # noqa: E402 pylint: disable=C0413
+
+__author__ = "Benjamin Orthen"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["Priority Program SPP 1835 Cooperative Interacting Automobiles"]
+__version__ = "1.1.2"
+__maintainer__ = "Benjamin Orthen"
+__email__ = "commonroad-i06@in.tum.de"
+__status__ = "Released"
+
+
+def best_of(repeat: int, function) -> float:
+    """Run a function several times and return the fastest run time in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def former_parse_road_geometry(newRoad, road_geometry):
+    """Parse a geometry like the former parser, with a find call per attribute."""
+    startCoord = [float(road_geometry.get("x")), float(road_geometry.get("y"))]
+
+    if road_geometry.find("line") is not None:
+        newRoad.planView.addLine(
+            startCoord,
+            float(road_geometry.get("hdg")),
+            float(road_geometry.get("length")),
+        )
+
+    elif road_geometry.find("spiral") is not None:
+        newRoad.planView.addSpiral(
+            startCoord,
+            float(road_geometry.get("hdg")),
+            float(road_geometry.get("length")),
+            float(road_geometry.find("spiral").get("curvStart")),
+            float(road_geometry.find("spiral").get("curvEnd")),
+        )
+
+    elif road_geometry.find("arc") is not None:
+        newRoad.planView.addArc(
+            startCoord,
+            float(road_geometry.get("hdg")),
+            float(road_geometry.get("length")),
+            float(road_geometry.find("arc").get("curvature")),
+        )
+
+    elif road_geometry.find("poly3") is not None:
+        newRoad.planView.addPoly3(
+            startCoord,
+            float(road_geometry.get("hdg")),
+            float(road_geometry.get("length")),
+            float(road_geometry.find("poly3").get("a")),
+            float(road_geometry.find("poly3").get("b")),
+            float(road_geometry.find("poly3").get("c")),
+            float(road_geometry.find("poly3").get("d")),
+        )
+
+    elif road_geometry.find("paramPoly3") is not None:
+        if road_geometry.find("paramPoly3").get("pRange") == "arcLength":
+            pMax = float(road_geometry.get("length"))
+        else:
+            pMax = None
+
+        newRoad.planView.addParamPoly3(
+            startCoord,
+            float(road_geometry.get("hdg")),
+            float(road_geometry.get("length")),
+            float(road_geometry.find("paramPoly3").get("aU")),
+            float(road_geometry.find("paramPoly3").get("bU")),
+            float(road_geometry.find("paramPoly3").get("cU")),
+            float(road_geometry.find("paramPoly3").get("dU")),
+            float(road_geometry.find("paramPoly3").get("aV")),
+            float(road_geometry.find("paramPoly3").get("bV")),
+            float(road_geometry.find("paramPoly3").get("cV")),
+            float(road_geometry.find("paramPoly3").get("dV")),
+            pMax,
+        )
+
+    else:
+        raise Exception("invalid xml")
+
+
+def former_parse_road_lane_section(newRoad, lane_section_id, lane_section):
+    """Parse a lane section like the former parser, with repeated find calls."""
+    newLaneSection = RoadLanesSection(road=newRoad)
+    newLaneSection.idx = lane_section_id
+    newLaneSection.sPos = float(lane_section.get("s"))
+    newLaneSection.singleSide = lane_section.get("singleSide")
+
+    sides = dict(
+        left=newLaneSection.leftLanes,
+        center=newLaneSection.centerLanes,
+        right=newLaneSection.rightLanes,
+    )
+
+    for sideTag, newSideLanes in sides.items():
+
+        side = lane_section.find(sideTag)
+        if side is None:
+            continue
+
+        for lane in side.findall("lane"):
+
+            new_lane = RoadLaneSectionLane(
+                parentRoad=newRoad, lane_section=newLaneSection
+            )
+            new_lane.id = lane.get("id")
+            new_lane.type = lane.get("type")
+            new_lane.level = (
+                "true" if lane.get("level") in [1, "1", "true"] else "false"
+            )
+
+            if lane.find("link") is not None:
+
+                if lane.find("link").find("predecessor") is not None:
+                    new_lane.link.predecessorId = (
+                        lane.find("link").find("predecessor").get("id")
+                    )
+
+                if lane.find("link").find("successor") is not None:
+                    new_lane.link.successorId = (
+                        lane.find("link").find("successor").get("id")
+                    )
+
+            for widthIdx, width in enumerate(lane.findall("width")):
+                new_lane.widths.append(
+                    RoadLaneSectionLaneWidth(
+                        float(width.get("a")),
+                        float(width.get("b")),
+                        float(width.get("c")),
+                        float(width.get("d")),
+                        idx=widthIdx,
+                        start_offset=float(width.get("sOffset")),
+                    )
+                )
+
+            for borderIdx, border in enumerate(lane.findall("border")):
+                new_lane.borders.append(
+                    RoadLaneSectionLaneBorder(
+                        float(border.get("a")),
+                        float(border.get("b")),
+                        float(border.get("c")),
+                        float(border.get("d")),
+                        idx=borderIdx,
+                        start_offset=float(border.get("sOffset")),
+                    )
+                )
+
+            if lane.find("width") is None and lane.find("border") is not None:
+                new_lane.widths = new_lane.borders
+                new_lane.has_border_record = True
+
+            newSideLanes.append(new_lane)
+
+    newRoad.lanes.lane_sections.append(newLaneSection)
+
+
+def bench_geometries(root, repeat: int, parse_geometry):
+    geometries = root.findall("road/planView/geometry")
+
+    def run():
+        road = Road()
+        for geometry in geometries:
+            parse_geometry(road, geometry)
+
+    return best_of(repeat, run), len(geometries)
+
+
+def bench_lanes(root, repeat: int, parse_lane_section):
+    lane_sections = root.findall("road/lanes/laneSection")
+    num_lanes = len(root.findall("road/lanes/laneSection/*/lane"))
+
+    def run():
+        for lane_section_id, lane_section in enumerate(lane_sections):
+            parse_lane_section(Road(), lane_section_id, lane_section)
+
+    return best_of(repeat, run), num_lanes
+
+
+def bench_document(root, repeat: int, parse):
+    return best_of(repeat, lambda: parse(root)), len(root.findall("road"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the OpenDRIVE parser.")
+    parser.add_argument("-n", "--num-roads", type=int, default=10000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        xodr_file = os.path.join(tmp_dir, "synthetic.xodr")
+        write_synthetic_xodr(xodr_file, args.num_roads)
+        root = etree.parse(xodr_file).getroot()
+
+    for name, bench, parse in (
+        ("geometry (former)", bench_geometries, former_parse_road_geometry),
+        ("geometry", bench_geometries, parse_opendrive_road_geometry),
+        ("lane (former)", bench_lanes, former_parse_road_lane_section),
+        ("lane", bench_lanes, parse_opendrive_road_lane_section),
+        ("road (whole document)", bench_document, parse_opendrive),
+    ):
+        total, count = bench(root, args.repeat, parse)
+        print(
+            f"{name:<22} {count:>7} x {total / count * 1e6:8.2f} us = {total:7.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
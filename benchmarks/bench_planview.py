@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""Benchmark of position queries on a PlanView against the length of the road.
+
+A road of the given length is built from alternating arcs and spirals,
+each 50 m long. Random positions are queried with the interpolation of
+precalculated values, one by one and as one array, and with the exact
+evaluation of the geometries.
+
+Usage:
+  python benchmarks/bench_planview.py [-q NUM_QUERIES]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from opendrive2lanelet.opendriveparser.elements.roadPlanView import PlanView
+
+__author__ = "Benjamin Orthen"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["Priority Program SPP 1835 Cooperative Interacting Automobiles"]
+__version__ = "1.1.2"
+__maintainer__ = "Benjamin Orthen"
+__email__ = "commonroad-i06@in.tum.de"
+__status__ = "Released"
+
+GEOMETRY_LENGTH = 50.0
+
+
+def create_plan_view(length: float) -> PlanView:
+    """Create a PlanView of alternating arcs and spirals."""
+    plan_view = PlanView()
+    for i in range(int(length / GEOMETRY_LENGTH)):
+        if i % 2:
+            plan_view.addSpiral([0.0, 0.0], 0.0, GEOMETRY_LENGTH, 0.01, -0.01)
+        else:
+            plan_view.addArc([0.0, 0.0], 0.0, GEOMETRY_LENGTH, -0.01)
+    return plan_view
+
+
+def queries_per_second(query, s_positions: np.ndarray) -> float:
+    start = time.perf_counter()
+    for s_pos in s_positions:
+        query(s_pos)
+    return len(s_positions) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PlanView queries.")
+    parser.add_argument("-q", "--num-queries", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'road length':>12} {'interpolated':>16} {'batched':>16} {'exact':>16}")
+    for length in (100, 1000, 10000, 100000):
+        plan_view = create_plan_view(length)
+        s_positions = np.random.default_rng(0).uniform(
+            0, plan_view.length, args.num_queries
+        )
+
+        exact = queries_per_second(plan_view.calc_geometry, s_positions)
+        plan_view.precalculate()
+        interpolated = queries_per_second(
+            plan_view.interpolate_cached_values, s_positions
+        )
+        batched = queries_per_second(
+            plan_view.interpolate_cached_values, s_positions[np.newaxis]
+        ) * len(s_positions)
+
+        print(
+            f"{length:>10} m {interpolated:>12.0f} q/s {batched:>12.0f} q/s "
+            f"{exact:>12.0f} q/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+"""Benchmark of pruning dangling references in a ConversionLaneletNetwork.
+
+Builds synthetic networks of lanelets which are chained by predecessors and
+successors and have left and right neighbors. A part of the references points
+to lanelets which do not exist. Pruning is timed with
+ConversionLaneletNetwork.remove_dangling_references and, for the smaller
+networks, with the former pass which searched a list of all lanelet ids.
+Exits with an error if the number of removed references is wrong.
+
+Usage:
+  python benchmarks/bench_prune.py [-n NUM_LANELETS] [-f MAX_FORMER]
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from opendrive2lanelet.conversion_lanelet import ConversionLanelet
+from opendrive2lanelet.conversion_lanelet_network import (
+    ConversionLaneletNetwork,
+    PrunedReferences,
+)
+
+__author__ = "Benjamin Orthen"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["Priority Program SPP 1835 Cooperative Interacting Automobiles"]
+__version__ = "1.1.2"
+__maintainer__ = "Benjamin Orthen"
+__email__ = "commonroad-i06@in.tum.de"
+__status__ = "Released"
+
+# every DANGLING_EVERY-th lanelet references a missing lanelet in each category
+DANGLING_EVERY = 10
+
+
+def create_network(num_lanelets: int):
+    """Create a network with lanelets in pairs of neighbors, which are chained
+    by predecessors and successors.
+
+    Returns:
+      The network and the expected number of dangling references.
+    """
+    vertices = np.array([[0.0, 0.0], [1.0, 0.0]])
+    missing_id = num_lanelets + 1
+
+    network = ConversionLaneletNetwork()
+    for lanelet_id in range(1, num_lanelets + 1):
+        predecessor = [lanelet_id - 2] if lanelet_id > 2 else []
+        successor = [lanelet_id + 2] if lanelet_id + 2 <= num_lanelets else []
+        adjacent = lanelet_id + 1 if lanelet_id % 2 else lanelet_id - 1
+        adjacent_left = adjacent_right = None
+        if adjacent <= num_lanelets:
+            if lanelet_id % 2:
+                adjacent_left = adjacent
+            else:
+                adjacent_right = adjacent
+
+        if lanelet_id % DANGLING_EVERY == 0:
+            predecessor.append(missing_id)
+            successor.append(missing_id)
+            adjacent_left = missing_id
+
+        network.add_lanelet(
+            ConversionLanelet(
+                None,
+                vertices,
+                vertices,
+                vertices,
+                lanelet_id,
+                predecessor=predecessor,
+                successor=successor,
+                adjacent_left=adjacent_left,
+                adjacent_left_same_direction=True,
+                adjacent_right=adjacent_right,
+                adjacent_right_same_direction=True,
+            )
+        )
+
+    num_dangling = num_lanelets // DANGLING_EVERY
+    return network, PrunedReferences(num_dangling, num_dangling, num_dangling, 0)
+
+
+def remove_dangling_references_with_list(network: ConversionLaneletNetwork):
+    """Former pruning, which searched a list of all lanelet ids."""
+    lanelet_ids = [x.lanelet_id for x in network.lanelets]
+
+    for lanelet in network.lanelets:
+        lanelet.predecessor[:] = [
+            pred for pred in lanelet.predecessor if pred in lanelet_ids
+        ]
+        lanelet.successor[:] = [
+            succ for succ in lanelet.successor if succ in lanelet_ids
+        ]
+        if lanelet.adj_left not in lanelet_ids:
+            lanelet.adj_left = None
+        if lanelet.adj_right not in lanelet_ids:
+            lanelet.adj_right = None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark pruning of dangling lanelet references."
+    )
+    parser.add_argument("-n", "--num-lanelets", type=int, default=100000)
+    parser.add_argument(
+        "-f",
+        "--max-former",
+        type=int,
+        default=10000,
+        help="largest network for which the former pruning is timed",
+    )
+    args = parser.parse_args()
+
+    sizes = [size for size in (1000, 10000) if size < args.num_lanelets]
+    sizes.append(args.num_lanelets)
+
+    print(f"{'lanelets':>10} {'set':>12} {'former list':>14}")
+    for size in sizes:
+        network, expected = create_network(size)
+        start = time.perf_counter()
+        pruned = network.remove_dangling_references()
+        duration = time.perf_counter() - start
+        if pruned != expected:
+            print(f"Removed {pruned}, expected {expected}.", file=sys.stderr)
+            sys.exit(1)
+
+        former = ""
+        if size <= args.max_former:
+            network, _ = create_network(size)
+            start = time.perf_counter()
+            remove_dangling_references_with_list(network)
+            former = f"{(time.perf_counter() - start) * 1e3:11.1f} ms"
+
+        print(f"{size:>10} {duration * 1e3:9.1f} ms {former:>14}")
+
+
+if __name__ == "__main__":
+    main()
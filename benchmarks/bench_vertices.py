@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+"""Benchmark and regression check of the vertex calculation of ParametricLanes.
+
+Calculates the vertices of all ParametricLanes of a synthetic map with
+ParametricLane.calc_vertices and with the former loop which calculates
+each vertex with calc_border. Exits with an error if they differ.
+
+Usage:
+  python benchmarks/bench_vertices.py [-n NUM_ROADS] [-r REPEAT]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from opendrive2lanelet.network import Network
+from opendrive2lanelet.opendriveparser.parser import parse_opendrive_stream
+
+# the generator of synthetic files is shared with the tests
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test"))
+from synthetic_xodr import write_synthetic_xodr  # noqa: E402 pylint: disable=C0413
+
+__author__ = "Benjamin Orthen"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["Priority Program SPP 1835 Cooperative Interacting Automobiles"]
+__version__ = "1.1.2"
+__maintainer__ = "Benjamin Orthen"
+__email__ = "commonroad-i06@in.tum.de"
+__status__ = "Released"
+
+TOLERANCE = 1e-9
+
+
+def calc_vertices_per_point(parametric_lane, precision: float = 0.5):
+    """Calculate the vertices of a ParametricLane point by point."""
+    num_steps = int(max(3, np.ceil(parametric_lane.length / float(precision))))
+    left_vertices = []
+    right_vertices = []
+    for pos in np.linspace(0, parametric_lane.length, num_steps):
+        left_vertices.append(parametric_lane.calc_border("inner", pos)[0])
+        right_vertices.append(parametric_lane.calc_border("outer", pos)[0])
+    return np.array(left_vertices), np.array(right_vertices)
+
+
+def best_of(repeat: int, network: Network, function) -> float:
+    """Run a function on all ParametricLanes several times and return
+    the fastest run time in seconds, with empty border caches."""
+    parametric_lanes = [
+        parametric_lane
+        for parametric_lane_group in network._planes
+        for parametric_lane in parametric_lane_group.parametric_lanes
+    ]
+    times = []
+    for _ in range(repeat):
+        network.clear_border_caches()
+        start = time.perf_counter()
+        for parametric_lane in parametric_lanes:
+            function(parametric_lane)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def check_vertices(network: Network) -> float:
+    """Compare the vertices of both implementations and return the maximal deviation."""
+    max_deviation = 0.0
+    for parametric_lane_group in network._planes:
+        for parametric_lane in parametric_lane_group.parametric_lanes:
+            expected = calc_vertices_per_point(parametric_lane)
+            actual = parametric_lane.calc_vertices()
+            for expected_vertices, actual_vertices in zip(expected, actual):
+                if expected_vertices.shape != actual_vertices.shape:
+                    raise AssertionError(
+                        f"Different number of vertices of {parametric_lane.id_}."
+                    )
+                max_deviation = max(
+                    max_deviation, np.max(np.abs(expected_vertices - actual_vertices))
+                )
+    return max_deviation
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark and check the vertices of ParametricLanes."
+    )
+    parser.add_argument("-n", "--num-roads", type=int, default=200)
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        xodr_file = os.path.join(tmp_dir, "synthetic.xodr")
+        write_synthetic_xodr(xodr_file, args.num_roads)
+        network = Network()
+        network.load_opendrive(parse_opendrive_stream(xodr_file))
+
+    max_deviation = check_vertices(network)
+    per_point = best_of(args.repeat, network, calc_vertices_per_point)
+    vectorized = best_of(args.repeat, network, lambda lane: lane.calc_vertices())
+
+    print(f"per point      {per_point * 1e3:10.1f} ms")
+    print(f"calc_vertices  {vectorized * 1e3:10.1f} ms")
+    print(f"max deviation  {max_deviation:10.2e}")
+
+    if max_deviation > TOLERANCE:
+        print(f"Vertices differ by more than {TOLERANCE}.", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -235,16 +235,18 @@ class ConversionLanelet(Lanelet):
         """
         return self.calc_width(0)
 
-    def calc_width(self, s_pos: float) -> float:
+    def calc_width(self, s_pos) -> float:
         """Calc width at position s_pos.
 
         Args:
-          s_pos: Position in curve parameter ds.
+          s_pos: Position or array of positions in curve parameter ds.
         Returns:
-          Width at postiion s_pos.
+          Width at postiion s_pos, or array of widths for an array of positions.
         """
         inner_pos = self.calc_border("inner", s_pos)[0]
         outer_pos = self.calc_border("outer", s_pos)[0]
+        if np.ndim(s_pos) > 0:
+            return np.linalg.norm(inner_pos - outer_pos, axis=1)
         return np.linalg.norm(inner_pos - outer_pos)
 
     @property
@@ -345,7 +347,7 @@ class ConversionLanelet(Lanelet):
         self.center_vertices = lanelet.center_vertices
         self.right_vertices = lanelet.right_vertices
 
-    def calc_border(self, border: str, s_pos: float, width_offset: float = 0.0):
+    def calc_border(self, border: str, s_pos, width_offset=0.0):
         """Calc border position according to parametric_lane_group.
 
         Note: This does not consider borders which have been moved
@@ -353,13 +355,38 @@ class ConversionLanelet(Lanelet):
 
         Args:
           border: Which border to calculate (inner or outer).
-          s_pos: Position of parameter ds where to calc the
+          s_pos: Position or array of positions of parameter ds where to calc the
             Cartesian coordinates
-          width_offset: Offset to add to calculated width in reference
-           to the reference border. (Default value = 0.0)
+          width_offset: Offset or array of offsets to add to calculated width in
+           reference to the reference border. (Default value = 0.0)
 
         Returns:
           Cartesian coordinates of point on inner border
-            and tangential direction, too.
+            and tangential direction, too. For an array of positions,
+            the coordinates and tangential directions are stacked.
         """
         return self.parametric_lane_group.calc_border(border, s_pos, width_offset)
+
+    def calc_border_many(
+        self, border: str, s_positions: np.ndarray, width_offset=0.0
+    ):
+        """Calc border positions according to parametric_lane_group
+        at several positions.
+
+        Note: This does not consider borders which have been moved
+         due to joining / splitting.
+
+        Args:
+          border: Which border to calculate (inner or outer).
+          s_positions: Array of positions of parameter ds where to calc the
+            Cartesian coordinates
+          width_offset: Offset or array of offsets to add to calculated width in
+            reference to the reference border. (Default value = 0.0)
+
+        Returns:
+          Array of shape (N, 2) with the Cartesian coordinates of the points
+          and array of shape (N,) with the tangential directions.
+        """
+        return self.parametric_lane_group.calc_border_many(
+            border, s_positions, width_offset
+        )
@@ -3,12 +3,15 @@
 """Module to enhance LaneletNetwork class
 so it can be used for conversion from the opendrive format."""
 
-from typing import Tuple, List
+from typing import Tuple, List, NamedTuple
 from queue import Queue
+from contextlib import contextmanager
+from itertools import chain
 import numpy as np
 
 from commonroad.scenario.lanelet import LaneletNetwork
 from opendrive2lanelet.conversion_lanelet import ConversionLanelet
+from opendrive2lanelet.utils import format_road_section_lane_width_id
 
 __author__ = "Benjamin Orthen"
 __copyright__ = "TUM Cyber-Physical Systems Group"
@@ -19,16 +22,16 @@ __email__ = "commonroad-i06@in.tum.de"
 __status__ = "Released"
 
 
-def convert_to_new_lanelet_id(old_lanelet_id: str, ids_assigned: dict) -> int:
-    """Convert the old lanelet ids (format 501.1.-1.-1) to newer,
-    simpler ones (100, 101 etc.).
+def convert_to_new_lanelet_id(old_lanelet_id: int, ids_assigned: dict) -> int:
+    """Convert the old lanelet ids (packed road, section, lane and width ids)
+    to newer, simpler ones (100, 101 etc.).
 
     Do this by consecutively assigning
-    numbers, starting at 100, to the old_lanelet_id strings. Save the
+    numbers, starting at 100, to the old_lanelet_ids. Save the
     assignments in the dict which is passed to the function as ids_assigned.
 
     Args:
-      old_lanelet_id: Old id with format "501.1.-1.-1".
+      old_lanelet_id: Old id created by encode_road_section_lane_width_id.
       ids_assigned: Dict with all previous assignments
 
     Returns:
@@ -50,11 +53,114 @@ def convert_to_new_lanelet_id(old_lanelet_id: str, ids_assigned: dict) -> int:
     return new_lanelet_id
 
 
+def _find_chain_start(concatenated_to: dict, lanelet_id: int) -> int:
+    """Find the first lanelet of the chain a lanelet is concatenated to.
+
+    Halves the paths in concatenated_to on the way.
+
+    Args:
+      concatenated_to: Dict which maps a lanelet_id to the lanelet_id it was
+        concatenated to.
+      lanelet_id: Id of the lanelet.
+
+    Returns:
+      The lanelet_id of the first lanelet of the chain.
+    """
+    while lanelet_id in concatenated_to:
+        next_id = concatenated_to[lanelet_id]
+        concatenated_to[lanelet_id] = concatenated_to.get(next_id, next_id)
+        lanelet_id = concatenated_to[lanelet_id]
+
+    return lanelet_id
+
+
+class PrunedReferences(NamedTuple):
+    """Number of references to non existing lanelets removed by pruning."""
+
+    predecessor: int = 0
+    successor: int = 0
+    adj_left: int = 0
+    adj_right: int = 0
+
+
 class ConversionLaneletNetwork(LaneletNetwork):
     """Add functions to LaneletNetwork which
     further enable it to modify its Lanelets."""
 
-    def remove_lanelet(self, lanelet_id: str, remove_references: bool = False):
+    def __init__(self):
+        super().__init__()
+        # maps a lanelet_id to the ids of all lanelets which may reference it,
+        # only available inside of _indexed_references
+        self._references = None
+
+    @contextmanager
+    def _indexed_references(self):
+        """Index the references between the lanelets while the context is active.
+
+        Inside of the context, remove_lanelet and update_lanelet_id_references
+        only visit the lanelets which reference the changed lanelet.
+        References which are added inside of the context have to be
+        registered with _register_references.
+        """
+        self._references = {}
+        for lanelet in self.lanelets:
+            self._register_references(lanelet)
+        try:
+            yield
+        finally:
+            self._references = None
+
+    def _register_references(self, lanelet: ConversionLanelet):
+        """Add the current references of a lanelet to the reference index.
+
+        Args:
+          lanelet: Lanelet whose predecessors, successors and neighbors are registered.
+        """
+        if self._references is None:
+            return
+        for referenced_id in chain(
+            lanelet.predecessor,
+            lanelet.successor,
+            (lanelet.adj_left, lanelet.adj_right),
+        ):
+            if referenced_id is not None:
+                self._references.setdefault(referenced_id, set()).add(
+                    lanelet.lanelet_id
+                )
+
+    def _referencing_lanelets(self, lanelet_id: int) -> List[ConversionLanelet]:
+        """Get the lanelets which may reference a lanelet.
+
+        Args:
+          lanelet_id: Id of the referenced lanelet.
+
+        Returns:
+          All lanelets of the network if the references are not indexed,
+          otherwise the lanelets which referenced lanelet_id at some point.
+        """
+        if self._references is None:
+            return self.lanelets
+        return [
+            self._lanelets[referencing_id]
+            for referencing_id in self._references.get(lanelet_id, ())
+            if referencing_id in self._lanelets
+        ]
+
+    def add_lanelet(self, lanelet: ConversionLanelet):
+        """Add a lanelet to the network and register its references.
+
+        Args:
+          lanelet: Lanelet to add.
+
+        Returns:
+          True if the lanelet has been added to the network.
+        """
+        added = super().add_lanelet(lanelet)
+        if added:
+            self._register_references(lanelet)
+        return added
+
+    def remove_lanelet(self, lanelet_id: int, remove_references: bool = False):
         """Remove a lanelets with the specific lanelet_id
         from the _lanelets dict.
 
@@ -68,7 +174,7 @@ class ConversionLaneletNetwork(LaneletNetwork):
         """
         del self._lanelets[lanelet_id]
         if remove_references:
-            for lanelet in self.lanelets:
+            for lanelet in self._referencing_lanelets(lanelet_id):
                 lanelet.predecessor[:] = [
                     pred for pred in lanelet.predecessor if pred != lanelet_id
                 ]
@@ -103,7 +209,9 @@ class ConversionLaneletNetwork(LaneletNetwork):
         new_lanelet_ids_assigned = {}
 
         for lanelet in self.lanelets:
-            lanelet.description = lanelet.lanelet_id
+            lanelet.description = format_road_section_lane_width_id(
+                lanelet.lanelet_id
+            )
             self.remove_lanelet(lanelet.lanelet_id)
             lanelet.lanelet_id = convert_to_new_lanelet_id(
                 lanelet.lanelet_id, new_lanelet_ids_assigned
@@ -126,68 +234,98 @@ class ConversionLaneletNetwork(LaneletNetwork):
                 )
             self.add_lanelet(lanelet)
 
-    def prune_network(self):
-        """Remove references in predecessor, successor etc. to
-        non existing lanelets.
-
-        Args:
+    def prune_network(self) -> PrunedReferences:
+        """Remove lanelets with zero width and references in predecessor,
+        successor etc. to non existing lanelets.
 
         Returns:
-
+          Number of removed references per kind of reference.
         """
         self.delete_zero_width_parametric_lanes()
 
-        lanelet_ids = [x.lanelet_id for x in self.lanelets]
+        return self.remove_dangling_references()
+
+    def remove_dangling_references(self) -> PrunedReferences:
+        """Remove references in predecessor, successor etc. to
+        non existing lanelets.
+
+        Returns:
+          Number of removed references per kind of reference.
+        """
+        lanelet_ids = set(self._lanelets)
+        num_predecessors, num_successors, num_adj_left, num_adj_right = 0, 0, 0, 0
 
         for lanelet in self.lanelets:
+            num_references = len(lanelet.predecessor)
             lanelet.predecessor[:] = [
                 pred for pred in lanelet.predecessor if pred in lanelet_ids
             ]
+            num_predecessors += num_references - len(lanelet.predecessor)
+
+            num_references = len(lanelet.successor)
             lanelet.successor[:] = [
                 succ for succ in lanelet.successor if succ in lanelet_ids
             ]
-            if lanelet.adj_left not in lanelet_ids:
+            num_successors += num_references - len(lanelet.successor)
+
+            if lanelet.adj_left is not None and lanelet.adj_left not in lanelet_ids:
                 lanelet.adj_left = None
-            if lanelet.adj_right not in lanelet_ids:
+                num_adj_left += 1
+            if lanelet.adj_right is not None and lanelet.adj_right not in lanelet_ids:
                 lanelet.adj_right = None
+                num_adj_right += 1
+
+        return PrunedReferences(
+            num_predecessors, num_successors, num_adj_left, num_adj_right
+        )
 
     def delete_zero_width_parametric_lanes(self):
         """Remove all ParametricLaneGroup which have zero width at every point from
         this network.
         """
-        for lanelet in self.lanelets:
-            if lanelet.has_zero_width_everywhere():
-                if lanelet.adj_right:
-                    adj_right = self.find_lanelet_by_id(lanelet.adj_right)
-                    if adj_right:
-                        if adj_right.adj_left == lanelet.lanelet_id:
-                            adj_right.adj_left = lanelet.adj_left
-                            adj_right.adj_left_same_direction = (
-                                lanelet.adj_left_same_direction
-                            )
-                        else:
-                            adj_right.adj_right = lanelet.adj_left
-                            adj_right.adj_right_same_direction = (
-                                not lanelet.adj_left_same_direction
-                            )
-
-                if lanelet.adj_left:
-                    adj_left = self.find_lanelet_by_id(lanelet.adj_left)
-                    if adj_left:
-                        if adj_left.adj_right == lanelet.lanelet_id:
-                            adj_left.adj_right = lanelet.adj_right
-                            adj_left.adj_right_same_direction = (
-                                lanelet.adj_right_same_direction
-                            )
-                        else:
-                            adj_left.adj_left = lanelet.adj_right
-                            adj_left.adj_left_same_direction = (
-                                not lanelet.adj_right_same_direction
-                            )
-
-                self.remove_lanelet(lanelet.lanelet_id, remove_references=True)
-
-    def update_lanelet_id_references(self, old_id: str, new_id: str):
+        with self._indexed_references():
+            for lanelet in self.lanelets:
+                if lanelet.has_zero_width_everywhere():
+                    self._remove_zero_width_lanelet(lanelet)
+
+    def _remove_zero_width_lanelet(self, lanelet: ConversionLanelet):
+        """Remove a lanelet with zero width and make its neighbors adjacent
+        to each other.
+
+        Args:
+          lanelet: Lanelet to remove.
+        """
+        if lanelet.adj_right:
+            adj_right = self.find_lanelet_by_id(lanelet.adj_right)
+            if adj_right:
+                if adj_right.adj_left == lanelet.lanelet_id:
+                    adj_right.adj_left = lanelet.adj_left
+                    adj_right.adj_left_same_direction = lanelet.adj_left_same_direction
+                else:
+                    adj_right.adj_right = lanelet.adj_left
+                    adj_right.adj_right_same_direction = (
+                        not lanelet.adj_left_same_direction
+                    )
+                self._register_references(adj_right)
+
+        if lanelet.adj_left:
+            adj_left = self.find_lanelet_by_id(lanelet.adj_left)
+            if adj_left:
+                if adj_left.adj_right == lanelet.lanelet_id:
+                    adj_left.adj_right = lanelet.adj_right
+                    adj_left.adj_right_same_direction = (
+                        lanelet.adj_right_same_direction
+                    )
+                else:
+                    adj_left.adj_left = lanelet.adj_right
+                    adj_left.adj_left_same_direction = (
+                        not lanelet.adj_right_same_direction
+                    )
+                self._register_references(adj_left)
+
+        self.remove_lanelet(lanelet.lanelet_id, remove_references=True)
+
+    def update_lanelet_id_references(self, old_id: int, new_id: int):
         """Update all references to the old lanelet_id with the new_lanelet_id.
 
         Args:
@@ -196,7 +334,7 @@ class ConversionLaneletNetwork(LaneletNetwork):
 
         """
 
-        for lanelet in self.lanelets:
+        for lanelet in self._referencing_lanelets(old_id):
             lanelet.predecessor[:] = [
                 new_id if pred == old_id else pred for pred in lanelet.predecessor
             ]
@@ -211,6 +349,8 @@ class ConversionLaneletNetwork(LaneletNetwork):
             if lanelet.adj_left == old_id:
                 lanelet.adj_left = new_id
 
+            self._register_references(lanelet)
+
     def concatenate_possible_lanelets(self):
         """Iterate trough lanelets in network and concatenate possible lanelets together.
 
@@ -233,60 +373,103 @@ class ConversionLaneletNetwork(LaneletNetwork):
             if possible_concat_lanes:
                 concatenate_lanelets.append(possible_concat_lanes)
 
-        # this dict saves the lanelet_ids which point to another lanelet_id
-        # because they were concatenated together and the resulting lanelet
-        # can only have one lanelet_id.
-        # key in dict has been renamed to value
-        replacement_ids = dict()
-
-        for possible_concat_lanes in concatenate_lanelets:
-            # prevent chains of more than one lanelet being renamed
-            replacement_ids = {
-                k: replacement_ids.get(v, v) for k, v in replacement_ids.items()
-            }
-
-            possible_concat_lanes = [
-                (
-                    replacement_ids.get(pair[0], pair[0]),
-                    replacement_ids.get(pair[1], pair[1]),
-                )
-                for pair in possible_concat_lanes
-            ]
-            replacement_ids.update(
-                self._concatenate_lanelet_pairs_group(possible_concat_lanes)
-            )
+        with self._indexed_references():
+            lanelet_chains = self._plan_concatenation(concatenate_lanelets)
+            for lanelet_ids in lanelet_chains:
+                self._concatenate_lanelet_chain(lanelet_ids)
+
+            # each reference to a concatenated lanelet should point to
+            # the lanelet_id of the first lanelet of its chain instead
+            for lanelet_ids in lanelet_chains:
+                for lanelet_id in lanelet_ids[1:]:
+                    self.update_lanelet_id_references(lanelet_id, lanelet_ids[0])
 
-    def _concatenate_lanelet_pairs_group(self, lanelet_pairs: list) -> dict:
-        """Concatenate a group of lanelet_pairs, with setting correctly the new lanelet_ids
-        at neighbors.
+    @staticmethod
+    def _plan_concatenation(concatenate_lanelets: list) -> List[List[int]]:
+        """Resolve groups of lanelet pairs into chains of lanelets which are
+        concatenated to one lanelet.
+
+        The pairs are merged in order with a union-find structure, a lanelet
+        which has already been concatenated is replaced by the first lanelet
+        of its chain.
 
         Args:
-          lanelet_pairs: List with tuples of lanelet_ids which should be concatenated.
+          concatenate_lanelets: List of groups of lanelet pairs, each a tuple of
+            a lanelet_id and the lanelet_id of its successor.
 
         Returns:
-          Dict with information which lanelet_id was converted to a new one.
-
+          List of chains, each a list of the lanelet_ids in the order in which
+          they are concatenated. The resulting lanelet keeps the first lanelet_id.
         """
+        # maps the lanelet_id of a concatenated lanelet to the lanelet_id of the
+        # lanelet it was concatenated to
+        concatenated_to = dict()
+        lanelet_chains = dict()
+
+        for lanelet_pairs in concatenate_lanelets:
+            for pair in lanelet_pairs:
+                first_id = _find_chain_start(concatenated_to, pair[0])
+                second_id = _find_chain_start(concatenated_to, pair[1])
+                if first_id == second_id:
+                    continue
+
+                concatenated_to[second_id] = first_id
+                lanelet_chains.setdefault(first_id, [first_id]).extend(
+                    lanelet_chains.pop(second_id, [second_id])
+                )
 
-        new_lanelet_ids = dict()
-        for pair in lanelet_pairs:
-            if pair[0] == pair[1]:
-                continue
-            lanelet_1 = self.find_lanelet_by_id(pair[0])
-            lanelet_2 = self.find_lanelet_by_id(pair[1])
-            lanelet_1.concatenate(lanelet_2)
+        return list(lanelet_chains.values())
 
-            self.remove_lanelet(pair[1])
+    def _concatenate_lanelet_chain(self, lanelet_ids: List[int]):
+        """Concatenate a chain of lanelets to the first lanelet of the chain
+        and remove the other lanelets.
 
-            # each reference to lanelet_2 should point to lanelet_id
-            # of new_lanelet instead
-            self.update_lanelet_id_references(
-                lanelet_2.lanelet_id, lanelet_1.lanelet_id
-            )
-            # update dict to show which lanelet_id changed to which
-            new_lanelet_ids[pair[1]] = pair[0]
+        References to the removed lanelets are not updated.
+
+        Args:
+          lanelet_ids: Ids of the lanelets in the order in which they are concatenated.
+        """
+        lanelets = [self.find_lanelet_by_id(lanelet_id) for lanelet_id in lanelet_ids]
+
+        # skip the first vertices of a lanelet if they are the last of its predecessor
+        start_indices = [0] + [
+            1
+            if np.isclose(previous.left_vertices[-1], lanelet.left_vertices[0]).all()
+            else 0
+            for previous, lanelet in zip(lanelets, lanelets[1:])
+        ]
+
+        first_lanelet = lanelets[0]
+        first_lanelet.left_vertices = np.concatenate(
+            [
+                lanelet.left_vertices[start_idx:]
+                for lanelet, start_idx in zip(lanelets, start_indices)
+            ]
+        )
+        first_lanelet.center_vertices = np.concatenate(
+            [
+                lanelet.center_vertices[start_idx:]
+                for lanelet, start_idx in zip(lanelets, start_indices)
+            ]
+        )
+        first_lanelet.right_vertices = np.concatenate(
+            [
+                lanelet.right_vertices[start_idx:]
+                for lanelet, start_idx in zip(lanelets, start_indices)
+            ]
+        )
+        first_lanelet.parametric_lane_group.extend(
+            [
+                parametric_lane
+                for lanelet in lanelets[1:]
+                for parametric_lane in lanelet.parametric_lane_group.parametric_lanes
+            ]
+        )
+        first_lanelet.successor = lanelets[-1].successor.copy()
 
-        return new_lanelet_ids
+        for lanelet_id in lanelet_ids[1:]:
+            self.remove_lanelet(lanelet_id)
+        self._register_references(first_lanelet)
 
     def join_and_split_possible_lanes(self):
         """Move lanelet boundaries for lanelet splits or joins.
@@ -669,7 +852,7 @@ class _JoinSplitTarget:
         """
         return self._single_lanelet_operation and self.split_and_join
 
-    def _find_lanelet_by_id(self, lanelet_id: str) -> ConversionLanelet:
+    def _find_lanelet_by_id(self, lanelet_id: int) -> ConversionLanelet:
         """Run :func:`.ConversionLaneletNetwork.find_lanelet_by_id` of self.lanelet_network.
 
         Returns:
@@ -8,7 +8,7 @@ from opendrive2lanelet.plane_elements.plane import (
     ParametricLaneBorderGroup,
 )
 from opendrive2lanelet.plane_elements.plane_group import ParametricLaneGroup
-from opendrive2lanelet.plane_elements.border import Border
+from opendrive2lanelet.plane_elements.border import Border, BorderMatrix
 from opendrive2lanelet.utils import encode_road_section_lane_width_id
 
 
@@ -72,13 +72,15 @@ class OpenDriveConverter:
 
     @staticmethod
     def lane_section_to_parametric_lanes(
-        lane_section, reference_border, speed
+        lane_section, reference_border, speed, flatten_borders: bool = True
     ) -> List[ParametricLaneGroup]:
         """Convert a whole lane section into a list of ParametricLane objects.
 
         Args:
           lane_section:
           reference_border:
+          flatten_borders: Evaluate the lane borders of each side of the lane section
+            with a BorderMatrix instead of through all inner borders. (Default value = True)
 
         Returns:
 
@@ -138,6 +140,11 @@ class OpenDriveConverter:
                 if plane_group.length > 0:
                     plane_groups.append(plane_group)
 
+            if flatten_borders and BorderMatrix.can_flatten(
+                reference_border, lane_borders[1:]
+            ):
+                BorderMatrix.attach(reference_border, lane_borders[1:])
+
         return plane_groups
 
     @staticmethod
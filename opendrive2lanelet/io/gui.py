@@ -2,6 +2,7 @@
 
 """Module to execute the Qt Program for a GUI conversion."""
 
+import argparse
 import os
 import signal
 import sys
@@ -15,8 +16,7 @@ from PyQt5.QtWidgets import QPushButton, QMessageBox, QLabel
 from commonroad.common.file_writer import CommonRoadFileWriter
 
 
-from opendrive2lanelet.opendriveparser.parser import parse_opendrive
-from opendrive2lanelet.network import Network
+from opendrive2lanelet.io.network_cache import NetworkCache, load_opendrive_network
 from opendrive2lanelet.io.viewer import MainWindow as ViewerWidget
 
 __author__ = "Benjamin Orthen, Stefan Urban"
@@ -37,22 +37,41 @@ def main():
     Returns:
 
     """
+    parser = argparse.ArgumentParser(
+        description="Convert OpenDRIVE files to CommonRoad in a GUI."
+    )
+    parser.add_argument("xodr_file", nargs="?", help="xodr file to load at startup")
+    parser.add_argument(
+        "--cache-dir",
+        help="cache parsed networks in this directory to speed up repeated conversions",
+    )
+    # remaining arguments are passed to Qt
+    args, qt_args = parser.parse_known_args()
+
     # Make it possible to exit application with ctrl+c on console
     signal.signal(signal.SIGINT, signal.SIG_DFL)
 
     # Startup application
-    app = QApplication(sys.argv)
-    _ = MainWindow(sys.argv)
+    app = QApplication(sys.argv[:1] + qt_args)
+    argv = sys.argv[:1] + ([args.xodr_file] if args.xodr_file else [])
+    _ = MainWindow(argv, cache_dir=args.cache_dir)
     sys.exit(app.exec_())
 
 
 class MainWindow(QWidget):
-    """ """
+    """Main window of the GUI.
+
+    Args:
+      argv: Command line arguments, the second one is a xodr file to load.
+      cache_dir: If given, parsed networks are cached in this directory.
+        (Default value = None)
+    """
 
-    def __init__(self, argv):
+    def __init__(self, argv, cache_dir: str = None):
         super().__init__()
 
         self.loadedRoadNetwork = None
+        self.cache = NetworkCache(cache_dir) if cache_dir else None
 
         self._initUserInterface()
         self.show()
@@ -110,7 +129,7 @@ class MainWindow(QWidget):
             self,
             "QFileDialog.getOpenFileName()",
             "",
-            "OpenDRIVE files *.xodr (*.xodr)",
+            "OpenDRIVE files *.xodr (*.xodr *.xodr.gz *.xodr.zst)",
             options=QFileDialog.Options(),
         )
 
@@ -134,9 +153,9 @@ class MainWindow(QWidget):
 
         # Load road network and print some statistics
         try:
-            fh = open(path, "r")
-            openDriveXml = parse_opendrive(etree.parse(fh).getroot())
-            fh.close()
+            openDriveXml, self.loadedRoadNetwork = load_opendrive_network(
+                path, self.cache
+            )
         except (etree.XMLSyntaxError) as e:
             errorMsg = "XML Syntax Error: {}".format(e)
             QMessageBox.warning(
@@ -160,9 +179,6 @@ class MainWindow(QWidget):
             )
             return
 
-        self.loadedRoadNetwork = Network()
-        self.loadedRoadNetwork.load_opendrive(openDriveXml)
-
         self.statsText.setText(
             """Name: {}<br>Version: {}<br>Date: {}<br><br>OpenDRIVE
             Version {}.{}<br><br>Number of roads: {}<br>Total length
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+
+"""Module for an on-disk cache of parsed OpenDRIVE files and the
+ParametricLane networks created from them."""
+
+import os
+import stat
+import pickle
+import hashlib
+import tempfile
+from typing import Tuple
+
+from opendrive2lanelet.opendriveparser.elements.opendrive import OpenDrive
+from opendrive2lanelet.opendriveparser.parser import parse_opendrive_stream
+from opendrive2lanelet.opendriveparser.region import Region
+from opendrive2lanelet.network import Network, __version__ as converter_version
+from opendrive2lanelet.io.xodr_file import open_xodr
+
+__author__ = "Benjamin Orthen"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["Priority Program SPP 1835 Cooperative Interacting Automobiles"]
+__version__ = "1.1.2"
+__maintainer__ = "Benjamin Orthen"
+__email__ = "commonroad-i06@in.tum.de"
+__status__ = "Released"
+
+# increase if the pickled classes change in an incompatible way
+CACHE_FORMAT_VERSION = 7
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "OPENDRIVE2LANELET_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "opendrive2lanelet"),
+)
+
+
+class NetworkCache:
+    """Cache of parsed OpenDrive objects and loaded Network objects.
+
+    Entries are keyed by a hash of the content of the xodr file, the
+    region of interest, the converter version and the cache format version,
+    so a changed file or a new version of the converter never uses stale entries.
+    Each entry is one binary pickle file, in which the geometry arrays of the
+    network are stored as raw numpy buffers.
+
+    Loading a pickle file can execute arbitrary code, so everybody who can
+    write to the cache directory can run code as the user of the cache.
+    The cache directory is therefore created accessible only by the current
+    user, and the cache refuses to use a directory or entry which is owned by
+    another user or writable by other users.
+
+    If the size of all entries exceeds max_size, the least recently used
+    entries are deleted.
+
+    Attributes:
+      cache_dir (str): Directory where cache entries are saved.
+      max_size (int): Maximum size of all cache entries in bytes.
+    """
+
+    file_suffix = ".pickle"
+
+    def __init__(self, cache_dir: str = None, max_size: int = 1024 ** 3):
+        self.cache_dir = cache_dir if cache_dir is not None else DEFAULT_CACHE_DIR
+        self.max_size = max_size
+
+    def key(
+        self, xodr_file: str, region: Region = None, max_chord_error: float = None
+    ) -> str:
+        """Calculate the cache key of a xodr file.
+
+        Args:
+          xodr_file: Path to the xodr file.
+          region: Region of interest the file was parsed with. (Default value = None)
+          max_chord_error: Maximal chord error the plan views were precalculated
+            with. (Default value = None)
+
+        Returns:
+          Hex digest which identifies the file content and converter version.
+        """
+        file_hash = hashlib.sha256()
+        file_hash.update(
+            f"{converter_version}:{CACHE_FORMAT_VERSION}:{region!r}:"
+            f"{max_chord_error!r}:".encode()
+        )
+        with open(xodr_file, "rb") as file_in:
+            for chunk in iter(lambda: file_in.read(1024 ** 2), b""):
+                file_hash.update(chunk)
+
+        return file_hash.hexdigest()
+
+    def check_permissions(self):
+        """Check that only the current user can write to the cache directory.
+
+        Raises:
+          PermissionError: If the cache directory is owned by another user
+            or writable by the group or others.
+        """
+        try:
+            _check_owned_by_user(os.stat(self.cache_dir), self.cache_dir)
+        except FileNotFoundError:
+            pass
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + self.file_suffix)
+
+    def load(self, key: str) -> Tuple[OpenDrive, Network]:
+        """Load the cached OpenDrive and Network of a xodr file.
+
+        Args:
+          key: Cache key of the file, see key().
+
+        Returns:
+          Tuple (opendrive, network) or None if there is no valid entry.
+
+        Raises:
+          PermissionError: If other users could have written the entry.
+        """
+        self.check_permissions()
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "rb") as file_in:
+                _check_owned_by_user(os.fstat(file_in.fileno()), entry_path)
+                opendrive, network = pickle.load(file_in)
+        except FileNotFoundError:
+            return None
+        except (
+            pickle.UnpicklingError,
+            EOFError,
+            AttributeError,
+            ImportError,
+            TypeError,
+            ValueError,
+        ):
+            # entry is corrupt or was written by an incompatible version
+            self._remove(entry_path)
+            return None
+
+        # mark entry as recently used
+        os.utime(entry_path)
+
+        return opendrive, network
+
+    def store(self, key: str, opendrive: OpenDrive, network: Network):
+        """Save the OpenDrive and Network of a xodr file in the cache.
+
+        The network has to be stored directly after loading the OpenDrive,
+        as exporting lanelets modifies it.
+
+        Args:
+          key: Cache key of the file, see key().
+          opendrive: Parsed OpenDrive of the file.
+          network: Network which has loaded the opendrive.
+
+        Raises:
+          PermissionError: If other users can write to the cache directory.
+        """
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+        self.check_permissions()
+        entry_path = self._entry_path(key)
+
+        # write to a temporary file first, so other processes never read half written entries
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+        try:
+            with os.fdopen(file_descriptor, "wb") as file_out:
+                pickle.dump(
+                    (opendrive, network), file_out, protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+
+        self.evict(keep=entry_path)
+
+    def evict(self, keep: str = None):
+        """Delete least recently used entries until the cache is not larger than max_size.
+
+        Args:
+          keep: Path of an entry which should not be deleted. (Default value = None)
+        """
+        entries = []
+        for file_name in os.listdir(self.cache_dir):
+            if not file_name.endswith(self.file_suffix):
+                continue
+            entry_path = os.path.join(self.cache_dir, file_name)
+            try:
+                stat = os.stat(entry_path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if entry_path == keep:
+                continue
+            self._remove(entry_path)
+            total_size -= size
+
+    def clear(self):
+        """Delete all entries of the cache."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for file_name in os.listdir(self.cache_dir):
+            if file_name.endswith(self.file_suffix):
+                self._remove(os.path.join(self.cache_dir, file_name))
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _check_owned_by_user(file_stat: os.stat_result, path: str):
+    """Raise a PermissionError if a file is not owned by the current user
+    or writable by the group or others."""
+    # there are no user ids on Windows
+    if hasattr(os, "getuid") and file_stat.st_uid != os.getuid():
+        raise PermissionError(f"{path} is owned by another user.")
+    if file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"{path} is writable by other users.")
+
+
+def load_opendrive_network(
+    xodr_file: str,
+    cache: NetworkCache = None,
+    num_processes: int = 1,
+    region: Region = None,
+    max_chord_error: float = None,
+) -> Tuple[OpenDrive, Network]:
+    """Parse a xodr file and load it into a Network.
+
+    The file is opened with :func:`open_xodr`, so it can be compressed.
+
+    If a cache is given and has an entry for the file, parsing and loading
+    are skipped. Otherwise, the result is stored in the cache.
+
+    Args:
+      xodr_file: Path to the xodr file.
+      cache: Cache to use. (Default value = None)
+      num_processes: Number of processes which parse the roads. (Default value = 1)
+      region: If given, only the roads of this region are loaded. (Default value = None)
+      max_chord_error: If given, the plan views of the roads are precalculated
+        adaptively with this maximal chord error. (Default value = None)
+
+    Returns:
+      Tuple (opendrive, network).
+    """
+    if cache is not None:
+        # hashing large files is expensive, so the key is only calculated once
+        cache_key = cache.key(xodr_file, region, max_chord_error)
+        cached = cache.load(cache_key)
+        if cached is not None:
+            return cached
+
+    with open_xodr(xodr_file) as source:
+        opendrive = parse_opendrive_stream(source, num_processes, region)
+    network = Network()
+    network.load_opendrive(opendrive, max_chord_error=max_chord_error)
+
+    if cache is not None:
+        cache.store(cache_key, opendrive, network)
+
+    return opendrive, network
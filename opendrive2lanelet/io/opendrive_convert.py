@@ -15,9 +15,11 @@ from commonroad.scenario.scenario import Scenario
 from commonroad.common.file_writer import CommonRoadFileWriter
 
 from opendrive2lanelet.opendriveparser.elements.opendrive import OpenDrive
-from opendrive2lanelet.opendriveparser.parser import parse_opendrive
 from opendrive2lanelet.network import Network
 from opendrive2lanelet.osm.lanelet2osm import L2OSMConverter
+from opendrive2lanelet.io.network_cache import NetworkCache, load_opendrive_network
+from opendrive2lanelet.io.xodr_file import strip_compression_suffix
+from opendrive2lanelet.opendriveparser.region import DEFAULT_MARGIN, Region
 
 __author__ = "Benjamin Orthen"
 __copyright__ = "TUM Cyber-Physical Systems Group"
@@ -30,7 +32,9 @@ __status__ = "Released"
 
 def parse_arguments():
     parser = argparse.ArgumentParser(description="")
-    parser.add_argument("xodr_file", help="xodr file")
+    parser.add_argument(
+        "xodr_file", help="xodr file, can be compressed with gzip (.gz) or zstd (.zst)"
+    )
     parser.add_argument(
         "-f",
         "--force-overwrite",
@@ -39,22 +43,57 @@ def parse_arguments():
     )
     parser.add_argument("--osm", help="use proj-string to convert directly to osm")
     parser.add_argument("-o", "--output-name", help="specify name of outputed file")
+    parser.add_argument(
+        "--cache-dir",
+        help="cache parsed networks in this directory to speed up repeated conversions",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of processes used to parse the roads of the xodr file",
+    )
+    parser.add_argument(
+        "--bbox",
+        nargs=4,
+        type=float,
+        metavar=("MIN_X", "MIN_Y", "MAX_X", "MAX_Y"),
+        help="only convert the roads in this bounding box of the map, "
+        "selected approximately by their geometries",
+    )
+    parser.add_argument(
+        "--bbox-margin",
+        type=float,
+        default=DEFAULT_MARGIN,
+        metavar="MARGIN",
+        help="also convert roads whose reference line is at most this distance in "
+        f"meters away from the bounding box (default: {DEFAULT_MARGIN})",
+    )
+    parser.add_argument(
+        "--max-chord-error",
+        type=float,
+        help="place lanelet vertices adaptively, so that the lanelet borders deviate "
+        "at most this distance in meters from the lane borders, instead of every 0.5 m",
+    )
     args = parser.parse_args()
     return args
 
 
-def convert_opendrive(opendrive: OpenDrive) -> Scenario:
+def convert_opendrive(opendrive: OpenDrive, max_chord_error: float = None) -> Scenario:
     """Convert an existing OpenDrive object to a CommonRoad Scenario.
 
     Args:
       opendrive: Parsed in OpenDrive map.
+      max_chord_error: If given, plan views and lanelet vertices are sampled
+        adaptively with this maximal chord error. (Default value = None)
     Returns:
       A commonroad scenario with the map represented by lanelets.
     """
     road_network = Network()
-    road_network.load_opendrive(opendrive)
+    road_network.load_opendrive(opendrive, max_chord_error=max_chord_error)
 
-    return road_network.export_commonroad_scenario()
+    return road_network.export_commonroad_scenario(max_chord_error=max_chord_error)
 
 
 def main():
@@ -66,7 +105,7 @@ def main():
     if args.output_name:
         output_name = args.output_name
     else:
-        output_name = args.xodr_file.rpartition(".")[0]
+        output_name = strip_compression_suffix(args.xodr_file).rpartition(".")[0]
         output_name = (
             f"{output_name}.osm" if args.osm else f"{output_name}.xml"
         )  # only name of file
@@ -78,10 +117,23 @@ def main():
         )
         sys.exit(-1)
 
-    with open("{}".format(args.xodr_file), "r") as file_in:
-        opendrive = parse_opendrive(etree.parse(file_in).getroot())
+    cache = NetworkCache(args.cache_dir) if args.cache_dir else None
+    region = (
+        Region.from_bounding_box(*args.bbox, margin=args.bbox_margin)
+        if args.bbox
+        else None
+    )
+    _, road_network = load_opendrive_network(
+        args.xodr_file,
+        cache,
+        num_processes=args.jobs,
+        region=region,
+        max_chord_error=args.max_chord_error,
+    )
 
-    scenario = convert_opendrive(opendrive)
+    scenario = road_network.export_commonroad_scenario(
+        max_chord_error=args.max_chord_error
+    )
 
     if not args.osm:
         writer = CommonRoadFileWriter(
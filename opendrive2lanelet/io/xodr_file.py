@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+"""Module to open plain and compressed xodr files as binary sources for the parser."""
+
+import gzip
+import mmap
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+__author__ = "Benjamin Orthen"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["Priority Program SPP 1835 Cooperative Interacting Automobiles"]
+__version__ = "1.1.2"
+__maintainer__ = "Benjamin Orthen"
+__email__ = "commonroad-i06@in.tum.de"
+__status__ = "Released"
+
+GZIP_SUFFIX = ".gz"
+ZSTD_SUFFIX = ".zst"
+
+
+def strip_compression_suffix(file_name: str) -> str:
+    """Remove the suffix of a compressed file, e.g. map.xodr.gz -> map.xodr
+
+    Args:
+      file_name: Name of the file.
+
+    Returns:
+      The name without the compression suffix.
+    """
+    for suffix in (GZIP_SUFFIX, ZSTD_SUFFIX):
+        if file_name.endswith(suffix):
+            return file_name[: -len(suffix)]
+    return file_name
+
+
+@contextmanager
+def open_xodr(file_name: str) -> Iterator[BinaryIO]:
+    """Open a xodr file for parsing.
+
+    Files ending with .gz are decompressed with gzip and files ending with .zst
+    with zstandard, which has to be installed for this. Both are decompressed
+    while parsing, so the decompressed document is never held in memory.
+    Plain files are memory-mapped, so lxml reads directly from the mapped
+    pages instead of a decoded Python string of the whole document.
+
+    The source of a zstd-compressed file can only be read once, so it
+    cannot be parsed with a region of interest.
+
+    Args:
+      file_name: Path to the xodr file.
+
+    Yields:
+      Binary file-like object which can be passed to the parser.
+    """
+    if file_name.endswith(GZIP_SUFFIX):
+        with gzip.open(file_name, "rb") as file_in:
+            yield file_in
+
+    elif file_name.endswith(ZSTD_SUFFIX):
+        if zstandard is None:
+            raise ImportError(
+                "The zstandard package is required to read zstd-compressed xodr files."
+            )
+        with open(file_name, "rb") as compressed_file:
+            with zstandard.ZstdDecompressor().stream_reader(compressed_file) as file_in:
+                yield file_in
+
+    else:
+        with open(file_name, "rb") as file_in:
+            try:
+                mapped_file = mmap.mmap(file_in.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files cannot be mapped, let the parser report the error
+                mapped_file = None
+
+            if mapped_file is None:
+                yield file_in
+            else:
+                with mapped_file:
+                    yield mapped_file
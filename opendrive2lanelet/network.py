@@ -9,6 +9,7 @@ from commonroad.scenario.scenario import Scenario
 from opendrive2lanelet.opendriveparser.elements.opendrive import OpenDrive
 
 from opendrive2lanelet.utils import encode_road_section_lane_width_id
+from opendrive2lanelet.plane_elements.border import Border, CacheStatistics
 from opendrive2lanelet.conversion_lanelet_network import ConversionLaneletNetwork
 from opendrive2lanelet.converter import OpenDriveConverter
 
@@ -37,11 +38,14 @@ class Network:
     def __eq__(self, other):
         return self.__dict__ == other.__dict__
 
-    def load_opendrive(self, opendrive: OpenDrive):
+    def load_opendrive(self, opendrive: OpenDrive, max_chord_error: float = None):
         """Load all elements of an OpenDRIVE network to a parametric lane representation
 
         Args:
           opendrive:
+          max_chord_error: If given, the plan views of the roads are precalculated
+            adaptively with this maximal chord error, see PlanView.precalculate.
+            (Default value = None)
 
         """
 
@@ -53,7 +57,7 @@ class Network:
 
         # Convert all parts of a road to parametric lanes (planes)
         for road in opendrive.roads:
-            road.planView.precalculate()
+            road.planView.precalculate(max_chord_error=max_chord_error)
 
             # The reference border is the base line for the whole road
             reference_border = OpenDriveConverter.create_reference_border(
@@ -73,13 +77,49 @@ class Network:
 
                 self._planes.extend(parametric_lane_groups)
 
+    def _get_borders(self) -> list:
+        """Get all Borders of the parametric lanes, including the Borders they reference.
+
+        Returns:
+          List of Borders without duplicates.
+        """
+        borders = {}
+        for parametric_lane_group in self._planes:
+            for parametric_lane in parametric_lane_group.parametric_lanes:
+                border_group = parametric_lane.border_group
+                for border in (border_group.inner_border, border_group.outer_border):
+                    while isinstance(border, Border) and id(border) not in borders:
+                        borders[id(border)] = border
+                        border = border.reference
+
+        return list(borders.values())
+
+    def border_cache_statistics(self) -> CacheStatistics:
+        """Get the accumulated statistics of the sample caches of all Borders.
+
+        Returns:
+          Hits, misses and number of cached samples.
+        """
+        return sum(
+            (border.cache_statistics for border in self._get_borders()),
+            CacheStatistics(),
+        )
+
+    def clear_border_caches(self):
+        """Remove the cached samples of all Borders, e.g. to free memory after an export."""
+        for border in self._get_borders():
+            border.clear_cache()
+
     def export_lanelet_network(
-        self, filter_types: list = None
+        self, filter_types: list = None, max_chord_error: float = None
     ) -> "ConversionLaneletNetwork":
         """Export network as lanelet network.
 
         Args:
           filter_types: types of ParametricLane objects to be filtered. (Default value = None)
+          max_chord_error: If given, the vertices of the lanelets are placed adaptively,
+            so that the chords between them deviate at most this distance from the
+            lane borders. Otherwise they are placed every 0.5 m. (Default value = None)
 
         Returns:
           The converted LaneletNetwork object.
@@ -92,7 +132,7 @@ class Network:
             if filter_types is not None and parametric_lane.type not in filter_types:
                 continue
 
-            lanelet = parametric_lane.to_lanelet()
+            lanelet = parametric_lane.to_lanelet(max_chord_error=max_chord_error)
 
             lanelet.predecessor = self._link_index.get_predecessors(parametric_lane.id_)
             lanelet.successor = self._link_index.get_successors(parametric_lane.id_)
@@ -113,7 +153,7 @@ class Network:
         return lanelet_network
 
     def export_commonroad_scenario(
-        self, dt: float = 0.1, benchmark_id=None, filter_types=None
+        self, dt: float = 0.1, benchmark_id=None, filter_types=None, max_chord_error=None
     ):
         """Export a full CommonRoad scenario
 
@@ -121,6 +161,7 @@ class Network:
           dt:  (Default value = 0.1)
           benchmark_id:  (Default value = None)
           filter_types:  (Default value = None)
+          max_chord_error: See export_lanelet_network. (Default value = None)
 
         Returns:
 
@@ -134,7 +175,8 @@ class Network:
             self.export_lanelet_network(
                 filter_types=filter_types
                 if isinstance(filter_types, list)
-                else ["driving", "onRamp", "offRamp", "exit", "entry"]
+                else ["driving", "onRamp", "offRamp", "exit", "entry"],
+                max_chord_error=max_chord_error,
             )
         )
 
@@ -142,10 +184,20 @@ class Network:
 
 
 class LinkIndex:
-    """Overall index of all links in the file, save everything as successors, predecessors can be found via a reverse search"""
+    """Overall index of all links in the file.
+
+    Successors and predecessors are both stored as dicts which map an id to
+    an ordered set (a dict with None values) of its linked ids, so queries
+    and removals only touch the links of one ParametricLane.
+    """
 
     def __init__(self):
         self._successors = {}
+        self._predecessors = {}
+        # order in which ids got their first successor, predecessors are
+        # returned in this order
+        self._order = {}
+        self._next_order = 0
 
     def create_from_opendrive(self, opendrive):
         """Create a LinkIndex from an OpenDrive object.
@@ -251,10 +303,12 @@ class LinkIndex:
             return
 
         if parametric_lane_id not in self._successors:
-            self._successors[parametric_lane_id] = []
+            self._successors[parametric_lane_id] = {}
+            self._order[parametric_lane_id] = self._next_order
+            self._next_order += 1
 
-        if successor not in self._successors[parametric_lane_id]:
-            self._successors[parametric_lane_id].append(successor)
+        self._successors[parametric_lane_id][successor] = None
+        self._predecessors.setdefault(successor, {})[parametric_lane_id] = None
 
     def _add_junctions(self, opendrive):
         """
@@ -277,6 +331,10 @@ class LinkIndex:
                 connecting_road = opendrive.getRoad(connection.connectingRoad)
                 contact_point = connection.contactPoint
 
+                # roads are missing if only a region of the file was parsed
+                if incoming_road is None or connecting_road is None:
+                    continue
+
                 for lane_link in connection.laneLinks:
                     if contact_point == "start":
 
@@ -327,14 +385,16 @@ class LinkIndex:
         """
         # Delete key
         if parametric_lane_id in self._successors:
-            del self._successors[parametric_lane_id]
+            for successor in self._successors.pop(parametric_lane_id):
+                self._predecessors[successor].pop(parametric_lane_id, None)
+            del self._order[parametric_lane_id]
 
         # Delete all occurances in successor lists
-        for successorsId, successors in self._successors.items():
-            if parametric_lane_id in successors:
-                self._successors[successorsId].remove(parametric_lane_id)
+        for predecessor in self._predecessors.pop(parametric_lane_id, {}):
+            if predecessor in self._successors:
+                self._successors[predecessor].pop(parametric_lane_id, None)
 
-    def get_successors(self, parametric_lane_id: str) -> list:
+    def get_successors(self, parametric_lane_id: int) -> list:
         """
 
         Args:
@@ -348,9 +408,9 @@ class LinkIndex:
         if parametric_lane_id not in self._successors:
             return []
 
-        return self._successors[parametric_lane_id]
+        return list(self._successors[parametric_lane_id])
 
-    def get_predecessors(self, parametric_lane_id: str) -> list:
+    def get_predecessors(self, parametric_lane_id: int) -> list:
         """
 
         Args:
@@ -359,14 +419,9 @@ class LinkIndex:
         Returns:
           List of predecessors of a ParametricLane.
         """
-        predecessors = []
-        for successor_plane_id, successors in self._successors.items():
-            if parametric_lane_id not in successors:
-                continue
-
-            if successor_plane_id in predecessors:
-                continue
-
-            predecessors.append(successor_plane_id)
+        if parametric_lane_id not in self._predecessors:
+            return []
 
-        return predecessors
+        return sorted(
+            self._predecessors[parametric_lane_id], key=self._order.__getitem__
+        )
@@ -13,12 +13,97 @@ __email__ = "commonroad-i06@in.tum.de"
 __status__ = "Released"
 
 
+class FresnelTable:
+    """Lookup table of the Fresnel integrals S(x) and C(x) with linear interpolation.
+
+    The integrals are tabulated on a uniform grid on [0, max_argument]
+    and mirrored for negative arguments, as both are odd functions.
+    The grid step is chosen so that the interpolation error of S and C
+    is below max_error. Arguments outside of the table are evaluated
+    with scipy.special.fresnel.
+
+    Note that an EulerSpiral scales the integrals by sqrt(pi / |gamma|),
+    so the error of a calculated position can be larger than max_error.
+    The table pays off for large batches of arguments, for a few
+    arguments scipy is faster.
+
+    Attributes:
+      max_error (float): Maximal absolute interpolation error of S and C.
+      max_argument (float): Largest absolute argument in the table.
+    """
+
+    def __init__(self, max_error: float = 1e-9, max_argument: float = 8.0):
+        if max_error <= 0 or max_argument <= 0:
+            raise ValueError("max_error and max_argument have to be positive.")
+
+        self.max_error = max_error
+        self.max_argument = max_argument
+
+        # error of linear interpolation is h^2 / 8 * max|f''|
+        # and |S''(x)|, |C''(x)| <= pi * x
+        step = np.sqrt(8 * max_error / (np.pi * max_argument))
+        num_steps = int(np.ceil(max_argument / step))
+        self._step = max_argument / num_steps
+        self._S, self._C = special.fresnel(np.linspace(0, max_argument, num_steps + 1))
+        self._dS = np.diff(self._S)
+        self._dC = np.diff(self._C)
+
+    def __call__(self, x):
+        """Evaluate the Fresnel integrals.
+
+        Args:
+          x: Scalar or array of arguments.
+
+        Returns:
+          Tuple (S, C) with the same shape as x.
+        """
+        x = np.asarray(x, dtype=float)
+        shape = x.shape
+        x = x.ravel()
+
+        # fmin also maps nan to max_argument, these are evaluated by scipy below
+        position = np.fmin(np.abs(x), self.max_argument) / self._step
+        idx = position.astype(np.intp)
+        np.minimum(idx, self._dS.size - 1, out=idx)
+        weight = position - idx
+
+        # both integrals are odd functions
+        S = np.copysign(self._S[idx] + weight * self._dS[idx], x)
+        C = np.copysign(self._C[idx] + weight * self._dC[idx], x)
+
+        outside = ~(np.abs(x) < self.max_argument)
+        if np.any(outside):
+            S[outside], C[outside] = special.fresnel(x[outside])
+
+        return S.reshape(shape), C.reshape(shape)
+
+
 class EulerSpiral:
     """ """
 
+    # function which evaluates the Fresnel integrals, see use_fresnel_table
+    _fresnel = staticmethod(special.fresnel)
+
     def __init__(self, gamma):
         self._gamma = gamma
 
+    @classmethod
+    def use_fresnel_table(cls, fresnel_table: FresnelTable = None):
+        """Evaluate the Fresnel integrals of all EulerSpirals with a lookup table.
+
+        This is faster than the exact evaluation, with an error bounded by
+        the max_error of the table.
+
+        Args:
+          fresnel_table: Lookup table to use. If None, the Fresnel integrals
+            are evaluated exactly with scipy. (Default value = None)
+
+        """
+        if fresnel_table is None:
+            cls._fresnel = staticmethod(special.fresnel)
+        else:
+            cls._fresnel = fresnel_table
+
     @staticmethod
     def createFromLengthAndCurvature(length, curvStart, curvEnd):
         """Create an EulerSpiral from a given length with curveStart
@@ -40,16 +125,17 @@ class EulerSpiral:
         return EulerSpiral(1 * (curvEnd - curvStart) / length)
 
     def calc(self, s, x0=0, y0=0, kappa0=0, theta0=0):
-        """
+        """Calculate positions and tangents on the spiral.
 
         Args:
-          s: 
+          s: Position or array of positions on the spiral.
           x0:  (Default value = 0)
           y0:  (Default value = 0)
           kappa0:  (Default value = 0)
           theta0:  (Default value = 0)
 
         Returns:
+          Tuple (x, y, theta), each with the same shape as s.
 
         """
 
@@ -58,7 +144,7 @@ class EulerSpiral:
 
         if self._gamma == 0 and kappa0 == 0:
             # Straight line
-            Cs = C0 + np.exp(1j * theta0 * s)
+            Cs = C0 + np.exp(1j * theta0) * s
 
         elif self._gamma == 0 and kappa0 != 0:
             # Arc
@@ -76,10 +162,17 @@ class EulerSpiral:
         return (Cs.real, Cs.imag, theta)
 
     def _calc_fresnel_integral(self, s, kappa0, theta0, C0):
-        Sa, Ca = special.fresnel(
-            (kappa0 + self._gamma * s) / np.sqrt(np.pi * np.abs(self._gamma))
+        scale = np.sqrt(np.pi * np.abs(self._gamma))
+
+        # evaluate the integrals at s and at the start of the spiral with one call
+        s = np.asarray(s, dtype=float)
+        S, C = self._fresnel(
+            np.append((kappa0 + self._gamma * s.ravel()) / scale, kappa0 / scale)
         )
-        Sb, Cb = special.fresnel(kappa0 / np.sqrt(np.pi * np.abs(self._gamma)))
+        Sa = S[:-1].reshape(s.shape)
+        Ca = C[:-1].reshape(s.shape)
+        Sb = S[-1]
+        Cb = C[-1]
 
         # Euler Spiral
         Cs1 = np.sqrt(np.pi / np.abs(self._gamma)) * np.exp(
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
 import abc
+from typing import Tuple
+
 import numpy as np
 from opendrive2lanelet.opendriveparser.elements.eulerspiral import EulerSpiral
 
@@ -60,6 +62,52 @@ class Geometry(abc.ABC):
         """
         return
 
+    def calc_positions(self, s_positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate positions and tangents at several positions on the geometry.
+
+        Subclasses evaluate all positions in one vectorized pass, this default
+        implementation falls back to calc_position for each position.
+
+        Args:
+          s_positions: Array of shape (n,) with positions on the geometry in ds.
+
+        Returns:
+          Array of shape (n, 2) with positions (x,y) in cartesian coordinates.
+          Array of shape (n,) with angles in radians at the positions.
+        """
+        s_positions = np.asarray(s_positions, dtype=float)
+        positions = np.empty((s_positions.size, 2))
+        tangents = np.empty(s_positions.size)
+        for i, s_pos in enumerate(s_positions):
+            positions[i], tangents[i] = self.calc_position(s_pos)
+
+        return positions, tangents
+
+    @property
+    def max_curvature(self) -> float:
+        """Estimate the maximal absolute curvature of the geometry.
+
+        The curvature is estimated from the second differences of positions
+        every 0.5 m, i.e. as the second derivative of the position by s.
+        This is the curvature if the length of the geometry is its arc length,
+        and otherwise still bounds the deviation of chords between positions
+        in ds. Subclasses with a known curvature override this.
+
+        Returns:
+          Maximal absolute curvature in 1/m.
+        """
+        if self.length <= 0:
+            return 0.0
+
+        num_steps = int(max(16, np.ceil(self.length / 0.5)))
+        positions, _ = self.calc_positions(np.linspace(0, self.length, num_steps + 1))
+        second_differences = np.diff(positions, n=2, axis=0)
+
+        return float(
+            np.max(np.linalg.norm(second_differences, axis=1))
+            / (self.length / num_steps) ** 2
+        )
+
 
 class Line(Geometry):
     """This record describes a straight line as part of the road’s reference line.
@@ -84,6 +132,19 @@ class Line(Geometry):
 
         return (pos, tangent)
 
+    def calc_positions(self, s_positions):
+        s_positions = np.asarray(s_positions, dtype=float)
+        positions = self.start_position + np.column_stack(
+            (s_positions * np.cos(self.heading), s_positions * np.sin(self.heading))
+        )
+        tangents = np.full(s_positions.shape, self.heading, dtype=float)
+
+        return positions, tangents
+
+    @property
+    def max_curvature(self) -> float:
+        return 0.0
+
 
 class Arc(Geometry):
     """This record describes an arc as part of the road’s reference line.
@@ -119,6 +180,25 @@ class Arc(Geometry):
 
         return (pos, tangent)
 
+    def calc_positions(self, s_positions):
+        s_positions = np.asarray(s_positions, dtype=float)
+        c = self.curvature
+        hdg = self.heading - np.pi / 2
+
+        a = 2 / c * np.sin(s_positions * c / 2)
+        alpha = (np.pi - s_positions * c) / 2 - hdg
+
+        positions = self.start_position + np.column_stack(
+            (-1 * a * np.cos(alpha), a * np.sin(alpha))
+        )
+        tangents = self.heading + s_positions * self.curvature
+
+        return positions, tangents
+
+    @property
+    def max_curvature(self) -> float:
+        return abs(self.curvature)
+
 
 class Spiral(Geometry):
     """This record describes a spiral as part of the road’s reference line.
@@ -157,6 +237,22 @@ class Spiral(Geometry):
 
         return (np.array([x, y]), t)
 
+    def calc_positions(self, s_positions):
+        (x, y, t) = self._spiral.calc(
+            np.asarray(s_positions, dtype=float),
+            self.start_position[0],
+            self.start_position[1],
+            self._curvStart,
+            self.heading,
+        )
+
+        return np.column_stack((x, y)), t
+
+    @property
+    def max_curvature(self) -> float:
+        # curvature changes linearly, so it is maximal at one of the ends
+        return max(abs(self._curvStart), abs(self._curvEnd))
+
 
 class Poly3(Geometry):
     """This record describes a cubic polynomial as part of the road’s reference line.
@@ -200,6 +296,25 @@ class Poly3(Geometry):
 
         return (self.start_position + np.array([srot, trot]), self.heading + tangent)
 
+    def calc_positions(self, s_positions):
+        s_positions = np.asarray(s_positions, dtype=float)
+        coeffs = [self._a, self._b, self._c, self._d]
+
+        t = np.polynomial.polynomial.polyval(s_positions, coeffs)
+
+        # Rotate and translate
+        srot = s_positions * np.cos(self.heading) - t * np.sin(self.heading)
+        trot = s_positions * np.sin(self.heading) + t * np.cos(self.heading)
+
+        # Derivate to get heading change
+        dCoeffs = coeffs[1:] * np.array(np.arange(1, len(coeffs)))
+        tangents = np.polynomial.polynomial.polyval(s_positions, dCoeffs)
+
+        return (
+            self.start_position + np.column_stack((srot, trot)),
+            self.heading + tangents,
+        )
+
 
 class ParamPoly3(Geometry):
     """This record describes a parametric cubic curve as part
@@ -262,3 +377,29 @@ class ParamPoly3(Geometry):
         tangent = np.arctan2(dy, dx)
 
         return (self.start_position + np.array([xrot, yrot]), self.heading + tangent)
+
+    def calc_positions(self, s_positions):
+        pos = (np.asarray(s_positions, dtype=float) / self.length) * self._pRange
+
+        coeffsU = [self._aU, self._bU, self._cU, self._dU]
+        coeffsV = [self._aV, self._bV, self._cV, self._dV]
+
+        x = np.polynomial.polynomial.polyval(pos, coeffsU)
+        y = np.polynomial.polynomial.polyval(pos, coeffsV)
+
+        xrot = x * np.cos(self.heading) - y * np.sin(self.heading)
+        yrot = x * np.sin(self.heading) + y * np.cos(self.heading)
+
+        # Tangent is defined by derivation
+        dCoeffsU = coeffsU[1:] * np.array(np.arange(1, len(coeffsU)))
+        dCoeffsV = coeffsV[1:] * np.array(np.arange(1, len(coeffsV)))
+
+        dx = np.polynomial.polynomial.polyval(pos, dCoeffsU)
+        dy = np.polynomial.polynomial.polyval(pos, dCoeffsV)
+
+        tangents = np.arctan2(dy, dx)
+
+        return (
+            self.start_position + np.column_stack((xrot, yrot)),
+            self.heading + tangents,
+        )
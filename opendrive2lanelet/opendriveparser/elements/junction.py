@@ -15,6 +15,8 @@ class Junction:
     # TODO priority
     # TODO controller
 
+    __slots__ = ("_id", "_name", "_connections")
+
     def __init__(self):
         self._id = None
         self._name = None
@@ -77,6 +79,14 @@ class Junction:
 class Connection:
     """ """
 
+    __slots__ = (
+        "_id",
+        "_incomingRoad",
+        "_connectingRoad",
+        "_contactPoint",
+        "_laneLinks",
+    )
+
     def __init__(self):
         self._id = None
         self._incomingRoad = None
@@ -178,6 +188,8 @@ class Connection:
 class LaneLink:
     """ """
 
+    __slots__ = ("_from", "_to")
+
     def __init__(self):
         self._from = None
         self._to = None
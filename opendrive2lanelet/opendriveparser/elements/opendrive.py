@@ -9,14 +9,98 @@ __email__ = "commonroad-i06@in.tum.de"
 __status__ = "Released"
 
 
+class IdIndexedList(list):
+    """List of roads or junctions, which can look up its elements by their id.
+
+    The id index is built at the first lookup. Appending to the list extends it,
+    every other modification of the list drops it, so a lookup always finds the
+    first element with an id, as a linear search would. Changing the id of an
+    element in the list is not noticed.
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._index = None
+
+    def __reduce_ex__(self, protocol):
+        # the index is not pickled, but rebuilt at the first lookup
+        return self.__class__, (list(self),)
+
+    def get_by_id(self, id_):
+        """Get the first element with an id.
+
+        Args:
+          id_: Id of the element.
+
+        Returns:
+          The element or None, if there is no element with this id.
+
+        """
+        if self._index is None:
+            self._index = {}
+            for element in self:
+                self._index.setdefault(element.id, element)
+
+        return self._index.get(id_)
+
+    def append(self, element):
+        super().append(element)
+        if self._index is not None:
+            self._index.setdefault(element.id, element)
+
+    def __setitem__(self, key, value):
+        self._index = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._index = None
+        super().__delitem__(key)
+
+    def __iadd__(self, other):
+        self._index = None
+        return super().__iadd__(other)
+
+    def __imul__(self, other):
+        self._index = None
+        return super().__imul__(other)
+
+    def extend(self, elements):
+        self._index = None
+        super().extend(elements)
+
+    def insert(self, position, element):
+        self._index = None
+        super().insert(position, element)
+
+    def remove(self, element):
+        self._index = None
+        super().remove(element)
+
+    def pop(self, *args):
+        self._index = None
+        return super().pop(*args)
+
+    def clear(self):
+        self._index = None
+        super().clear()
+
+    def sort(self, *args, **kwargs):
+        self._index = None
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self._index = None
+        super().reverse()
+
+
 class OpenDrive:
     """ """
 
     def __init__(self):
         self.header = None
-        self._roads = []
+        self._roads = IdIndexedList()
         self._controllers = []
-        self._junctions = []
+        self._junctions = IdIndexedList()
         self._junctionGroups = []
         self._stations = []
 
@@ -29,20 +113,26 @@ class OpenDrive:
         """ """
         return self._roads
 
-    def getRoad(self, id_):
+    def addRoad(self, road):
+        """Append a road.
+
+        Args:
+          road: Road to be added.
+
         """
+        self._roads.append(road)
+
+    def getRoad(self, id_):
+        """Get the first road with an id.
 
         Args:
-          id_:
+          id_: Id of the road.
 
         Returns:
+          The road or None, if there is no road with this id.
 
         """
-        for road in self._roads:
-            if road.id == id_:
-                return road
-
-        return None
+        return self._roads.get_by_id(id_)
 
     @property
     def controllers(self):
@@ -54,19 +144,26 @@ class OpenDrive:
         """ """
         return self._junctions
 
-    def getJunction(self, junctionId):
+    def addJunction(self, junction):
+        """Append a junction.
+
+        Args:
+          junction: Junction to be added.
+
         """
+        self._junctions.append(junction)
+
+    def getJunction(self, junctionId):
+        """Get the first junction with an id.
 
         Args:
-          junctionId:
+          junctionId: Id of the junction.
 
         Returns:
+          The junction or None, if there is no junction with this id.
 
         """
-        for junction in self._junctions:
-            if junction.id == junctionId:
-                return junction
-        return None
+        return self._junctions.get_by_id(junctionId)
 
     @property
     def junctionGroups(self):
@@ -13,6 +13,20 @@ from opendrive2lanelet.opendriveparser.elements.junction import Junction
 class Road:
     """ """
 
+    __slots__ = (
+        "_id",
+        "_name",
+        "_junction",
+        "_length",
+        "_header",
+        "_link",
+        "_types",
+        "_planView",
+        "_elevationProfile",
+        "_lateralProfile",
+        "_lanes",
+    )
+
     def __init__(self):
         self._id = None
         self._name = None
@@ -28,7 +42,9 @@ class Road:
         self._lanes = Lanes()
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, slot) == getattr(other, slot) for slot in self.__slots__
+        )
 
     @property
     def id(self):
@@ -64,6 +80,21 @@ class Road:
         """
         self._name = str(value)
 
+    @property
+    def length(self):
+        """Length of the road along its reference line."""
+        return self._length
+
+    @length.setter
+    def length(self, value):
+        """
+
+        Args:
+          value: Length of the road along its reference line.
+
+        """
+        self._length = value
+
     @property
     def junction(self):
         """ """
@@ -19,6 +19,8 @@ class ElevationProfile:
     (Section 5.3.5 of OpenDRIVE 1.4)
     """
 
+    __slots__ = ("elevations",)
+
     def __init__(self):
         self.elevations = []
 
@@ -28,3 +30,5 @@ class ElevationRecord(RoadRecord):
 
     (Section 5.3.5.1 of OpenDRIVE 1.4)
     """
+
+    __slots__ = ()
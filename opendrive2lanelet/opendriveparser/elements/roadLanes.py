@@ -6,6 +6,8 @@ from opendrive2lanelet.opendriveparser.elements.road_record import RoadRecord
 class Lanes:
     """ """
 
+    __slots__ = ("_laneOffsets", "_lane_sections")
+
     def __init__(self):
         self._laneOffsets = []
         self._lane_sections = []
@@ -56,12 +58,16 @@ class LaneOffset(RoadRecord):
 
     """
 
+    __slots__ = ()
+
 
 class LeftLanes:
     """ """
 
     sort_direction = False
 
+    __slots__ = ("_lanes",)
+
     def __init__(self):
         self._lanes = []
 
@@ -75,12 +81,16 @@ class LeftLanes:
 class CenterLanes(LeftLanes):
     """ """
 
+    __slots__ = ()
+
 
 class RightLanes(LeftLanes):
     """ """
 
     sort_direction = True
 
+    __slots__ = ()
+
 
 class Lane:
     """ """
@@ -109,6 +119,18 @@ class Lane:
         "onRamp",
     ]
 
+    __slots__ = (
+        "_parent_road",
+        "_id",
+        "_type",
+        "_level",
+        "_link",
+        "_widths",
+        "_borders",
+        "lane_section",
+        "has_border_record",
+    )
+
     def __init__(self, parentRoad, lane_section):
         self._parent_road = parentRoad
         self._id = None
@@ -208,6 +230,8 @@ class Lane:
 class LaneLink:
     """ """
 
+    __slots__ = ("_predecessor", "_successor")
+
     def __init__(self):
         self._predecessor = None
         self._successor = None
@@ -238,9 +262,21 @@ class LaneSection:
 
     """
 
+    __slots__ = (
+        "idx",
+        "sPos",
+        "length",
+        "_singleSide",
+        "_leftLanes",
+        "_centerLanes",
+        "_rightLanes",
+        "_parentRoad",
+    )
+
     def __init__(self, road=None):
         self.idx = None
         self.sPos = None
+        self.length = None
         self._singleSide = None
         self._leftLanes = LeftLanes()
         self._centerLanes = CenterLanes()
@@ -310,6 +346,8 @@ class LaneWidth(RoadRecord):
 
 """
 
+    __slots__ = ("idx", "length")
+
     def __init__(
         self,
         *polynomial_coefficients: float,
@@ -343,3 +381,5 @@ class LaneBorder(LaneWidth):
     the outer border of each lane
     independent of any inner lanes’ parameters.
     """
+
+    __slots__ = ()
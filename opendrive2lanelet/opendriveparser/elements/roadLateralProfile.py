@@ -19,6 +19,8 @@ class LateralProfile:
     (Section 5.3.6 of OpenDRIVE 1.4)
     """
 
+    __slots__ = ("_superelevations", "_crossfalls", "_shapes")
+
     def __init__(self):
         self._superelevations = []
         self._crossfalls = []
@@ -72,6 +74,8 @@ class Superelevation(RoadRecord):
     (Section 5.3.6.1 of OpenDRIVE 1.4)
     """
 
+    __slots__ = ()
+
 
 class Crossfall(RoadRecord):
     """The crossfall of the road is defined as the road
@@ -80,6 +84,8 @@ class Crossfall(RoadRecord):
     (Section 5.3.6.2 of OpenDRIVE 1.4)
     """
 
+    __slots__ = ("_side",)
+
     def __init__(
         self, *polynomial_coefficients: float, start_pos: float = None, side: str = None
     ):
@@ -130,6 +136,8 @@ class Shape(RoadRecord):
 
     """
 
+    __slots__ = ("start_pos_t",)
+
     def __init__(
         self,
         *polynomial_coefficients: float,
@@ -14,6 +14,8 @@ __status__ = "Released"
 class Link:
     """"""
 
+    __slots__ = ("_id", "_predecessor", "_successor", "_neighbors")
+
     def __init__(self, link_id=None, predecessor=None, successor=None, neighbors=None):
         self.id_ = link_id
         self.predecessor = predecessor
@@ -124,6 +126,8 @@ class Link:
 class Predecessor:
     """ """
 
+    __slots__ = ("_elementType", "_elementId", "_contactPoint")
+
     def __init__(self, element_type=None, element_id=None, contact_point=None):
         self.elementType = element_type
         self.element_id = element_id
@@ -202,10 +206,14 @@ class Predecessor:
 class Successor(Predecessor):
     """ """
 
+    __slots__ = ()
+
 
 class Neighbor:
     """ """
 
+    __slots__ = ("_side", "_elementId", "_direction")
+
     def __init__(self, side=None, element_id=None, direction=None):
         self._side = side
         self._elementId = element_id
@@ -171,48 +171,80 @@ class PlanView:
         # self.normal_time += end - start
         return result_pos, result_tang
 
-    def interpolate_cached_values(self, s_pos: float) -> Tuple[np.ndarray, float]:
+    def calc_many(self, s_positions) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate positions and tangents at several positions at once.
+
+        Like calc, the values are interpolated if the plan view is precalculated
+        and calculated by the geometries otherwise.
+
+        Args:
+          s_positions: Array of positions on PlanView in ds.
+
+        Returns:
+          Array of shape (N, 2) with the positions (x,y) in cartesian coordinates.
+          Array of shape (N,) with the angles in radians at the positions.
+        """
+        s_positions = np.asarray(s_positions, dtype=float).ravel()
+
+        if self._precalculation is not None:
+            return self.interpolate_cached_values(s_positions)
+
+        return self.calc_geometry(s_positions)
+
+    def interpolate_cached_values(self, s_pos) -> Tuple[np.ndarray, float]:
         """Calc position and tangent at s_pos by interpolating values
         in _precalculation array.
 
         Args:
-          s_pos: Position on PlanView in ds.
+          s_pos: Position or array of positions on PlanView in ds.
 
         Returns:
-          Position (x,y) in cartesion coordinates.
-          Angle in radians at position s_pos.
+          Position (x,y) in cartesion coordinates, or array of shape (N, 2) for
+          an array of positions.
+          Angle in radians at position s_pos, or array of shape (N,).
 
         """
-        # start = time.time()
-        # we need idx for angle interpolation
-        # so idx can be used anyway in the other np.interp function calls
-        idx = np.abs(self._precalculation[:, 0] - s_pos).argmin()
-        if s_pos - self._precalculation[idx, 0] < 0 or idx + 1 == len(
-            self._precalculation
-        ):
-            idx -= 1
-        result_pos_x = np.interp(
-            s_pos,
-            self._precalculation[idx : idx + 2, 0],
-            self._precalculation[idx : idx + 2, 1],
-        )
-        result_pos_y = np.interp(
-            s_pos,
-            self._precalculation[idx : idx + 2, 0],
-            self._precalculation[idx : idx + 2, 2],
-        )
-        result_tang = self.interpolate_angle(idx, s_pos)
-        result_pos = np.array((result_pos_x, result_pos_y))
-        # end = time.time()
-        # self.cache_time += end - start
+        if np.ndim(s_pos) == 0:
+            idx = self._get_precalculation_indices(s_pos)
+            pos_prev, x_prev, y_prev = self._precalculation[idx, :3]
+            pos_next, x_next, y_next = self._precalculation[idx + 1, :3]
+
+            # positions are not extrapolated beyond the precalculated values
+            s_clipped = min(max(s_pos, pos_prev), pos_next)
+            result_pos = np.array(
+                (
+                    (x_next - x_prev) / (pos_next - pos_prev) * (s_clipped - pos_prev)
+                    + x_prev,
+                    (y_next - y_prev) / (pos_next - pos_prev) * (s_clipped - pos_prev)
+                    + y_prev,
+                )
+            )
+            return result_pos, self.interpolate_angle(idx, s_pos)
+
+        s_positions = np.asarray(s_pos, dtype=float)
+        idx = self._get_precalculation_indices(s_positions)
+        pos_prev = self._precalculation[idx, 0]
+        pos_next = self._precalculation[idx + 1, 0]
+
+        # positions are not extrapolated beyond the precalculated values
+        s_clipped = np.clip(s_positions, pos_prev, pos_next)
+        result_pos = np.empty((s_positions.size, 2))
+        for column in (1, 2):
+            value_prev = self._precalculation[idx, column]
+            slope = (self._precalculation[idx + 1, column] - value_prev) / (
+                pos_next - pos_prev
+            )
+            result_pos[:, column - 1] = slope * (s_clipped - pos_prev) + value_prev
+        result_tang = self.interpolate_angle(idx, s_positions)
+
         return result_pos, result_tang
 
-    def interpolate_angle(self, idx: int, s_pos: float) -> float:
+    def interpolate_angle(self, idx, s_pos):
         """Interpolate two angular values using the shortest angle between both values.
 
         Args:
-          idx: Index where values in _precalculation should be accessed.
-          s_pos: Position at which interpolated angle should be calculated.
+          idx: Index or array of indices where values in _precalculation should be accessed.
+          s_pos: Position or array of positions at which interpolated angle should be calculated.
 
         Returns:
           Interpolated angle in radians.
@@ -226,43 +258,108 @@ class PlanView:
         shortest_angle = ((angle_next - angle_prev) + np.pi) % (2 * np.pi) - np.pi
         return angle_prev + shortest_angle * (s_pos - pos_prev) / (pos_next - pos_prev)
 
-    def calc_geometry(self, s_pos: float) -> Tuple[np.ndarray, float]:
+    def _get_precalculation_indices(self, s_positions):
+        """Get the indices of the precalculated values to interpolate between.
+
+        Each position lies between the values at the returned index and the next one.
+        Positions outside of the precalculated range use the first or last interval.
+
+        Args:
+          s_positions: Position or array of positions on PlanView in ds.
+
+        Returns:
+          Index or array with the index of the interval at each position.
+
+        """
+        idx = np.searchsorted(self._precalculation[:, 0], s_positions, side="right") - 1
+        return np.clip(idx, 0, len(self._precalculation) - 2)
+
+    def calc_geometry(self, s_pos) -> Tuple[np.ndarray, float]:
         """Calc position and tangent at s_pos by delegating calculation to geometry.
 
         Args:
-          s_pos: Position on PlanView in ds.
+          s_pos: Position or array of positions on PlanView in ds.
 
         Returns:
-          Position (x,y) in cartesion coordinates.
-          Angle in radians at position s_pos.
+          Position (x,y) in cartesion coordinates, or array of shape (N, 2) for
+          an array of positions.
+          Angle in radians at position s_pos, or array of shape (N,).
 
         """
-        try:
-            # get index of geometry which is at s_pos
-            mask = self._geo_lengths > s_pos
-            sub_idx = np.argmin(self._geo_lengths[mask] - s_pos)
-            geo_idx = np.arange(self._geo_lengths.shape[0])[mask][sub_idx] - 1
-        except ValueError:
-            # s_pos is after last geometry because of rounding error
-            if np.isclose(s_pos, self._geo_lengths[-1]):
-                geo_idx = self._geo_lengths.size - 2
-            else:
+        if np.ndim(s_pos) == 0:
+            # geo_idx is index which geometry to use
+            geo_idx = self._get_geometry_indices(s_pos)
+            return self._geometries[geo_idx].calc_position(
+                s_pos - self._geo_lengths[geo_idx]
+            )
+
+        s_positions = np.asarray(s_pos, dtype=float)
+        result_pos = np.empty((s_positions.size, 2))
+        result_tang = np.empty(s_positions.size)
+        if s_positions.size == 0:
+            return result_pos, result_tang
+        geo_indices = self._get_geometry_indices(s_positions)
+
+        # evaluate each geometry once for all of its positions
+        order = np.argsort(geo_indices, kind="stable")
+        sorted_indices = geo_indices[order]
+        bounds = np.concatenate(
+            ([0], np.flatnonzero(np.diff(sorted_indices)) + 1, [order.size])
+        )
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            geo_idx = sorted_indices[start]
+            selection = order[start:end]
+            coords, tangs = self._geometries[geo_idx].calc_positions(
+                s_positions[selection] - self._geo_lengths[geo_idx]
+            )
+            result_pos[selection] = coords
+            result_tang[selection] = tangs
+
+        return result_pos, result_tang
+
+    def _get_geometry_indices(self, s_positions: np.ndarray) -> np.ndarray:
+        """Get the indices of the geometries at one or several positions.
+
+        Positions at the end of a geometry belong to the following one.
+
+        Args:
+          s_positions: Position or array of positions on PlanView in ds.
+
+        Returns:
+          Index or array with the index of the geometry at each position.
+
+        """
+        geo_indices = np.searchsorted(self._geo_lengths, s_positions, side="right") - 1
+
+        # s_pos is after last geometry because of rounding error
+        after_last = geo_indices >= self._geo_lengths.size - 1
+        if np.ndim(geo_indices) == 0:
+            if after_last:
+                if not np.isclose(s_positions, self._geo_lengths[-1]):
+                    raise Exception(
+                        f"Tried to calculate a position outside of the borders of the reference path at "
+                        f"s={s_positions}, but path has only length of l={self._geo_lengths[-1]}"
+                    )
+                geo_indices = self._geo_lengths.size - 2
+        elif np.any(after_last):
+            if not np.all(np.isclose(s_positions[after_last], self._geo_lengths[-1])):
                 raise Exception(
-                    f"Tried to calculate a position outside of the borders of the reference path at s={s_pos}"
-                    f", but path has only length of l={ self._geo_lengths[-1]}"
+                    f"Tried to calculate a position outside of the borders of the reference path at "
+                    f"s={np.max(s_positions)}, but path has only length of l={self._geo_lengths[-1]}"
                 )
+            geo_indices[after_last] = self._geo_lengths.size - 2
 
-        # geo_idx is index which geometry to use
-        return self._geometries[geo_idx].calc_position(
-            s_pos - self._geo_lengths[geo_idx]
-        )
+        return geo_indices
 
-    def precalculate(self, precision: float = 0.5):
+    def precalculate(self, precision: float = 0.5, max_chord_error: float = None):
         """Precalculate coordinates of planView to save computing resources and time.
         Save result in _precalculation array.
 
         Args:
           precision: Precision with which to calculate points on the line
+          max_chord_error: If given, sample each geometry adaptively instead, so that
+            the chords between the points deviate at most this distance from the
+            geometry. Lines are then only sampled at their ends. (Default value = None)
 
         """
         # start = time.time()
@@ -271,11 +368,54 @@ class PlanView:
         if self.should_precalculate < 1:
             return
 
-        num_steps = int(max(2, np.ceil(self.length / precision)))
-        positions = np.linspace(0, self.length, num_steps)
+        if max_chord_error is None:
+            num_steps = int(max(2, np.ceil(self.length / precision)))
+            positions = np.linspace(0, self.length, num_steps)
+        else:
+            positions = self._calc_adaptive_positions(max_chord_error)
+            num_steps = positions.size
         self._precalculation = np.empty([num_steps, 4])
-        for i, pos in enumerate(positions):
-            coord, tang = self.calc_geometry(pos)
-            self._precalculation[i] = (pos, coord[0], coord[1], tang)
+        self._precalculation[:, 0] = positions
+        self._precalculation[:, 1:3], self._precalculation[:, 3] = self.calc_geometry(
+            positions
+        )
         # end = time.time()
         # self.cache_time += end - start
+
+    def _calc_adaptive_positions(self, max_chord_error: float) -> np.ndarray:
+        """Determine positions on the PlanView whose chords deviate at most
+        max_chord_error from the geometries.
+
+        A chord of length h on a curve with curvature k deviates about
+        k * h^2 / 8 from the curve, so each geometry is sampled with
+        the step which reaches max_chord_error at its maximal curvature.
+
+        Args:
+          max_chord_error: Maximal distance between a chord and the geometry.
+
+        Returns:
+          Array with the ordered positions, including start and end of the PlanView.
+
+        """
+        if max_chord_error <= 0:
+            raise ValueError("max_chord_error has to be positive.")
+
+        positions = [self._geo_lengths[:1]]
+        for geometry, geo_start in zip(self._geometries, self._geo_lengths[:-1]):
+            num_steps = int(
+                max(
+                    1,
+                    np.ceil(
+                        geometry.length
+                        * np.sqrt(geometry.max_curvature / (8 * max_chord_error))
+                    ),
+                )
+            )
+            positions.append(
+                geo_start + np.linspace(0, geometry.length, num_steps + 1)[1:]
+            )
+        positions = np.unique(np.concatenate(positions))
+
+        if positions.size < 2:
+            return np.linspace(0, self.length, 2)
+        return positions
@@ -35,8 +35,10 @@ class RoadRecord(ABC):
         polynomial function.
     """
 
+    # Large maps have millions of records, so they do not have an instance __dict__.
+    # Subclasses have to declare __slots__ as well, at least an empty one.
+    __slots__ = ("start_pos", "polynomial_coefficients")
+
     def __init__(self, *polynomial_coefficients: float, start_pos: float = None):
         self.start_pos = start_pos
-        self.polynomial_coefficients = []
-        for coeff in polynomial_coefficients:
-            self.polynomial_coefficients.append(coeff)
+        self.polynomial_coefficients = list(polynomial_coefficients)
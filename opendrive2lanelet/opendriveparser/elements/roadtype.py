@@ -14,6 +14,8 @@ class RoadType:
         "bicycle",
     ]
 
+    __slots__ = ("_sPos", "_use_type", "_speed")
+
     def __init__(self, s_pos=None, use_type=None, speed=None):
         self.start_pos = s_pos
         self.use_type = use_type
@@ -81,6 +83,8 @@ class RoadType:
 class Speed:
     """ """
 
+    __slots__ = ("_max", "_unit")
+
     def __init__(self, max_speed=None, unit=None):
         self._max = max_speed
         self._unit = unit
@@ -1,5 +1,11 @@
 # -*- coding: utf-8 -*-
 
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Set, Tuple, Union
+
 import numpy as np
 from lxml import etree
 from opendrive2lanelet.opendriveparser.elements.opendrive import OpenDrive, Header
@@ -33,6 +39,7 @@ from opendrive2lanelet.opendriveparser.elements.junction import (
     Connection as JunctionConnection,
     LaneLink as JunctionConnectionLaneLink,
 )
+from opendrive2lanelet.opendriveparser.region import Region, RoadOutline
 
 __author__ = "Benjamin Orthen, Stefan Urban"
 __copyright__ = "TUM Cyber-Physical Systems Group"
@@ -42,12 +49,21 @@ __maintainer__ = "Benjamin Orthen"
 __email__ = "commonroad-i06@in.tum.de"
 __status__ = "Released"
 
+# number of roads which are sent at once to a worker process when parsing in parallel
+PARALLEL_CHUNK_SIZE = 32
+
 
-def parse_opendrive(root_node) -> OpenDrive:
+def parse_opendrive(
+    root_node, num_processes: int = 1, region: Region = None
+) -> OpenDrive:
     """Tries to parse XML tree, returns OpenDRIVE object
 
     Args:
       root_node:
+      num_processes: Number of processes which parse the roads.
+        If greater than one, the roads are parsed in a process pool. (Default value = 1)
+      region: If given, only the roads which are needed to convert this region
+        are parsed, see :meth:`Region.select_roads`. (Default value = None)
 
     Returns:
       The object representing an OpenDrive specification.
@@ -69,48 +85,421 @@ def parse_opendrive(root_node) -> OpenDrive:
     for junction in root_node.findall("junction"):
         parse_opendrive_junction(opendrive, junction)
 
+    roads = root_node.findall("road")
+
+    if region is not None:
+        selected_roads = region.select_roads(
+            (get_road_outline(road) for road in roads),
+            dict(
+                get_junction_connecting_roads(junction)
+                for junction in root_node.iterchildren("junction")
+            ),
+        )
+        roads = [road for road in roads if int(road.get("id")) in selected_roads]
+
     # Load roads
-    for road in root_node.findall("road"):
-        parse_opendrive_road(opendrive, road)
+    if num_processes > 1:
+        for newRoad, junctionId in parse_road_records_in_parallel(
+            (etree.tostring(road) for road in roads), num_processes
+        ):
+            if junctionId:
+                newRoad.junction = opendrive.getJunction(junctionId)
+            opendrive.addRoad(newRoad)
+    else:
+        for road in roads:
+            parse_opendrive_road(opendrive, road)
 
     return opendrive
 
 
-def parse_opendrive_road_link(newRoad, opendrive_road_link):
+def parse_road_records_in_parallel(
+    serialized_roads: Iterable[bytes], num_processes: int
+) -> Iterator[Tuple[Road, int]]:
+    """Parse serialized road elements in a process pool.
+
+    The roads are sent in chunks to the worker processes, which return
+    picklable road records. As junctions are not known to the workers,
+    each road is returned together with the id of its junction and
+    the junction has to be set by the caller.
+
+    Args:
+      serialized_roads: XML strings of the road elements.
+      num_processes: Number of worker processes.
+
+    Yields:
+      Tuples (road, junction_id) in the order of serialized_roads.
+      junction_id is None if the road does not belong to a junction.
+
     """
+    serialized_roads = iter(serialized_roads)
+    with ProcessPoolExecutor(max_workers=num_processes) as executor:
+        # limit the number of chunks in flight, so a fast reader
+        # does not pile up serialized roads in memory
+        pending = deque()
+        while True:
+            chunk = list(islice(serialized_roads, PARALLEL_CHUNK_SIZE))
+            if chunk:
+                pending.append(executor.submit(_parse_road_records, chunk))
+            if pending and (not chunk or len(pending) > 2 * num_processes):
+                yield from pending.popleft().result()
+            elif not chunk:
+                break
+
+
+def _parse_road_records(serialized_roads: List[bytes]) -> List[Tuple[Road, int]]:
+    """Parse a chunk of serialized road elements. Executed in a worker process.
 
     Args:
-      newRoad:
-      opendrive_road_link:
+      serialized_roads: XML strings of the road elements.
+
+    Returns:
+      List of tuples (road, junction_id).
 
     """
-    predecessor = opendrive_road_link.find("predecessor")
+    records = []
+    for serialized_road in serialized_roads:
+        road = etree.fromstring(serialized_road)
+        records.append((parse_opendrive_road_element(road), _get_road_junction_id(road)))
 
-    if predecessor is not None:
+    return records
 
-        newRoad.link.predecessor = RoadLinkPredecessor(
-            predecessor.get("elementType"),
-            predecessor.get("elementId"),
-            predecessor.get("contactPoint"),
-        )
 
-    successor = opendrive_road_link.find("successor")
+def iterparse_opendrive(
+    source, region: Region = None
+) -> Iterator[Union[Header, Junction, Road]]:
+    """Incrementally parse an OpenDRIVE document and yield its top level elements.
 
-    if successor is not None:
+    The document is read with etree.iterparse instead of building the whole
+    XML tree. Each header, junction and road element is cleared as soon as it
+    has been converted, so peak memory is bounded by the largest single road
+    and not by the size of the file.
 
-        newRoad.link.successor = RoadLinkSuccessor(
-            successor.get("elementType"),
-            successor.get("elementId"),
-            successor.get("contactPoint"),
-        )
+    Roads can reference a junction which comes later in the document.
+    These roads get a Junction object which only has its id set and is
+    completed as soon as the junction element has been parsed.
+
+    If a region is given, the document is read twice: once to select the
+    roads of the region and once to parse them.
+
+    Args:
+      source: Filename or file object of the xodr document.
+        File objects have to be seekable if a region is given.
+      region: If given, only the roads which are needed to convert this region
+        are parsed, see :meth:`Region.select_roads`. (Default value = None)
+
+    Yields:
+      Header, Junction and Road objects in document order.
+
+    """
+    opendrive = OpenDrive()
+    referenced_junctions = {}
+    selected_roads = (
+        _select_roads_of_source(source, region) if region is not None else None
+    )
+
+    for element in _iterparse_top_level_elements(source):
+        if element.tag == "header":
+            parse_opendrive_header(opendrive, element)
+            yield opendrive.header
 
-    for neighbor in opendrive_road_link.findall("neighbor"):
+        elif element.tag == "junction":
+            parse_opendrive_junction(
+                opendrive,
+                element,
+                referenced_junctions.pop(int(element.get("id")), None),
+            )
+            yield opendrive.junctions[-1]
+
+        elif selected_roads is None or int(element.get("id")) in selected_roads:
+            junctionId = _get_road_junction_id(element)
+            junction = None
+            if junctionId:
+                junction = opendrive.getJunction(junctionId)
+                if junction is None:
+                    junction = referenced_junctions.setdefault(junctionId, Junction())
+                    junction.id = junctionId
+
+            yield parse_opendrive_road_element(element, junction)
+
+
+def _iterparse_top_level_elements(source) -> Iterator[etree.ElementBase]:
+    """Incrementally parse the header, junction and road elements of an OpenDRIVE document.
+
+    Each element is cleared after it has been processed by the caller.
+
+    Args:
+      source: Filename or file object of the xodr document.
+
+    Yields:
+      Direct children of the root element with the tags header, junction or road.
+
+    """
+    for _, element in etree.iterparse(
+        source, events=("end",), tag=("header", "junction", "road")
+    ):
+        # only direct children of the root element are of interest
+        parent = element.getparent()
+        if parent is None or parent.getparent() is not None:
+            continue
+
+        yield element
+        _clear_element(element)
 
-        newNeighbor = RoadLinkNeighbor(
-            neighbor.get("side"), neighbor.get("elementId"), neighbor.get("direction")
+
+def _select_roads_of_source(source, region: Region) -> Set[int]:
+    """Select the roads of a region in an OpenDRIVE document and rewind the source.
+
+    Args:
+      source: Filename or file object of the xodr document.
+      region: Region of interest.
+
+    Returns:
+      Ids of the selected roads.
+
+    Raises:
+      ValueError: If the source is a file object which cannot be rewound.
+    """
+    if not _is_rewindable(source):
+        raise ValueError(
+            "A region of interest needs to read the OpenDRIVE document twice, "
+            f"so it cannot be used with a non-seekable source ({type(source).__name__})."
+            " Pass a filename or a seekable file object instead."
         )
 
-        newRoad.link.neighbors.append(newNeighbor)
+    road_outlines = []
+    connecting_roads = {}
+
+    for element in _iterparse_top_level_elements(source):
+        if element.tag == "junction":
+            junction_id, junction_connecting_roads = get_junction_connecting_roads(
+                element
+            )
+            connecting_roads[junction_id] = junction_connecting_roads
+        elif element.tag == "road":
+            road_outlines.append(get_road_outline(element))
+
+    if hasattr(source, "seek"):
+        source.seek(0)
+
+    return region.select_roads(road_outlines, connecting_roads)
+
+
+def _is_rewindable(source) -> bool:
+    """Check if a source of an OpenDRIVE document can be read a second time.
+
+    Args:
+      source: Filename or file object of the xodr document.
+
+    Returns:
+      True if the source is a filename or a seekable file object.
+    """
+    if isinstance(source, (str, bytes, os.PathLike)):
+        return True
+    if hasattr(source, "seekable"):
+        return source.seekable()
+    # e.g. mmap objects before Python 3.13 have no seekable
+    return hasattr(source, "seek")
+
+
+def get_road_outline(road) -> RoadOutline:
+    """Read the links and geometry start points of a road XML element,
+    without parsing the road.
+
+    Args:
+      road: XML element of the road.
+
+    Returns:
+      The outline of the road.
+
+    """
+    linked_roads = []
+    linked_junctions = []
+    start_points = []
+    lengths = []
+
+    for child in road:
+        if child.tag == "link":
+            for link in child:
+                if link.tag not in ("predecessor", "successor"):
+                    continue
+                if link.attrib.get("elementType") == "junction":
+                    linked_junctions.append(int(link.attrib.get("elementId")))
+                else:
+                    linked_roads.append(int(link.attrib.get("elementId")))
+
+        elif child.tag == "planView":
+            for geometry in child:
+                if geometry.tag != "geometry":
+                    continue
+                attrib = geometry.attrib
+                start_points.append((float(attrib.get("x")), float(attrib.get("y"))))
+                lengths.append(float(attrib.get("length")))
+
+    return RoadOutline(
+        road_id=int(road.attrib.get("id")),
+        junction_id=_get_road_junction_id(road),
+        linked_roads=linked_roads,
+        linked_junctions=linked_junctions,
+        start_points=np.array(start_points, dtype=float).reshape(-1, 2),
+        lengths=np.array(lengths, dtype=float),
+    )
+
+
+def get_junction_connecting_roads(junction) -> Tuple[int, List[int]]:
+    """Read the ids of the connecting roads of a junction XML element.
+
+    Args:
+      junction: XML element of the junction.
+
+    Returns:
+      Tuple (junction_id, connecting_road_ids).
+
+    """
+    return (
+        int(junction.attrib.get("id")),
+        [
+            int(connection.attrib.get("connectingRoad"))
+            for connection in junction.iterchildren("connection")
+        ],
+    )
+
+
+def parse_opendrive_stream(
+    source, num_processes: int = 1, region: Region = None
+) -> OpenDrive:
+    """Parse an OpenDRIVE document with :func:`iterparse_opendrive`
+    and collect the results in an OpenDrive object.
+
+    In contrast to :func:`parse_opendrive`, the XML tree of the whole document
+    is never held in memory.
+
+    Args:
+      source: Filename or file object of the xodr document.
+      num_processes: Number of processes which parse the roads.
+        If greater than one, the roads are parsed in a process pool. (Default value = 1)
+      region: If given, only the roads which are needed to convert this region
+        are parsed, see :meth:`Region.select_roads`. (Default value = None)
+
+    Returns:
+      The object representing an OpenDrive specification.
+
+    """
+    if num_processes > 1:
+        return _parse_opendrive_stream_in_parallel(source, num_processes, region)
+
+    opendrive = OpenDrive()
+
+    for element in iterparse_opendrive(source, region):
+        if isinstance(element, Header):
+            opendrive.header = element
+        elif isinstance(element, Junction):
+            opendrive.addJunction(element)
+        else:
+            opendrive.addRoad(element)
+
+    # Junctions which are referenced but never defined are not resolved,
+    # which is the same behaviour as in parse_opendrive
+    parsed_junctions = {id(junction) for junction in opendrive.junctions}
+    for road in opendrive.roads:
+        if road.junction is not None and id(road.junction) not in parsed_junctions:
+            road.junction = None
+
+    return opendrive
+
+
+def _parse_opendrive_stream_in_parallel(
+    source, num_processes: int, region: Region = None
+) -> OpenDrive:
+    """Parse an OpenDRIVE document incrementally, with the roads
+    being parsed in a process pool.
+
+    Args:
+      source: Filename or file object of the xodr document.
+      num_processes: Number of worker processes.
+      region: Region of interest. (Default value = None)
+
+    Returns:
+      The object representing an OpenDrive specification.
+
+    """
+    opendrive = OpenDrive()
+    selected_roads = (
+        _select_roads_of_source(source, region) if region is not None else None
+    )
+
+    def serialized_roads():
+        for element in _iterparse_top_level_elements(source):
+            if element.tag == "header":
+                parse_opendrive_header(opendrive, element)
+            elif element.tag == "junction":
+                parse_opendrive_junction(opendrive, element)
+            elif selected_roads is None or int(element.get("id")) in selected_roads:
+                yield etree.tostring(element)
+
+    road_junction_ids = []
+    for newRoad, junctionId in parse_road_records_in_parallel(
+        serialized_roads(), num_processes
+    ):
+        if junctionId:
+            road_junction_ids.append((newRoad, junctionId))
+        opendrive.addRoad(newRoad)
+
+    # junctions can be after the roads in the document, so set them at the end
+    for road, junctionId in road_junction_ids:
+        road.junction = opendrive.getJunction(junctionId)
+
+    return opendrive
+
+
+def _clear_element(element):
+    """Free the memory of an already processed element and its preceding siblings.
+
+    Args:
+      element: Element which has been processed.
+
+    """
+    element.clear()
+    while element.getprevious() is not None:
+        del element.getparent()[0]
+
+
+def parse_opendrive_road_link(newRoad, opendrive_road_link):
+    """
+
+    Args:
+      newRoad:
+      opendrive_road_link:
+
+    """
+    predecessor = None
+    successor = None
+
+    for child in opendrive_road_link:
+        tag = child.tag
+        attrib = child.attrib
+
+        if tag == "predecessor" and predecessor is None:
+            predecessor = RoadLinkPredecessor(
+                attrib.get("elementType"),
+                attrib.get("elementId"),
+                attrib.get("contactPoint"),
+            )
+            newRoad.link.predecessor = predecessor
+
+        elif tag == "successor" and successor is None:
+            successor = RoadLinkSuccessor(
+                attrib.get("elementType"),
+                attrib.get("elementId"),
+                attrib.get("contactPoint"),
+            )
+            newRoad.link.successor = successor
+
+        elif tag == "neighbor":
+            newNeighbor = RoadLinkNeighbor(
+                attrib.get("side"), attrib.get("elementId"), attrib.get("direction")
+            )
+
+            newRoad.link.neighbors.append(newNeighbor)
 
 
 def parse_opendrive_road_type(road, opendrive_xml_road_type: etree.ElementTree):
@@ -123,96 +512,80 @@ def parse_opendrive_road_type(road, opendrive_xml_road_type: etree.ElementTree):
 
     """
     speed = None
-    if opendrive_xml_road_type.find("speed") is not None:
-
-        speed = RoadTypeSpeed(
-            max_speed=opendrive_xml_road_type.find("speed").get("max"),
-            unit=opendrive_xml_road_type.find("speed").get("unit"),
-        )
+    for child in opendrive_xml_road_type:
+        if child.tag == "speed":
+            speed = RoadTypeSpeed(
+                max_speed=child.attrib.get("max"), unit=child.attrib.get("unit")
+            )
+            break
 
+    attrib = opendrive_xml_road_type.attrib
     road_type = RoadType(
-        s_pos=opendrive_xml_road_type.get("s"),
-        use_type=opendrive_xml_road_type.get("type"),
-        speed=speed,
+        s_pos=attrib.get("s"), use_type=attrib.get("type"), speed=speed
     )
     road.types.append(road_type)
 
 
-def parse_opendrive_road_geometry(newRoad, road_geometry):
+def parse_opendrive_road_plan_view(newRoad, plan_view):
     """
 
     Args:
       newRoad:
-      road_geometry:
+      plan_view:
 
     """
+    for child in plan_view:
+        if child.tag == "geometry":
+            parse_opendrive_road_geometry(newRoad, child)
+
+
+# PlanView method and attributes of the geometry type element, which are passed
+# to the method after start position, heading and length, by tag of the
+# geometry type element. The order is the precedence if a geometry has several.
+GEOMETRY_TYPES = {
+    "line": ("addLine", ()),
+    "spiral": ("addSpiral", ("curvStart", "curvEnd")),
+    "arc": ("addArc", ("curvature",)),
+    "poly3": ("addPoly3", ("a", "b", "c", "d")),
+    "paramPoly3": (
+        "addParamPoly3",
+        ("aU", "bU", "cU", "dU", "aV", "bV", "cV", "dV"),
+    ),
+}
 
-    startCoord = [float(road_geometry.get("x")), float(road_geometry.get("y"))]
-
-    if road_geometry.find("line") is not None:
-        newRoad.planView.addLine(
-            startCoord,
-            float(road_geometry.get("hdg")),
-            float(road_geometry.get("length")),
-        )
-
-    elif road_geometry.find("spiral") is not None:
-        newRoad.planView.addSpiral(
-            startCoord,
-            float(road_geometry.get("hdg")),
-            float(road_geometry.get("length")),
-            float(road_geometry.find("spiral").get("curvStart")),
-            float(road_geometry.find("spiral").get("curvEnd")),
-        )
 
-    elif road_geometry.find("arc") is not None:
-        newRoad.planView.addArc(
-            startCoord,
-            float(road_geometry.get("hdg")),
-            float(road_geometry.get("length")),
-            float(road_geometry.find("arc").get("curvature")),
-        )
+def parse_opendrive_road_geometry(newRoad, road_geometry):
+    """
 
-    elif road_geometry.find("poly3") is not None:
-        newRoad.planView.addPoly3(
-            startCoord,
-            float(road_geometry.get("hdg")),
-            float(road_geometry.get("length")),
-            float(road_geometry.find("poly3").get("a")),
-            float(road_geometry.find("poly3").get("b")),
-            float(road_geometry.find("poly3").get("c")),
-            float(road_geometry.find("poly3").get("d")),
-        )
-        # raise NotImplementedError()
+    Args:
+      newRoad:
+      road_geometry:
 
-    elif road_geometry.find("paramPoly3") is not None:
-        if road_geometry.find("paramPoly3").get("pRange"):
+    """
+    attrib = road_geometry.attrib
+    startCoord = [float(attrib.get("x")), float(attrib.get("y"))]
 
-            if road_geometry.find("paramPoly3").get("pRange") == "arcLength":
-                pMax = float(road_geometry.get("length"))
-            else:
-                pMax = None
-        else:
-            pMax = None
-
-        newRoad.planView.addParamPoly3(
-            startCoord,
-            float(road_geometry.get("hdg")),
-            float(road_geometry.get("length")),
-            float(road_geometry.find("paramPoly3").get("aU")),
-            float(road_geometry.find("paramPoly3").get("bU")),
-            float(road_geometry.find("paramPoly3").get("cU")),
-            float(road_geometry.find("paramPoly3").get("dU")),
-            float(road_geometry.find("paramPoly3").get("aV")),
-            float(road_geometry.find("paramPoly3").get("bV")),
-            float(road_geometry.find("paramPoly3").get("cV")),
-            float(road_geometry.find("paramPoly3").get("dV")),
-            pMax,
-        )
+    type_elements = {}
+    for child in road_geometry:
+        type_elements.setdefault(child.tag, child)
 
+    for tag, (add_method, attribute_names) in GEOMETRY_TYPES.items():
+        if tag in type_elements:
+            break
     else:
         raise Exception("invalid xml")
 
+    length = float(attrib.get("length"))
+    type_attrib = type_elements[tag].attrib
+    args = [float(type_attrib.get(name)) for name in attribute_names]
+    if tag == "paramPoly3":
+        # parameter range of the polynomials, None if normalized to [0, 1]
+        args.append(length if type_attrib.get("pRange") == "arcLength" else None)
+
+    getattr(newRoad.planView, add_method)(
+        startCoord, float(attrib.get("hdg")), length, *args
+    )
+
 
 def parse_opendrive_road_elevation_profile(newRoad, road_elevation_profile):
     """
@@ -223,15 +596,18 @@ def parse_opendrive_road_elevation_profile(newRoad, road_elevation_profile):
 
     """
 
-    for elevation in road_elevation_profile.findall("elevation"):
+    for elevation in road_elevation_profile:
+        if elevation.tag != "elevation":
+            continue
+        attrib = elevation.attrib
 
         newElevation = (
             RoadElevationProfile(
-                float(elevation.get("a")),
-                float(elevation.get("b")),
-                float(elevation.get("c")),
-                float(elevation.get("d")),
-                start_pos=float(elevation.get("s")),
+                float(attrib.get("a")),
+                float(attrib.get("b")),
+                float(attrib.get("c")),
+                float(attrib.get("d")),
+                start_pos=float(attrib.get("s")),
             ),
         )
 
@@ -247,43 +623,63 @@ def parse_opendrive_road_lateral_profile(newRoad, road_lateral_profile):
 
     """
 
-    for superelevation in road_lateral_profile.findall("superelevation"):
+    for child in road_lateral_profile:
+        tag = child.tag
+        attrib = child.attrib
+
+        if tag == "superelevation":
+            newSuperelevation = RoadLateralProfileSuperelevation(
+                float(attrib.get("a")),
+                float(attrib.get("b")),
+                float(attrib.get("c")),
+                float(attrib.get("d")),
+                start_pos=float(attrib.get("s")),
+            )
 
-        newSuperelevation = RoadLateralProfileSuperelevation(
-            float(superelevation.get("a")),
-            float(superelevation.get("b")),
-            float(superelevation.get("c")),
-            float(superelevation.get("d")),
-            start_pos=float(superelevation.get("s")),
-        )
+            newRoad.lateralProfile.superelevations.append(newSuperelevation)
 
-        newRoad.lateralProfile.superelevations.append(newSuperelevation)
+        elif tag == "crossfall":
+            newCrossfall = RoadLateralProfileCrossfall(
+                float(attrib.get("a")),
+                float(attrib.get("b")),
+                float(attrib.get("c")),
+                float(attrib.get("d")),
+                side=attrib.get("side"),
+                start_pos=float(attrib.get("s")),
+            )
 
-    for crossfall in road_lateral_profile.findall("crossfall"):
+            newRoad.lateralProfile.crossfalls.append(newCrossfall)
 
-        newCrossfall = RoadLateralProfileCrossfall(
-            float(crossfall.get("a")),
-            float(crossfall.get("b")),
-            float(crossfall.get("c")),
-            float(crossfall.get("d")),
-            side=crossfall.get("side"),
-            start_pos=float(crossfall.get("s")),
-        )
+        elif tag == "shape":
+            newShape = RoadLateralProfileShape(
+                float(attrib.get("a")),
+                float(attrib.get("b")),
+                float(attrib.get("c")),
+                float(attrib.get("d")),
+                start_pos=float(attrib.get("s")),
+                start_pos_t=float(attrib.get("t")),
+            )
 
-        newRoad.lateralProfile.crossfalls.append(newCrossfall)
+            newRoad.lateralProfile.shapes.append(newShape)
 
-    for shape in road_lateral_profile.findall("shape"):
 
-        newShape = RoadLateralProfileShape(
-            float(shape.get("a")),
-            float(shape.get("b")),
-            float(shape.get("c")),
-            float(shape.get("d")),
-            start_pos=float(shape.get("s")),
-            start_pos_t=float(shape.get("t")),
-        )
+def parse_opendrive_road_lanes(newRoad, lanes):
+    """
+
+    Args:
+      newRoad:
+      lanes:
+
+    """
+    lane_section_id = 0
 
-        newRoad.lateralProfile.shapes.append(newShape)
+    for child in lanes:
+        if child.tag == "laneOffset":
+            parse_opendrive_road_lane_offset(newRoad, child)
+
+        elif child.tag == "laneSection":
+            parse_opendrive_road_lane_section(newRoad, lane_section_id, child)
+            lane_section_id += 1
 
 
 def parse_opendrive_road_lane_offset(newRoad, lane_offset):
@@ -294,13 +690,14 @@ def parse_opendrive_road_lane_offset(newRoad, lane_offset):
       lane_offset:
 
     """
+    attrib = lane_offset.attrib
 
     newLaneOffset = RoadLanesLaneOffset(
-        float(lane_offset.get("a")),
-        float(lane_offset.get("b")),
-        float(lane_offset.get("c")),
-        float(lane_offset.get("d")),
-        start_pos=float(lane_offset.get("s")),
+        float(attrib.get("a")),
+        float(attrib.get("b")),
+        float(attrib.get("c")),
+        float(attrib.get("d")),
+        start_pos=float(attrib.get("s")),
     )
 
     newRoad.lanes.laneOffsets.append(newLaneOffset)
@@ -321,8 +718,8 @@ def parse_opendrive_road_lane_section(newRoad, lane_section_id, lane_section):
     # Manually enumerate lane sections for referencing purposes
     newLaneSection.idx = lane_section_id
 
-    newLaneSection.sPos = float(lane_section.get("s"))
-    newLaneSection.singleSide = lane_section.get("singleSide")
+    newLaneSection.sPos = float(lane_section.attrib.get("s"))
+    newLaneSection.singleSide = lane_section.attrib.get("singleSide")
 
     sides = dict(
         left=newLaneSection.leftLanes,
@@ -330,96 +727,134 @@ def parse_opendrive_road_lane_section(newRoad, lane_section_id, lane_section):
         right=newLaneSection.rightLanes,
     )
 
-    for sideTag, newSideLanes in sides.items():
+    # It is possible one side is not present
+    for side in lane_section:
+        # only the first element of each side is used,
+        # so the side is removed from sides once parsed
+        newSideLanes = sides.pop(side.tag, None)
+        if newSideLanes is None:
+            continue
 
-        side = lane_section.find(sideTag)
+        for lane in side:
+            if lane.tag == "lane":
+                newSideLanes.append(
+                    parse_opendrive_road_lane(newRoad, newLaneSection, lane)
+                )
 
-        # It is possible one side is not present
-        if side is None:
-            continue
+    newRoad.lanes.lane_sections.append(newLaneSection)
 
-        for lane in side.findall("lane"):
 
-            new_lane = RoadLaneSectionLane(
-                parentRoad=newRoad, lane_section=newLaneSection
-            )
-            new_lane.id = lane.get("id")
-            new_lane.type = lane.get("type")
+def parse_opendrive_road_lane(newRoad, newLaneSection, lane) -> RoadLaneSectionLane:
+    """Create a lane object from a lane XML element.
+
+    Args:
+      newRoad: Road the lane belongs to.
+      newLaneSection: Lane section the lane belongs to.
+      lane: XML element of the lane.
+
+    Returns:
+      The parsed lane.
 
-            # In some sample files the level is not specified according to the OpenDRIVE spec
-            new_lane.level = (
-                "true" if lane.get("level") in [1, "1", "true"] else "false"
+    """
+    attrib = lane.attrib
+
+    new_lane = RoadLaneSectionLane(parentRoad=newRoad, lane_section=newLaneSection)
+    new_lane.id = attrib.get("id")
+    new_lane.type = attrib.get("type")
+
+    # In some sample files the level is not specified according to the OpenDRIVE spec
+    new_lane.level = "true" if attrib.get("level") in [1, "1", "true"] else "false"
+
+    has_link = False
+    widths = []
+    borders = []
+
+    for child in lane:
+        tag = child.tag
+
+        # Lane Links
+        if tag == "link" and not has_link:
+            has_link = True
+            parse_opendrive_road_lane_link(new_lane, child)
+
+        # Width
+        elif tag == "width":
+            child_attrib = child.attrib
+            widths.append(
+                RoadLaneSectionLaneWidth(
+                    float(child_attrib.get("a")),
+                    float(child_attrib.get("b")),
+                    float(child_attrib.get("c")),
+                    float(child_attrib.get("d")),
+                    idx=len(widths),
+                    start_offset=float(child_attrib.get("sOffset")),
+                )
             )
 
-            # Lane Links
-            if lane.find("link") is not None:
-
-                if lane.find("link").find("predecessor") is not None:
-                    new_lane.link.predecessorId = (
-                        lane.find("link").find("predecessor").get("id")
-                    )
-
-                if lane.find("link").find("successor") is not None:
-                    new_lane.link.successorId = (
-                        lane.find("link").find("successor").get("id")
-                    )
-
-            # Width
-            for widthIdx, width in enumerate(lane.findall("width")):
-
-                newWidth = RoadLaneSectionLaneWidth(
-                    float(width.get("a")),
-                    float(width.get("b")),
-                    float(width.get("c")),
-                    float(width.get("d")),
-                    idx=widthIdx,
-                    start_offset=float(width.get("sOffset")),
+        # Border
+        elif tag == "border":
+            child_attrib = child.attrib
+            borders.append(
+                RoadLaneSectionLaneBorder(
+                    float(child_attrib.get("a")),
+                    float(child_attrib.get("b")),
+                    float(child_attrib.get("c")),
+                    float(child_attrib.get("d")),
+                    idx=len(borders),
+                    start_offset=float(child_attrib.get("sOffset")),
                 )
+            )
 
-                new_lane.widths.append(newWidth)
+    new_lane.widths.extend(widths)
+    new_lane.borders.extend(borders)
 
-            # Border
-            for borderIdx, border in enumerate(lane.findall("border")):
+    if not widths and borders:
+        new_lane.widths = new_lane.borders
+        new_lane.has_border_record = True
 
-                newBorder = RoadLaneSectionLaneBorder(
-                    float(border.get("a")),
-                    float(border.get("b")),
-                    float(border.get("c")),
-                    float(border.get("d")),
-                    idx=borderIdx,
-                    start_offset=float(border.get("sOffset")),
-                )
+    # Road Marks
+    # TODO implementation
+
+    # Material
+    # TODO implementation
 
-                new_lane.borders.append(newBorder)
+    # Visiblility
+    # TODO implementation
 
-            if lane.find("width") is None and lane.find("border") is not None:
-                new_lane.widths = new_lane.borders
-                new_lane.has_border_record = True
+    # Speed
+    # TODO implementation
+
+    # Access
+    # TODO implementation
 
-            # Road Marks
-            # TODO implementation
+    # Lane Height
+    # TODO implementation
 
-            # Material
-            # TODO implementation
+    # Rules
+    # TODO implementation
 
-            # Visiblility
-            # TODO implementation
+    return new_lane
 
-            # Speed
-            # TODO implementation
 
-            # Access
-            # TODO implementation
+def parse_opendrive_road_lane_link(new_lane, lane_link):
+    """
 
-            # Lane Height
-            # TODO implementation
+    Args:
+      new_lane:
+      lane_link:
 
-            # Rules
-            # TODO implementation
+    """
+    has_predecessor = False
+    has_successor = False
 
-            newSideLanes.append(new_lane)
+    for child in lane_link:
+        if child.tag == "predecessor" and not has_predecessor:
+            has_predecessor = True
+            new_lane.link.predecessorId = child.attrib.get("id")
 
-    newRoad.lanes.lane_sections.append(newLaneSection)
+        elif child.tag == "successor" and not has_successor:
+            has_successor = True
+            new_lane.link.successorId = child.attrib.get("id")
 
 
 def parse_opendrive_road(opendrive, road):
@@ -431,56 +866,70 @@ def parse_opendrive_road(opendrive, road):
 
     """
 
+    junctionId = _get_road_junction_id(road)
+
+    junction = opendrive.getJunction(junctionId) if junctionId else None
+
+    opendrive.addRoad(parse_opendrive_road_element(road, junction))
+
+
+def _get_road_junction_id(road):
+    """Get the id of the junction a road belongs to.
+
+    Args:
+      road: XML element of the road.
+
+    Returns:
+      Id of the junction or None if the road does not belong to a junction.
+
+    """
+    return int(road.get("junction")) if road.get("junction") != "-1" else None
+
+
+def parse_opendrive_road_element(road, junction: Junction = None) -> Road:
+    """Create a Road object from a road XML element.
+
+    Args:
+      road: XML element of the road.
+      junction: Junction the road belongs to. (Default value = None)
+
+    Returns:
+      The parsed road.
+
+    """
+
     newRoad = Road()
 
-    newRoad.id = int(road.get("id"))
-    newRoad.name = road.get("name")
+    attrib = road.attrib
 
-    junctionId = int(road.get("junction")) if road.get("junction") != "-1" else None
+    newRoad.id = int(attrib.get("id"))
+    newRoad.name = attrib.get("name")
 
-    if junctionId:
-        newRoad.junction = opendrive.getJunction(junctionId)
+    if junction is not None:
+        newRoad.junction = junction
 
     # TODO verify road length
-    newRoad.length = float(road.get("length"))
-
-    # Links
-    opendrive_road_link = road.find("link")
-    if opendrive_road_link is not None:
-        parse_opendrive_road_link(newRoad, opendrive_road_link)
-
-    # Type
-    for opendrive_xml_road_type in road.findall("type"):
-        parse_opendrive_road_type(newRoad, opendrive_xml_road_type)
-
-    # Plan view
-    for road_geometry in road.find("planView").findall("geometry"):
-        parse_opendrive_road_geometry(newRoad, road_geometry)
-
-    # Elevation profile
-    road_elevation_profile = road.find("elevationProfile")
-    if road_elevation_profile is not None:
-        parse_opendrive_road_elevation_profile(newRoad, road_elevation_profile)
-
-    # Lateral profile
-    road_lateral_profile = road.find("lateralProfile")
-    if road_lateral_profile is not None:
-        parse_opendrive_road_lateral_profile(newRoad, road_lateral_profile)
-    # Lanes
-    lanes = road.find("lanes")
-
-    if lanes is None:
-        raise Exception("Road must have lanes element")
+    newRoad.length = float(attrib.get("length"))
 
-    # Lane offset
-    for lane_offset in lanes.findall("laneOffset"):
-        parse_opendrive_road_lane_offset(newRoad, lane_offset)
+    parsed_tags = set()
+    for child in road:
+        tag = child.tag
+        parse_child = ROAD_CHILD_PARSERS.get(tag)
 
-    # Lane sections
-    for lane_section_id, lane_section in enumerate(
-        road.find("lanes").findall("laneSection")
-    ):
-        parse_opendrive_road_lane_section(newRoad, lane_section_id, lane_section)
+        # only the first element is used for all but the road types
+        if parse_child is None or tag in parsed_tags:
+            continue
+        if tag != "type":
+            parsed_tags.add(tag)
+
+        parse_child(newRoad, child)
+
+    if "planView" not in parsed_tags:
+        # AttributeError, as raised by former versions of the parser
+        raise AttributeError("Road must have planView element")
+
+    if "lanes" not in parsed_tags:
+        raise Exception("Road must have lanes element")
 
     # Objects
     # TODO implementation
@@ -489,7 +938,18 @@ def parse_opendrive_road(opendrive, road):
     # TODO implementation
     calculate_lane_section_lengths(newRoad)
 
-    opendrive.roads.append(newRoad)
+    return newRoad
+
+
+# functions which parse the child elements of a road, by tag of the child
+ROAD_CHILD_PARSERS = {
+    "link": parse_opendrive_road_link,
+    "type": parse_opendrive_road_type,
+    "planView": parse_opendrive_road_plan_view,
+    "elevationProfile": parse_opendrive_road_elevation_profile,
+    "lateralProfile": parse_opendrive_road_lateral_profile,
+    "lanes": parse_opendrive_road_lanes,
+}
 
 
 def calculate_lane_section_lengths(newRoad):
@@ -519,7 +979,8 @@ def calculate_lane_section_lengths(newRoad):
             widthsPoses = np.array(
                 [x.start_offset for x in lane.widths] + [lane_section.length]
             )
-            widthsLengths = widthsPoses[1:] - widthsPoses[:-1]
+            # plain floats take less memory than numpy scalars
+            widthsLengths = (widthsPoses[1:] - widthsPoses[:-1]).tolist()
 
             for widthIdx, width in enumerate(lane.widths):
                 width.length = widthsLengths[widthIdx]
@@ -552,15 +1013,18 @@ def parse_opendrive_header(opendrive, header):
     opendrive.header = parsed_header
 
 
-def parse_opendrive_junction(opendrive, junction):
+def parse_opendrive_junction(opendrive, junction, newJunction: Junction = None):
     """
 
     Args:
       opendrive:
       junction:
+      newJunction: Junction object to be completed with the parsed information.
+        A new one is created if it is None. (Default value = None)
 
     """
-    newJunction = Junction()
+    if newJunction is None:
+        newJunction = Junction()
 
     newJunction.id = int(junction.get("id"))
     newJunction.name = str(junction.get("name"))
@@ -585,4 +1049,4 @@ def parse_opendrive_junction(opendrive, junction):
 
         newJunction.addConnection(newConnection)
 
-    opendrive.junctions.append(newJunction)
+    opendrive.addJunction(newJunction)
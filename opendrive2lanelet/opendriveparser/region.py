@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+"""Module for regions of interest, which restrict parsing to the roads of a part of a map."""
+
+from typing import Dict, Iterable, List, NamedTuple, Set
+
+import numpy as np
+
+__author__ = "Benjamin Orthen"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["Priority Program SPP 1835 Cooperative Interacting Automobiles"]
+__version__ = "1.1.2"
+__maintainer__ = "Benjamin Orthen"
+__email__ = "commonroad-i06@in.tum.de"
+__status__ = "Released"
+
+# margin in meters, by which lanes may extend beside the reference line of a road,
+# used by the command line tool
+DEFAULT_MARGIN = 20.0
+
+
+class RoadOutline(NamedTuple):
+    """Information about a road which is needed to decide whether it is in a region.
+
+    Attributes:
+      road_id: Id of the road.
+      junction_id: Id of the junction the road belongs to or None.
+      linked_roads: Ids of the roads which are predecessor or successor of the road.
+      linked_junctions: Ids of the junctions which are predecessor or successor of the road.
+      start_points: Array of shape (n, 2) with the start points of the geometries of the plan view.
+      lengths: Array of shape (n,) with the lengths of the geometries.
+    """
+
+    road_id: int
+    junction_id: int
+    linked_roads: List[int]
+    linked_junctions: List[int]
+    start_points: np.ndarray
+    lengths: np.ndarray
+
+
+class Region:
+    """Polygonal region of interest of a map.
+
+    A geometry of a plan view never leaves the circle around its start
+    point with its length as radius. A road is in the region if any of these
+    circles, enlarged by margin, intersects the polygon. This test is cheap,
+    but only approximate: some roads near the region are in it as well, and
+    roads whose lanes reach further than margin beside the reference line
+    into the region are missed. With the default margin of 0, only the
+    reference lines are considered.
+
+    Attributes:
+      vertices (np.ndarray): Array of shape (n, 2) with the vertices of the polygon.
+      margin (float): Distance by which the circles are enlarged, to account for
+        lanes which are beside the reference line of a road.
+    """
+
+    def __init__(self, vertices, margin: float = 0.0):
+        self.vertices = np.asarray(vertices, dtype=float)
+        if self.vertices.ndim != 2 or self.vertices.shape[1] != 2:
+            raise ValueError("Vertices of a region have to be of shape (n, 2).")
+        if len(self.vertices) < 3:
+            raise ValueError("A region needs at least three vertices.")
+        self.margin = margin
+
+    @classmethod
+    def from_bounding_box(
+        cls, min_x: float, min_y: float, max_x: float, max_y: float, margin: float = 0.0
+    ) -> "Region":
+        """Create a rectangular region.
+
+        Args:
+          min_x: Minimal x coordinate.
+          min_y: Minimal y coordinate.
+          max_x: Maximal x coordinate.
+          max_y: Maximal y coordinate.
+          margin: Distance by which the road geometries are enlarged. (Default value = 0.0)
+
+        Returns:
+          The region of the bounding box.
+        """
+        if min_x > max_x or min_y > max_y:
+            raise ValueError("Minimal coordinates of a bounding box exceed maximal ones.")
+
+        return cls(
+            [[min_x, min_y], [max_x, min_y], [max_x, max_y], [min_x, max_y]], margin
+        )
+
+    def __repr__(self):
+        return f"Region({self.vertices.tolist()}, margin={self.margin})"
+
+    def intersects_circles(self, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        """Check for circles whether they intersect the region.
+
+        Args:
+          centers: Array of shape (m, 2) with the centers of the circles.
+          radii: Array of shape (m,) with the radii of the circles.
+
+        Returns:
+          Boolean array of shape (m,).
+        """
+        centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+        radii = np.asarray(radii, dtype=float) + self.margin
+
+        start = self.vertices
+        end = np.roll(self.vertices, -1, axis=0)
+        edge = end - start
+
+        # distance of each center to each edge, shape (m, n)
+        to_center = centers[:, np.newaxis, :] - start[np.newaxis, :, :]
+        edge_length_sq = np.einsum("ij,ij->i", edge, edge)
+        projection = np.clip(
+            np.einsum("mij,ij->mi", to_center, edge)
+            / np.where(edge_length_sq > 0, edge_length_sq, 1.0),
+            0.0,
+            1.0,
+        )
+        closest = start + projection[:, :, np.newaxis] * edge
+        distances = np.hypot(
+            centers[:, np.newaxis, 0] - closest[:, :, 0],
+            centers[:, np.newaxis, 1] - closest[:, :, 1],
+        )
+        touches_border = np.any(distances <= radii[:, np.newaxis], axis=1)
+
+        # center inside of polygon, by counting crossings of a ray in x direction
+        y_start = start[np.newaxis, :, 1]
+        y_end = end[np.newaxis, :, 1]
+        center_y = centers[:, np.newaxis, 1]
+        crosses = (y_start > center_y) != (y_end > center_y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_crossing = start[:, 0] + (center_y - y_start) * edge[:, 0] / (
+                y_end - y_start
+            )
+        inside = (
+            np.count_nonzero(crosses & (centers[:, np.newaxis, 0] < x_crossing), axis=1)
+            % 2
+            == 1
+        )
+
+        return touches_border | inside
+
+    def contains_road(self, road_outline: RoadOutline) -> bool:
+        """Check whether a part of a road may be in the region.
+
+        Args:
+          road_outline: Outline of the road.
+
+        Returns:
+          True if a geometry of the road intersects the region.
+        """
+        if len(road_outline.lengths) == 0:
+            return False
+
+        return bool(
+            np.any(
+                self.intersects_circles(road_outline.start_points, road_outline.lengths)
+            )
+        )
+
+    def select_roads(
+        self,
+        road_outlines: Iterable[RoadOutline],
+        connecting_roads: Dict[int, Iterable[int]],
+    ) -> Set[int]:
+        """Select the roads which are needed to convert the region.
+
+        These are the roads in the region, their linked predecessors and
+        successors and the connecting roads of the junctions they belong or
+        are linked to.
+
+        Args:
+          road_outlines: Outlines of all roads of the map.
+          connecting_roads: Ids of the connecting roads of each junction, by junction id.
+
+        Returns:
+          Ids of the selected roads.
+        """
+        selected_roads = set()
+
+        for road_outline in road_outlines:
+            if not self.contains_road(road_outline):
+                continue
+
+            selected_roads.add(road_outline.road_id)
+            selected_roads.update(road_outline.linked_roads)
+
+            junction_ids = list(road_outline.linked_junctions)
+            if road_outline.junction_id is not None:
+                junction_ids.append(road_outline.junction_id)
+            for junction_id in junction_ids:
+                selected_roads.update(connecting_roads.get(junction_id, ()))
+
+        return selected_roads
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 
-from functools import lru_cache
+from collections import OrderedDict
+from itertools import count
+import weakref
+from typing import NamedTuple, Tuple
 import numpy as np
 
 __author__ = "Benjamin Orthen, Stefan Urban"
@@ -12,18 +15,163 @@ __email__ = "commonroad-i06@in.tum.de"
 __status__ = "Released"
 
 
+class CacheStatistics(NamedTuple):
+    """Statistics of the samples of one or several Borders in the sample cache.
+
+    Attributes:
+      hits: Number of calculations answered from the cache.
+      misses: Number of calculations which had to be carried out.
+      size: Number of samples in the cache.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+    def __add__(self, other):
+        return CacheStatistics(
+            self.hits + other.hits, self.misses + other.misses, self.size + other.size
+        )
+
+
+# ids of the owners of entries in the sample caches
+_OWNER_IDS = count()
+
+
+class BorderSampleCache:
+    """Cache of calculated samples of all Borders, with one bound for its total size.
+
+    Samples at single positions and arrays of samples at several positions are
+    cached. An array counts as many samples as it has positions. If the cache
+    holds more than max_size samples, the least recently used entries are
+    evicted, regardless of the Border they belong to.
+
+    Each Border is an owner of entries in the cache, identified by an int.
+    Hits and misses are counted per owner.
+
+    Attributes:
+      max_size (int): Maximal number of samples in the cache.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        # (owner, key) -> (sample, weight), in the order of the last use
+        self._entries = OrderedDict()
+        self._size = 0
+        # owner -> [hits, misses, keys of the owner with their weights]
+        self._owners = {}
+
+    def __len__(self):
+        """Number of cached samples."""
+        return self._size
+
+    @staticmethod
+    def new_owner() -> int:
+        """Get an id, which is not used by another owner of entries
+        in any cache of this process."""
+        return next(_OWNER_IDS)
+
+    def _get_owner(self, owner: int) -> list:
+        return self._owners.setdefault(owner, [0, 0, {}])
+
+    def get(self, owner: int, key):
+        """Get a sample from the cache.
+
+        Args:
+          owner: Id of the owner of the sample.
+          key: Arguments of the calculation.
+
+        Returns:
+          The cached sample or None if it is not in the cache.
+        """
+        entry = self._entries.get((owner, key))
+        owner_state = self._get_owner(owner)
+        if entry is None:
+            owner_state[1] += 1
+            return None
+
+        owner_state[0] += 1
+        self._entries.move_to_end((owner, key))
+        return entry[0]
+
+    def put(self, owner: int, key, sample, weight: int = 1):
+        """Add a sample to the cache and evict the least recently used entries,
+        if the cache is full.
+
+        Args:
+          owner: Id of the owner of the sample.
+          key: Arguments of the calculation.
+          sample: Result of the calculation.
+          weight: Number of samples in the entry. (Default value = 1)
+        """
+        if weight > self.max_size:
+            return
+
+        self._remove((owner, key))
+        self._entries[owner, key] = (sample, weight)
+        self._get_owner(owner)[2][key] = weight
+        self._size += weight
+
+        while self._size > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, entry_key):
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            owner, key = entry_key
+            del self._owners[owner][2][key]
+            self._size -= entry[1]
+
+    def clear(self, owner: int = None):
+        """Remove samples and reset the statistics.
+
+        Args:
+          owner: Id of the owner whose samples are removed. If None,
+            all samples are removed. (Default value = None)
+        """
+        if owner is None:
+            self._entries.clear()
+            self._owners.clear()
+            self._size = 0
+            return
+
+        owner_state = self._owners.pop(owner, None)
+        if owner_state is not None:
+            for key, weight in owner_state[2].items():
+                del self._entries[owner, key]
+                self._size -= weight
+
+    def statistics(self, owner: int = None) -> CacheStatistics:
+        """Get hits, misses and size of the cache.
+
+        Args:
+          owner: Id of the owner whose statistics are returned. If None,
+            the statistics of all owners are added up. (Default value = None)
+        """
+        if owner is None:
+            return sum(
+                (self.statistics(owner) for owner in self._owners), CacheStatistics()
+            )
+
+        hits, misses, keys = self._owners.get(owner, (0, 0, {}))
+        return CacheStatistics(hits, misses, sum(keys.values()))
+
+
 class Border:
     """A lane border defines a path along a whole lane section
     - a lane always uses an inner and outer lane border
     - the reference can be another lane border or a plan view
 
     Attributes:
-
+      sample_cache (BorderSampleCache): Cache of the samples of all Borders,
+        which holds at most sample_cache.max_size samples.
 
     Args:
 
     """
 
+    sample_cache = BorderSampleCache(200000)
+
     def __init__(self, ref_offset: float = 0.0):
 
         self.ref_offset = float(ref_offset)
@@ -31,6 +179,51 @@ class Border:
         self.width_coefficients = []
 
         self.reference = None
+        self._width_arrays = None
+        self._register_cache_owner()
+
+        # set if the border is evaluated by a BorderMatrix
+        self._matrix = None
+        self._matrix_row = None
+
+    def _register_cache_owner(self):
+        """Get an owner id in the sample cache and remove the samples of this
+        Border from the cache when it is garbage collected."""
+        self._cache_owner = self.sample_cache.new_owner()
+        weakref.finalize(self, self.sample_cache.clear, self._cache_owner)
+
+    def __getstate__(self):
+        # the samples are not pickled and the owner id is only valid in this process
+        state = self.__dict__.copy()
+        del state["_cache_owner"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._register_cache_owner()
+
+    @property
+    def cache_statistics(self) -> CacheStatistics:
+        """Get hits, misses and size of the samples of this Border in the sample cache."""
+        return self.sample_cache.statistics(self._cache_owner)
+
+    def clear_cache(self):
+        """Remove the cached samples of this Border, e.g. after its widths
+        or reference changed."""
+        self.sample_cache.clear(self._cache_owner)
+        self._width_arrays = None
+        if self._matrix is not None:
+            self._matrix.clear_cache()
+
+    def use_matrix(self, matrix, row: int):
+        """Evaluate this Border with a BorderMatrix instead of through its reference.
+
+        Args:
+          matrix (BorderMatrix): Matrix which evaluates this Border.
+          row: Row of this Border in the matrix.
+        """
+        self._matrix = matrix
+        self._matrix_row = row
 
     def _get_width_index(self, s_pos: float, is_last_pos: bool) -> int:
         """Get the index of the width which applies at position s_pos.
@@ -52,6 +245,66 @@ class Border:
             len(self.width_coefficient_offsets),
         )
 
+    def _get_width_arrays(self):
+        """Get the width offsets and coefficients as arrays for calc_many.
+
+        Returns:
+          Array of shape (k,) with the offsets and array of shape (k, n)
+          with the coefficients, padded with zeros to the same degree.
+        """
+        if self._width_arrays is None:
+            offsets = np.array(self.width_coefficient_offsets, dtype=float)
+            degree = max(len(coeffs) for coeffs in self.width_coefficients)
+            coefficients = np.zeros((len(self.width_coefficients), degree))
+            for i, coeffs in enumerate(self.width_coefficients):
+                coefficients[i, : len(coeffs)] = coeffs
+            self._width_arrays = offsets, coefficients
+
+        return self._width_arrays
+
+    def _get_width_indices(self, s_positions: np.ndarray, is_last_pos) -> np.ndarray:
+        """Get the indices of the widths which apply at several positions.
+
+        Like _get_width_index, but with a binary search.
+
+        Args:
+          s_positions: Array of positions on border in curve_parameter ds.
+          is_last_pos: Bool or array of bools, whether a position is the last one
+            of a ParametricLane.
+        Returns:
+          Array with indices for self.width_coefficient_offsets or self.width_coefficients.
+        """
+        offsets, _ = self._get_width_arrays()
+        if np.any(np.diff(offsets) < 0):
+            # the binary search needs sorted offsets
+            return np.array(
+                [
+                    self._get_width_index(s_pos, last)
+                    for s_pos, last in zip(
+                        s_positions, np.broadcast_to(is_last_pos, s_positions.shape)
+                    )
+                ],
+                dtype=int,
+            )
+
+        # at the last position of a ParametricLane, a width starting exactly there
+        # does not apply yet
+        exclusive = np.logical_and(is_last_pos, s_positions != 0)
+        width_indices = np.where(
+            exclusive,
+            np.searchsorted(offsets, s_positions, side="left"),
+            np.searchsorted(offsets, s_positions, side="right"),
+        ) - 1
+
+        # like list.index, take the first of several widths with the same offset
+        found = width_indices >= 0
+        width_indices[found] = np.searchsorted(
+            offsets, offsets[width_indices[found]], side="left"
+        )
+        width_indices[~found] = len(offsets)
+
+        return width_indices
+
     def get_next_width_coeffs(self, s_pos: float, is_last_pos: bool = False) -> list:
         """Get width coefficients which apply at position s_pos.
 
@@ -65,14 +318,14 @@ class Border:
         width_idx = self._get_width_index(s_pos, is_last_pos)
         return self.width_coefficients[width_idx]
 
-    # NOTE: might by more efficient to calculate each border once
-    # instead of recalculating them over and over.
-    @lru_cache(maxsize=200000)
     def calc(self, s_pos: float, width_offset: float = 0.0, is_last_pos: bool = False):
         """Calculate the Cartesian coordinates and the tangential direction of
         the border by calculating position of reference border at s_pos
         and then adding the width in orthogonal direction to the reference position.
 
+        Borders are shared by adjacent lanes and referenced by the outer borders,
+        so the samples are cached.
+
         Args:
           s_pos: Position s_pos (specified in curve parameter ds)
             where to calculate the cartesian coordinates on the border.
@@ -81,6 +334,110 @@ class Border:
         Returns:
           (x,y) tuple of cartesian coordinates and the direction angle in radians.
         """
+        key = (s_pos, width_offset, is_last_pos)
+        sample = self.sample_cache.get(self._cache_owner, key)
+        if sample is None:
+            sample = self._calc(s_pos, width_offset, is_last_pos)
+            self.sample_cache.put(self._cache_owner, key, sample)
+        return sample
+
+    def calc_many(
+        self, s_positions, width_offset=0.0, is_last_pos=False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate the Cartesian coordinates and the tangential directions
+        of the border at several positions, see calc.
+
+        The reference border is calculated once for all positions
+        and the widths are evaluated in one pass.
+
+        Args:
+          s_positions: Array of positions (specified in curve parameter ds)
+            where to calculate the cartesian coordinates on the border.
+          width_offset: Offset or array of offsets to add to calculated
+            width at the positions. (Default value = 0.0)
+          is_last_pos: Bool or array of bools, whether a position is the last one
+            of a ParametricLane. (Default value = False)
+
+        Returns:
+          Array of shape (N, 2) with cartesian coordinates and
+          array of shape (N,) with the direction angles in radians.
+        """
+        s_positions = np.asarray(s_positions, dtype=float).ravel()
+        key = (
+            s_positions.tobytes(),
+            np.asarray(width_offset, dtype=float).tobytes(),
+            np.asarray(is_last_pos, dtype=bool).tobytes(),
+        )
+        samples = self.sample_cache.get(self._cache_owner, key)
+        if samples is None:
+            samples = self._calc_many(s_positions, width_offset, is_last_pos)
+            self.sample_cache.put(
+                self._cache_owner, key, samples, weight=max(1, s_positions.size)
+            )
+
+        # the cached arrays must not be changed by the caller
+        return samples[0].copy(), samples[1].copy()
+
+    def _calc_many(
+        self, s_positions: np.ndarray, width_offset, is_last_pos
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate samples of the border at several positions without the cache,
+        see calc_many."""
+        if self._matrix is not None:
+            return self._matrix.calc_many(
+                self._matrix_row, s_positions, width_offset, is_last_pos
+            )
+
+        s_positions = np.where(np.isclose(s_positions, 0), 0.0, s_positions)
+
+        if isinstance(self.reference, Border):
+            ref_coords, tang_angles = self.reference.calc_many(
+                self.ref_offset + s_positions, is_last_pos=is_last_pos
+            )
+        else:
+            ref_coords, tang_angles = self.reference.calc_many(
+                self.ref_offset + s_positions
+            )
+
+        distances = self.calc_widths(s_positions, is_last_pos) + width_offset
+
+        # New points are in orthogonal direction
+        ortho = tang_angles + np.pi / 2
+        coords = ref_coords + np.column_stack(
+            (distances * np.cos(ortho), distances * np.sin(ortho))
+        )
+
+        return coords, tang_angles
+
+    def calc_widths(self, s_positions: np.ndarray, is_last_pos=False) -> np.ndarray:
+        """Calculate the widths of the border, which are the signed distances
+        to its reference, at several positions.
+
+        Args:
+          s_positions: Array of positions (specified in curve parameter ds).
+          is_last_pos: Bool or array of bools, whether a position is the last one
+            of a ParametricLane. (Default value = False)
+
+        Returns:
+          Array of shape (N,) with the widths.
+        """
+        if not self.width_coefficients or not self.width_coefficient_offsets:
+            raise Exception("No entries for width definitions.")
+
+        offsets, coefficients = self._get_width_arrays()
+        width_indices = self._get_width_indices(s_positions, is_last_pos)
+        local_coefficients = coefficients[width_indices]
+        ds = s_positions - offsets[width_indices]
+
+        # Horner scheme for all polynomials at once
+        widths = local_coefficients[:, -1]
+        for i in range(local_coefficients.shape[1] - 2, -1, -1):
+            widths = local_coefficients[:, i] + widths * ds
+
+        return widths
+
+    def _calc(self, s_pos: float, width_offset: float, is_last_pos: bool):
+        """Calculate a sample of the border without the cache, see calc."""
         # Last reference has to be a reference geometry (PlanView)
         # Offset of all inner lanes (Border)
         # calculate position of reference border
@@ -117,3 +474,192 @@ class Border:
         )
 
         return coord, tang_angle
+
+
+class BorderMatrix:
+    """Flattened evaluation of the lane borders of one side of a lane section.
+
+    Each outer lane border is defined relative to an inner one, so calculating
+    the outermost border of a wide road at some positions calculates all inner
+    borders at these positions as well. But all of them share the position and
+    tangent of the reference border of the lane section. The matrix calculates
+    the reference border once, the widths of all borders as a
+    (borders x positions) matrix and accumulates them from the inside to
+    the outside, so all borders are calculated in one pass.
+
+    The borders keep their widths and references. After BorderMatrix.attach
+    they delegate Border.calc_many to the matrix. The results are the same as
+    calculating through the references, as the widths are added to the
+    positions in the same order.
+
+    Attributes:
+      reference_border (Border): Reference border of the lane section.
+      ref_offset (float): Position of the lane section on the reference border.
+      borders (list): Borders which are evaluated by the matrix, ordered so that
+        the reference of a border is the reference border or a previous border.
+    """
+
+    def __init__(self, reference_border: Border, borders: list):
+        if not self.can_flatten(reference_border, borders):
+            raise ValueError(
+                "Borders are not relative to the same position on the reference border."
+            )
+
+        self.reference_border = reference_border
+        self.borders = list(borders)
+        self.ref_offset = borders[0].ref_offset
+
+        rows = {id(reference_border): -1}
+        self._parents = []
+        for row, border in enumerate(self.borders):
+            self._parents.append(rows[id(border.reference)])
+            rows[id(border)] = row
+
+        self._last_batch = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_last_batch"] = None
+        return state
+
+    @classmethod
+    def attach(cls, reference_border: Border, borders: list):
+        """Create a BorderMatrix and let the borders delegate Border.calc_many to it.
+
+        The borders keep a reference to the matrix, so the returned matrix
+        does not have to be kept by the caller.
+
+        Args:
+          reference_border: Reference border of the lane section.
+          borders: Borders, ordered from the inside to the outside.
+
+        Returns:
+          The BorderMatrix which evaluates the borders.
+        """
+        matrix = cls(reference_border, borders)
+        for row, border in enumerate(matrix.borders):
+            border.use_matrix(matrix, row)
+        return matrix
+
+    @staticmethod
+    def can_flatten(reference_border: Border, borders: list) -> bool:
+        """Check whether borders can be evaluated by a BorderMatrix.
+
+        This is the case if each border references the reference border with
+        the same offset or a previous border without an offset, so all borders
+        are at the same position on the reference border. It is not the case
+        e.g. for lanes with border records which are not the innermost lane.
+
+        Args:
+          reference_border: Reference border of the lane section.
+          borders: Borders, ordered from the inside to the outside.
+
+        Returns:
+          True if the borders can be flattened.
+        """
+        if not borders:
+            return False
+
+        previous_borders = set()
+        for border in borders:
+            if border.reference is reference_border:
+                if border.ref_offset != borders[0].ref_offset:
+                    return False
+            elif id(border.reference) not in previous_borders or border.ref_offset:
+                return False
+            previous_borders.add(id(border))
+
+        return True
+
+    def clear_cache(self):
+        """Remove the last calculated positions, e.g. after widths of the borders changed.
+
+        Border.clear_cache of a changed border calls this as well.
+        """
+        self._last_batch = None
+
+    def _calc_batch(self, s_positions: np.ndarray, is_last_pos):
+        """Calculate the reference border, the widths and the positions of all borders.
+
+        Args:
+          s_positions: Array of positions in the lane section.
+          is_last_pos: Bool or array of bools, whether a position is the last one
+            of a ParametricLane.
+
+        Returns:
+          Tuple of the reference coordinates (N, 2), the direction angles (N,),
+          the normal vectors (N, 2), the widths (borders, N) and
+          the coordinates of the borders (borders, N, 2).
+        """
+        s_positions = np.where(np.isclose(s_positions, 0), 0.0, s_positions)
+
+        ref_coords, tang_angles = self.reference_border.calc_many(
+            self.ref_offset + s_positions, is_last_pos=is_last_pos
+        )
+        ortho = tang_angles + np.pi / 2
+        normals = np.column_stack((np.cos(ortho), np.sin(ortho)))
+
+        widths = np.empty((len(self.borders), s_positions.size))
+        coords = np.empty((len(self.borders), s_positions.size, 2))
+        for row, (border, parent) in enumerate(zip(self.borders, self._parents)):
+            widths[row] = border.calc_widths(s_positions, is_last_pos)
+            base = ref_coords if parent < 0 else coords[parent]
+            coords[row] = base + widths[row][:, np.newaxis] * normals
+
+        return ref_coords, tang_angles, normals, widths, coords
+
+    def _get_batch(self, s_positions: np.ndarray, is_last_pos):
+        """Get the batch of the positions, which is kept for the last positions,
+        as the adjacent lanes usually ask for the same ones."""
+        key = (s_positions.tobytes(), np.asarray(is_last_pos).tobytes())
+        if self._last_batch is None or self._last_batch[0] != key:
+            self._last_batch = (key, self._calc_batch(s_positions, is_last_pos))
+        return self._last_batch[1]
+
+    def calc_all(
+        self, s_positions, is_last_pos=False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate all borders at several positions at once.
+
+        Args:
+          s_positions: Array of positions in the lane section (specified in
+            curve parameter ds).
+          is_last_pos: Bool or array of bools, whether a position is the last one
+            of a ParametricLane. (Default value = False)
+
+        Returns:
+          Array of shape (borders, N, 2) with the cartesian coordinates and
+          array of shape (N,) with the direction angles in radians.
+        """
+        s_positions = np.asarray(s_positions, dtype=float).ravel()
+        _, tang_angles, _, _, coords = self._get_batch(s_positions, is_last_pos)
+
+        return coords, tang_angles
+
+    def calc_many(
+        self, row: int, s_positions, width_offset=0.0, is_last_pos=False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate one border at several positions, see Border.calc_many.
+
+        Args:
+          row: Index of the border in borders.
+          s_positions: Array of positions in the lane section.
+          width_offset: Offset or array of offsets to add to the width
+            of the border. (Default value = 0.0)
+          is_last_pos: Bool or array of bools, whether a position is the last one
+            of a ParametricLane. (Default value = False)
+
+        Returns:
+          Array of shape (N, 2) with cartesian coordinates and
+          array of shape (N,) with the direction angles in radians.
+        """
+        s_positions = np.asarray(s_positions, dtype=float).ravel()
+        ref_coords, tang_angles, normals, widths, coords = self._get_batch(
+            s_positions, is_last_pos
+        )
+
+        parent = self._parents[row]
+        base = ref_coords if parent < 0 else coords[parent]
+        distances = widths[row] + width_offset
+
+        return base + distances[:, np.newaxis] * normals, tang_angles
@@ -19,6 +19,9 @@ __maintainer__ = "Benjamin Orthen"
 __email__ = "commonroad-i06@in.tum.de"
 __status__ = "Released"
 
+# shortest interval between two vertices which is bisected by adaptive sampling
+MIN_ADAPTIVE_STEP = 0.01
+
 
 class ParametricLaneBorderGroup:
     """Group Borders and BorderOffsets of ParametricLanes into one class.
@@ -81,6 +84,39 @@ class ParametricLaneBorderGroup:
             select_offset + s_pos, width_offset=width_offset, is_last_pos=is_last_pos
         )
 
+    def calc_border_position_many(
+        self, border: str, s_positions: np.ndarray, width_offset=0.0, is_last_pos=False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calc vertices points of inner or outer Border at several positions.
+
+        Args:
+          border: Which border to calculate (inner or outer).
+          s_positions: Array of positions of parameter ds where to calc the
+            Cartesian coordinates
+          width_offset: Offset or array of offsets to add to calculated width in reference
+            to the reference border. (Default value = 0.0)
+          is_last_pos: Bool or array of bools, whether a position is the
+            last one of the ParametricLane. (Default value = False)
+
+        Returns:
+          Array of shape (N, 2) with the Cartesian coordinates of the points
+          and array of shape (N,) with the tangential directions.
+
+        """
+        if border not in ("inner", "outer"):
+            raise ValueError("Border specified must be 'inner' or 'outer'!")
+
+        select_border = self.inner_border if border == "inner" else self.outer_border
+        select_offset = (
+            self.inner_border_offset if border == "inner" else self.outer_border_offset
+        )
+
+        return select_border.calc_many(
+            select_offset + s_positions,
+            width_offset=width_offset,
+            is_last_pos=is_last_pos,
+        )
+
     def get_width_coefficients(self) -> list:
         """Get the width coefficients which apply to this ParametricLane.
 
@@ -98,7 +134,7 @@ class ParametricLane:
 
     Attributes:
       border_group (ParametricLaneBorderGroup): Reference to object which manages borders.
-      id_ (str): Unique string identifier.
+      id_ (int): Unique identifier, see encode_road_section_lane_width_id.
       type_ (str): Identifies type of ParametricLane.
       length (float): Length of ParametricLane.
 
@@ -106,7 +142,7 @@ class ParametricLane:
 
     def __init__(
         self,
-        id_: str,
+        id_: int,
         type_: str,
         border_group: ParametricLaneBorderGroup,
         length: float = None,
@@ -146,6 +182,35 @@ class ParametricLane:
             border, border_pos, width_offset, is_last_pos
         )
 
+    def calc_border_many(
+        self, border: str, s_positions: np.ndarray, width_offset=0.0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calc vertices points of inner or outer Border at several positions.
+
+        Args:
+          border: Which border to calculate (inner or outer).
+          s_positions: Array of positions of parameter ds where to calc the
+            Cartesian coordinates
+          width_offset: Offset or array of offsets to add to calculated width in reference
+           to the reference border. (Default value = 0.0)
+
+        Returns:
+          Array of shape (N, 2) with the Cartesian coordinates of the points
+          and array of shape (N,) with the tangential directions.
+
+        """
+        s_positions = np.asarray(s_positions, dtype=float)
+        if self.reverse:
+            border_positions = self.length - s_positions
+        else:
+            border_positions = s_positions
+
+        is_last_pos = np.isclose(self.length, border_positions)
+
+        return self.border_group.calc_border_position_many(
+            border, border_positions, width_offset, is_last_pos
+        )
+
     def calc_width(self, s_pos: float) -> float:
         """Calc width of border at position s_pos.
 
@@ -273,35 +338,127 @@ class ParametricLane:
             last_width_difference,
         )
 
-    def calc_vertices(self, precision: float = 0.5) -> Tuple[np.ndarray, np.ndarray]:
+    def calc_vertices(
+        self, precision: float = 0.5, max_chord_error: float = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """Convert a ParametricLane to Lanelet.
 
         Args:
           plane_group: PlaneGroup which should be referenced by created Lanelet.
           precision: Number which indicates at which space interval (in curve parameter ds)
             the coordinates of the boundaries should be calculated.
+          max_chord_error: If given, the vertices are placed adaptively instead, so that
+            the chords between them deviate at most this distance from the borders.
+            (Default value = None)
 
         Returns:
            Created Lanelet, with left, center and right vertices and a lanelet_id.
 
         """
 
-        num_steps = int(max(3, np.ceil(self.length / float(precision))))
+        if max_chord_error is not None:
+            return self._calc_adaptive_vertices(max_chord_error)
 
+        num_steps = int(max(3, np.ceil(self.length / float(precision))))
         poses = np.linspace(0, self.length, num_steps)
 
-        left_vertices = []
-        right_vertices = []
+        # calculate left and right vertices of lanelet
+        left_vertices, _ = self.calc_border_many("inner", poses)
+        right_vertices, _ = self.calc_border_many("outer", poses)
+        return (left_vertices, right_vertices)
+
+    def _calc_adaptive_vertices(
+        self, max_chord_error: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate vertices of the inner and outer border at positions where
+        the chords between them deviate at most max_chord_error from the borders.
+
+        Starting with the two halves of the ParametricLane, an interval is bisected
+        as long as a border deviates too much from the chord at a quarter,
+        half or three quarters of the interval. So curves and changing widths
+        are sampled densely and straight sections with constant width sparsely.
+        All intervals of a bisection level are checked with one evaluation
+        of each border.
 
-        # width difference between original_width and width with merge algo applied
+        Args:
+          max_chord_error: Maximal distance between a chord and a border.
 
-        # calculate left and right vertices of lanelet
-        for pos in poses:
-            inner_pos = self.calc_border("inner", pos)[0]
-            outer_pos = self.calc_border("outer", pos)[0]
-            left_vertices.append(inner_pos)
-            right_vertices.append(outer_pos)
-        return (np.array(left_vertices), np.array(right_vertices))
+        Returns:
+          Vertices of the inner and outer border, ordered along the ParametricLane
+          and including its start and end.
+
+        """
+        if max_chord_error <= 0:
+            raise ValueError("max_chord_error has to be positive.")
+
+        def calc_points(s_positions):
+            return [
+                self.calc_border_many(border, s_positions)[0]
+                for border in ("inner", "outer")
+            ]
+
+        # start with the two halves of the ParametricLane
+        starts = np.array([0.0, self.length / 2])
+        ends = np.array([self.length / 2, self.length])
+        middles = (starts + ends) / 2
+        # points of the borders at start, middle and end of each interval
+        border_points = [
+            np.stack([points[[0, 2]], points[[1, 3]], points[[2, 4]]], axis=1)
+            for points in calc_points(
+                [starts[0], middles[0], starts[1], middles[1], ends[1]]
+            )
+        ]
+
+        positions = [starts[:1]]
+        vertices = [[points[:1, 0]] for points in border_points]
+
+        def add_vertices(accepted):
+            positions.append(ends[accepted])
+            for border_vertices, points in zip(vertices, border_points):
+                border_vertices.append(points[accepted, 2])
+
+        while starts.size:
+            bisect = ends - starts > MIN_ADAPTIVE_STEP
+            add_vertices(~bisect)
+            starts, ends = starts[bisect], ends[bisect]
+            border_points = [points[bisect] for points in border_points]
+            if not starts.size:
+                break
+
+            middles = (starts + ends) / 2
+            quarter_points = [
+                np.split(points, 2)
+                for points in calc_points(
+                    np.concatenate([(starts + middles) / 2, (middles + ends) / 2])
+                )
+            ]
+            bisect = np.logical_or.reduce(
+                [
+                    _exceeds_chord_error(points, quarters, max_chord_error)
+                    for points, quarters in zip(border_points, quarter_points)
+                ]
+            )
+            add_vertices(~bisect)
+
+            # the quarter points are the middles of the halves of an interval
+            border_points = [
+                np.concatenate(
+                    [
+                        np.stack([points[:, 0], first, points[:, 1]], axis=1)[bisect],
+                        np.stack([points[:, 1], third, points[:, 2]], axis=1)[bisect],
+                    ]
+                )
+                for points, (first, third) in zip(border_points, quarter_points)
+            ]
+            starts, ends = (
+                np.concatenate([starts[bisect], middles[bisect]]),
+                np.concatenate([middles[bisect], ends[bisect]]),
+            )
+
+        order = np.argsort(np.concatenate(positions))
+        return tuple(
+            np.concatenate(border_vertices)[order] for border_vertices in vertices
+        )
 
     def zero_width_change_positions(self) -> float:
         """Position where the inner and outer Border have zero minimal distance change.
@@ -370,3 +527,41 @@ class ParametricLane:
 
         max_idx = np.argmax(pos_and_val, axis=0)[1]
         return tuple(pos_and_val[max_idx])
+
+
+def _exceeds_chord_error(
+    border_points: np.ndarray,
+    quarter_points: Tuple[np.ndarray, np.ndarray],
+    max_chord_error: float,
+) -> np.ndarray:
+    """Check for intervals whether a border deviates too much from the chord
+    between the start and end of the interval.
+
+    Args:
+      border_points: Array of shape (N, 3, 2) with the points of the border at
+        start, middle and end of each interval.
+      quarter_points: Arrays of shape (N, 2) with the points of the border at
+        a quarter and three quarters of each interval.
+      max_chord_error: Maximal distance between a chord and the border.
+
+    Returns:
+      Array of shape (N,) which is True for intervals exceeding max_chord_error.
+
+    """
+    exceeds = np.zeros(len(border_points), dtype=bool)
+    chord_start = border_points[:, 0]
+    chord = border_points[:, 2] - chord_start
+    chord_length = np.hypot(chord[:, 0], chord[:, 1])
+    has_length = chord_length > 0
+    for point in (quarter_points[0], border_points[:, 1], quarter_points[1]):
+        offset = point - chord_start
+        deviation = np.hypot(offset[:, 0], offset[:, 1])
+        deviation[has_length] = (
+            np.abs(
+                chord[has_length, 0] * offset[has_length, 1]
+                - chord[has_length, 1] * offset[has_length, 0]
+            )
+            / chord_length[has_length]
+        )
+        exceeds |= deviation > max_chord_error
+    return exceeds
@@ -4,7 +4,6 @@
 associated parametric lanes."""
 
 from typing import Tuple
-import math
 import copy
 import numpy as np
 
@@ -70,9 +69,14 @@ class ParametricLaneGroup:
         Args:
           plane_list: List with ParametricLane objects.
         """
-        for plane in plane_list:
-            self.parametric_lanes.append(plane)
-            self._add_geo_length(plane.length)
+        self.parametric_lanes.extend(plane_list)
+
+        # accumulate the lengths in one allocation instead of one per plane
+        geo_lengths = np.ravel(self._geo_lengths)
+        accumulated_lengths = np.cumsum(
+            np.concatenate((geo_lengths[-1:], [plane.length for plane in plane_list]))
+        )
+        self._geo_lengths = np.concatenate((geo_lengths, accumulated_lengths[1:]))
 
     def _add_geo_length(self, length: float, reverse: bool = False):
         """Add length of a ParametricLane to the array which keeps track
@@ -125,12 +129,16 @@ class ParametricLaneGroup:
             [plane.has_zero_width_everywhere() for plane in self.parametric_lanes]
         )
 
-    def to_lanelet(self, precision: float = 0.5) -> ConversionLanelet:
+    def to_lanelet(
+        self, precision: float = 0.5, max_chord_error: float = None
+    ) -> ConversionLanelet:
         """Convert a ParametricLaneGroup to a Lanelet.
 
         Args:
           precision: Number which indicates at which space interval (in curve parameter ds)
             the coordinates of the boundaries should be calculated.
+          max_chord_error: If given, the vertices are placed adaptively instead of
+            with precision, see ParametricLane.calc_vertices. (Default value = None)
           mirror_border: Which lane to mirror, if performing merging or splitting of lanes.
           distance: Distance at start and end of lanelet, which mirroring lane should
             have from the other lane it mirrors.
@@ -139,29 +147,34 @@ class ParametricLaneGroup:
           Created Lanelet.
 
         """
-        left_vertices, right_vertices = np.array([]), np.array([])
+        left_segments, right_segments = [], []
 
         for parametric_lane in self.parametric_lanes:
 
             local_left_vertices, local_right_vertices = parametric_lane.calc_vertices(
-                precision=precision
+                precision=precision, max_chord_error=max_chord_error
             )
             if local_left_vertices is None:
                 continue
-            try:
-                if np.isclose(left_vertices[-1], local_left_vertices[0]).all():
-                    idx = 1
-                else:
-                    idx = 0
-                left_vertices = np.vstack((left_vertices, local_left_vertices[idx:]))
-                right_vertices = np.vstack((right_vertices, local_right_vertices[idx:]))
-            except IndexError:
-                left_vertices = local_left_vertices
-                right_vertices = local_right_vertices
-
-        center_vertices = np.array(
-            [(l + r) / 2 for (l, r) in zip(left_vertices, right_vertices)]
-        )
+            # skip first vertex if it is the last one of the previous parametric lane
+            if (
+                left_segments
+                and np.isclose(left_segments[-1][-1], local_left_vertices[0]).all()
+            ):
+                local_left_vertices = local_left_vertices[1:]
+                local_right_vertices = local_right_vertices[1:]
+            left_segments.append(local_left_vertices)
+            right_segments.append(local_right_vertices)
+
+        # copy each segment once into arrays of the final size
+        num_vertices = sum(len(segment) for segment in left_segments)
+        left_vertices = np.empty((num_vertices, 2))
+        right_vertices = np.empty((num_vertices, 2))
+        if left_segments:
+            np.concatenate(left_segments, out=left_vertices)
+            np.concatenate(right_segments, out=right_vertices)
+
+        center_vertices = (left_vertices + right_vertices) / 2
         
         # speed_limit
         if(self.speed != {}):
@@ -178,39 +191,95 @@ class ParametricLaneGroup:
 
         return lanelet
 
-    def calc_border(self, border: str, s_pos: float, width_offset: float = 0.0):
+    def calc_border(self, border: str, s_pos, width_offset=0.0):
         """Calc vertices point of inner or outer Border.
 
         Args:
           border: Which border to calculate (inner or outer).
-          s_pos: Position of parameter ds where to calc the
+          s_pos: Position or array of positions of parameter ds where to calc the
         Cartesian coordinates
-          width_offset: Offset to add to calculated width in reference
+          width_offset: Offset or array of offsets to add to calculated width in reference
            to the reference border. (Default value = 0.0)
 
         Returns:
           Cartesian coordinates of point on inner border
-            and tangential direction, too.
+            and tangential direction, too. For an array of positions,
+            an array of shape (N, 2) with the coordinates and an array
+            of shape (N,) with the tangential directions.
+
+        """
+        if np.ndim(s_pos) > 0:
+            return self.calc_border_many(border, s_pos, width_offset)
+
+        plane_idx = self._get_plane_indices(s_pos)
+        return self.parametric_lanes[plane_idx].calc_border(
+            border, s_pos - self._geo_lengths[plane_idx], width_offset
+        )
+
+    def calc_border_many(
+        self, border: str, s_positions: np.ndarray, width_offset=0.0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calc border positions according to parametric_lane_group
+        at several positions.
+
+        Args:
+          border: Which border to calculate (inner or outer).
+          s_positions: Array of positions of parameter ds where to calc the
+            Cartesian coordinates
+          width_offset: Offset or array of offsets to add to calculated width in
+            reference to the reference border. (Default value = 0.0)
+
+        Returns:
+          Array of shape (N, 2) with the Cartesian coordinates of the points
+          and array of shape (N,) with the tangential directions.
+
+        """
+        s_positions = np.asarray(s_positions, dtype=float).ravel()
+        width_offsets = np.broadcast_to(width_offset, s_positions.shape)
+        coords = np.empty((s_positions.size, 2))
+        tangents = np.empty(s_positions.size)
+
+        plane_indices = self._get_plane_indices(s_positions)
+        for plane_idx in np.unique(plane_indices):
+            selection = plane_indices == plane_idx
+            coords[selection], tangents[selection] = self.parametric_lanes[
+                plane_idx
+            ].calc_border_many(
+                border,
+                s_positions[selection] - self._geo_lengths[plane_idx],
+                width_offsets[selection],
+            )
+
+        return coords, tangents
+
+    def _get_plane_indices(self, s_positions):
+        """Get the indices of the parametric lanes at the positions.
+
+        Args:
+          s_positions: Position or array of positions of parameter ds.
 
+        Returns:
+          Index or array with the index of the parametric lane of each position.
+
+        Raises:
+          Exception: If a position is after the end of the last parametric lane.
         """
-        try:
-            # get index of geometry which is at s_pos
-            mask = self._geo_lengths > s_pos
-            sub_idx = np.argmin(self._geo_lengths[mask] - s_pos)
-            plane_idx = np.arange(self._geo_lengths.shape[0])[mask][sub_idx] - 1
-        except ValueError:
+        last_idx = self._geo_lengths.size - 2
+        plane_indices = (
+            np.searchsorted(self._geo_lengths, s_positions, side="right") - 1
+        )
+        after_end = plane_indices > last_idx
+        if np.any(after_end):
             # s_pos is after last geometry because of rounding error
-            if np.isclose(s_pos, self._geo_lengths[-1]):
-                plane_idx = self._geo_lengths.size - 2
-            else:
+            outside = after_end & ~np.isclose(s_positions, self._geo_lengths[-1])
+            if np.any(outside):
+                s_pos = np.asarray(s_positions)[outside][0]
                 raise Exception(
                     f"Tried to calculate a position outside of the borders of the reference path at s={s_pos}"
                     f", but path has only length of l={ self._geo_lengths[-1]}"
                 )
 
-        return self.parametric_lanes[plane_idx].calc_border(
-            border, s_pos - self._geo_lengths[plane_idx], width_offset
-        )
+        return np.clip(plane_indices, 0, last_idx)
 
     def to_lanelet_with_mirroring(
         self,
@@ -222,6 +291,10 @@ class ParametricLaneGroup:
     ):
         """Convert a ParametricLaneGroup to a Lanelet with mirroring one of the borders.
 
+        All positions are calculated at once. Inside of the mirror interval,
+        the mirrored border is limited by the original border and the border
+        of the adjacent lanelet.
+
         Args:
           precision: Number which indicates at which space interval (in curve parameter ds)
             the coordinates of the boundaries should be calculated.
@@ -233,6 +306,55 @@ class ParametricLaneGroup:
         Returns:
           Created Lanelet.
 
+        """
+        poses = self._calc_border_positions(precision)
+        inner_pos = self.calc_border_many("inner", poses)[0]
+        outer_pos = self.calc_border_many("outer", poses)[0]
+
+        # if not mirroring lane or outside of range
+        outside = (
+            (poses < mirror_interval[0]) | (poses > mirror_interval[1])
+        ) & ~np.isclose(poses, mirror_interval[1])
+        inside = ~outside
+
+        if mirror_border not in ("left", "right"):
+            return self._create_lanelet(inner_pos[outside], outer_pos[outside])
+
+        if not np.any(inside):
+            return self._create_lanelet(inner_pos, outer_pos)
+
+        width_offset = self._calc_mirror_width_offsets(
+            distance, mirror_interval, poses[inside]
+        )
+        # mirroring the left border moves the inner border and changes the outer one
+        mirrored_vertices = outer_pos if mirror_border == "left" else inner_pos
+        mirrored_vertices[inside] = self._mirror_vertices(
+            mirror_border,
+            poses,
+            outside,
+            width_offset,
+            {"inner": inner_pos[inside], "outer": outer_pos[inside]},
+            adjacent_lanelet,
+        )
+
+        return self._create_lanelet(inner_pos, outer_pos)
+
+    def _calc_mirror_width_offsets(
+        self,
+        distance: Tuple[float, float],
+        mirror_interval: Tuple[float, float],
+        s_positions: np.ndarray,
+    ) -> np.ndarray:
+        """Interpolate the distance of the mirroring linearly over the mirror interval.
+
+        Args:
+          distance: Distance at start and end of the mirror interval.
+          mirror_interval: Position at start and end of mirroring.
+          s_positions: Positions where to calculate the width offsets.
+
+        Returns:
+          Array with the width offsets at the positions.
+
         """
         linear_distance_poly = np.polyfit(mirror_interval, distance, 1)
         distance_poly1d = np.poly1d(linear_distance_poly)
@@ -240,84 +362,79 @@ class ParametricLaneGroup:
 
         if self.parametric_lanes[0].reverse:
             global_distance[:] = [-x for x in global_distance]
-        left_vertices, right_vertices = [], []
 
-        last_width_difference = 0
-        poses = self._calc_border_positions(precision)
         distance_slope = (global_distance[1] - global_distance[0]) / self.length
-        for pos in poses:
-            inner_pos = self.calc_border("inner", pos)[0]
-            outer_pos = self.calc_border("outer", pos)[0]
-            original_width = np.linalg.norm(inner_pos - outer_pos)
+        return distance_slope * s_positions + global_distance[0]
 
-            # if not mirroring lane or outside of range
-            if (
-                pos < mirror_interval[0] or pos > mirror_interval[1]
-            ) and not np.isclose(pos, mirror_interval[1]):
-                left_vertices.append(inner_pos)
-                right_vertices.append(outer_pos)
-                last_width_difference = 0
+    def _mirror_vertices(
+        self,
+        mirror_border: str,
+        poses: np.ndarray,
+        outside: np.ndarray,
+        width_offset: np.ndarray,
+        vertices: dict,
+        adjacent_lanelet: ConversionLanelet,
+    ) -> np.ndarray:
+        """Calculate the vertices of the mirroring border inside of the mirror interval.
 
-            else:
-                # calculate positions of adjacent lanelet because new width of lanelet
-                # cannot be more than width of adjacent lanelet and original width
-                adj_inner_pos = adjacent_lanelet.calc_border("inner", pos)[0]
-                adj_outer_pos = adjacent_lanelet.calc_border("outer", pos)[0]
-                adjacent_width = np.linalg.norm(adj_inner_pos - adj_outer_pos)
-                local_width_offset = distance_slope * pos + global_distance[0]
-
-                if mirror_border == "left":
-                    new_outer_pos = self.calc_border("inner", pos, local_width_offset)[
-                        0
-                    ]
-                    modified_width = np.linalg.norm(new_outer_pos - inner_pos)
-
-                    # change width s.t. it does not mirror inner border but instead
-                    # outer border
-                    local_width_offset = (
-                        math.copysign(1, local_width_offset) * last_width_difference
-                    )
-                    if modified_width < original_width:
-                        right_vertices.append(
-                            self.calc_border("outer", pos, local_width_offset)[0]
-                        )
-                    elif modified_width > original_width + adjacent_width:
-                        right_vertices.append(adj_outer_pos)
-                    else:
-                        right_vertices.append(new_outer_pos)
-                        last_width_difference = abs(modified_width - original_width)
-
-                    left_vertices.append(inner_pos)
-                elif mirror_border == "right":
-                    new_inner_pos = self.calc_border("outer", pos, local_width_offset)[
-                        0
-                    ]
-                    modified_width = np.linalg.norm(new_inner_pos - outer_pos)
-
-                    local_width_offset = (
-                        math.copysign(1, local_width_offset) * last_width_difference
-                    )
-                    if modified_width < original_width:
-                        left_vertices.append(
-                            self.calc_border("inner", pos, local_width_offset)[0]
-                        )
-                    elif modified_width > original_width + adjacent_width:
-                        left_vertices.append(adj_inner_pos)
-                    else:
-                        left_vertices.append(new_inner_pos)
-                        last_width_difference = abs(modified_width - original_width)
-
-                    right_vertices.append(outer_pos)
-
-        left_vertices, right_vertices = (
-            np.array(left_vertices),
-            np.array(right_vertices),
-        )
-        # right_vertices = np.array(right_vertices)
+        The border which is mirrored is moved by width_offset. The new width
+        is limited by the original width and the width of the adjacent lanelet.
 
-        center_vertices = np.array(
-            [(l + r) / 2 for (l, r) in zip(left_vertices, right_vertices)]
+        Args:
+          mirror_border: Which lane to mirror, left or right.
+          poses: Positions of all vertices.
+          outside: Mask of the positions outside of the mirror interval.
+          width_offset: Width offsets at the positions inside of the mirror interval.
+          vertices: Inner and outer vertices at the positions inside of the mirror interval.
+          adjacent_lanelet: Lanelet, which limits the new width.
+
+        Returns:
+          Array with the vertices of the mirroring border inside of the mirror interval.
+
+        """
+        inside_poses = poses[~outside]
+        borders = ("inner", "outer") if mirror_border == "left" else ("outer", "inner")
+
+        # calculate positions of adjacent lanelet because new width of lanelet
+        # cannot be more than width of adjacent lanelet and original width
+        adjacent_vertices = {
+            border: adjacent_lanelet.calc_border_many(border, inside_poses)[0]
+            for border in ("inner", "outer")
+        }
+        new_vertices = self.calc_border_many(borders[0], inside_poses, width_offset)[0]
+        narrower, wider, width_differences = _select_mirrored_widths(
+            _norms(new_vertices - vertices[borders[0]]),
+            _norms(vertices["inner"] - vertices["outer"]),
+            _norms(adjacent_vertices["inner"] - adjacent_vertices["outer"]),
         )
+        last_width_difference = _last_width_differences(outside, width_differences)
+
+        # change width s.t. it does not mirror the border but instead the other border
+        new_vertices[wider] = adjacent_vertices[borders[1]][wider]
+        if np.any(narrower):
+            new_vertices[narrower] = self.calc_border_many(
+                borders[1],
+                inside_poses[narrower],
+                np.copysign(1, width_offset[narrower])
+                * last_width_difference[narrower],
+            )[0]
+
+        return new_vertices
+
+    def _create_lanelet(
+        self, left_vertices: np.ndarray, right_vertices: np.ndarray
+    ) -> ConversionLanelet:
+        """Create a lanelet from the vertices of its borders and set its adjacent lanes.
+
+        Args:
+          left_vertices: Vertices of the left border.
+          right_vertices: Vertices of the right border.
+
+        Returns:
+          Created Lanelet.
+
+        """
+        center_vertices = (left_vertices + right_vertices) / 2
         lanelet = ConversionLanelet(
             self, left_vertices, center_vertices, right_vertices, self.id_
         )
@@ -421,3 +538,75 @@ class ParametricLaneGroup:
                 return pos, val
 
         return None, None
+
+
+def _norms(vectors: np.ndarray) -> np.ndarray:
+    """Calculate the euclidean norm of each row of an array.
+
+    The result has the same rounding as np.linalg.norm of each single vector,
+    which the width comparisons of the mirroring rely on.
+
+    Args:
+      vectors: Array of shape (N, 2).
+
+    Returns:
+      Array of shape (N,) with the norms.
+
+    """
+    return np.sqrt(np.matmul(vectors[:, np.newaxis, :], vectors[:, :, np.newaxis]))[
+        :, 0, 0
+    ]
+
+
+def _select_mirrored_widths(
+    modified_width: np.ndarray, original_width: np.ndarray, adjacent_width: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Select how the width of a mirroring lanelet is limited at each position.
+
+    Args:
+      modified_width: Width of the lanelet with the moved border.
+      original_width: Width of the lanelet without mirroring.
+      adjacent_width: Width of the adjacent lanelet.
+
+    Returns:
+      Masks of the positions where the modified width is narrower than the original
+      width and where it is wider than both widths together, and the differences
+      between the modified and the original width, which are NaN where either applies.
+
+    """
+    narrower = modified_width < original_width
+    wider = ~narrower & (modified_width > original_width + adjacent_width)
+    width_differences = np.where(
+        ~narrower & ~wider, np.abs(modified_width - original_width), np.nan
+    )
+    return narrower, wider, width_differences
+
+
+def _last_width_differences(
+    outside: np.ndarray, width_differences: np.ndarray
+) -> np.ndarray:
+    """Get the width difference of the last mirrored position before each position
+    inside of the mirror interval.
+
+    The difference is reset outside of the mirror interval, positions without a
+    difference keep the last value.
+
+    Args:
+      outside: Mask of the positions outside of the mirror interval.
+      width_differences: Differences at the positions inside of the mirror interval,
+        NaN where none is set.
+
+    Returns:
+      Array with the last width differences at the positions inside of the mirror interval.
+
+    """
+    width_difference = np.full(outside.size, np.nan)
+    width_difference[outside] = 0
+    width_difference[~outside] = width_differences
+    last_set = np.where(np.isnan(width_difference), -1, np.arange(outside.size))
+    np.maximum.accumulate(last_set, out=last_set)
+    last_width_difference = np.where(
+        last_set >= 0, width_difference[np.maximum(last_set, 0)], 0
+    )
+    # a position uses the value of its predecessor
+    return np.concatenate(([0], last_width_difference[:-1]))[~outside]
@@ -11,37 +11,94 @@ __email__ = "commonroad-i06@in.tum.de"
 __status__ = "Released"
 
 
-def encode_road_section_lane_width_id(roadId, sectionId, laneId, widthId):
-    """
+# Number of bits of the width, lane and section index in a packed lane id,
+# the road id takes the remaining bits
+WIDTH_ID_BITS = 12
+LANE_ID_BITS = 12
+SECTION_ID_BITS = 16
 
-    Args:
-      roadId:
-      sectionId:
-      laneId:
-      widthId:
+_WIDTH_ID_OFFSET = 2
+_LANE_ID_OFFSET = 1 << (LANE_ID_BITS - 1)
+_LANE_ID_SHIFT = WIDTH_ID_BITS
+_SECTION_ID_SHIFT = _LANE_ID_SHIFT + LANE_ID_BITS
+_ROAD_ID_SHIFT = _SECTION_ID_SHIFT + SECTION_ID_BITS
 
-    Returns:
 
-    """
-    return ".".join([str(roadId), str(sectionId), str(laneId), str(widthId)])
+def encode_road_section_lane_width_id(roadId, sectionId, laneId, widthId) -> int:
+    """Pack the ids of a road, lane section, lane and width into one integer.
+
+    The width, lane and section ids are stored in the lower 40 bits and the
+    road id in the bits above, so the id fits into an int64 for road ids
+    below 2**23. The id is never 0. A laneId of None, e.g. of a missing lane
+    link, gives an id which does not belong to any lane.
+    Use format_road_section_lane_width_id for a readable representation.
+
+    Args:
+      roadId: Id of the road.
+      sectionId: Index of the lane section, between 0 and 65535.
+      laneId: Id of the lane, between -2047 and 2047, or None.
+      widthId: Index of the width, between -1 and 4093.
 
+    Returns:
+      The packed id.
 
-def decode_road_section_lane_width_id(encodedString: str):
+    Raises:
+      ValueError: If an id is out of its range.
     """
+    lane_field = 0 if laneId is None else laneId + _LANE_ID_OFFSET
+    width_field = widthId + _WIDTH_ID_OFFSET
+    if not (
+        0 <= sectionId < 1 << SECTION_ID_BITS
+        and (laneId is None or 0 < lane_field < 1 << LANE_ID_BITS)
+        and 0 < width_field < 1 << WIDTH_ID_BITS
+    ):
+        raise ValueError(
+            f"Cannot encode id of road {roadId}, section {sectionId}, "
+            f"lane {laneId} and width {widthId}."
+        )
+
+    return (
+        roadId << _ROAD_ID_SHIFT
+        | sectionId << _SECTION_ID_SHIFT
+        | lane_field << _LANE_ID_SHIFT
+        | width_field
+    )
+
+
+def decode_road_section_lane_width_id(encoded_id: int):
+    """Unpack an id created by encode_road_section_lane_width_id.
 
     Args:
-      encodedString:
+      encoded_id: Packed id.
 
     Returns:
+      Tuple of road id, section index, lane id and width index.
+      The lane id is None if the id was created without a lane id.
 
     """
+    lane_field = (encoded_id >> _LANE_ID_SHIFT) & ((1 << LANE_ID_BITS) - 1)
+
+    return (
+        encoded_id >> _ROAD_ID_SHIFT,
+        (encoded_id >> _SECTION_ID_SHIFT) & ((1 << SECTION_ID_BITS) - 1),
+        None if lane_field == 0 else lane_field - _LANE_ID_OFFSET,
+        (encoded_id & ((1 << WIDTH_ID_BITS) - 1)) - _WIDTH_ID_OFFSET,
+    )
 
-    parts = encodedString.split(".")
 
-    if len(parts) != 4:
-        raise Exception()
+def format_road_section_lane_width_id(encoded_id: int) -> str:
+    """Format a packed id in the form "road.section.lane.width", e.g. "501.1.-1.-1".
+
+    Args:
+      encoded_id: Packed id.
 
-    return (int(parts[0]), int(parts[1]), int(parts[2]), int(parts[3]))
+    Returns:
+      The readable id.
+
+    """
+    return ".".join(
+        str(part) for part in decode_road_section_lane_width_id(encoded_id)
+    )
 
 
 def allCloseToZero(array):
@@ -31,9 +31,8 @@ import xml.etree.ElementTree as xml
 import re
 from lxml import etree
 
-from opendrive2lanelet.opendriveparser.parser import parse_opendrive
-from opendrive2lanelet.network import Network
 from opendrive2lanelet.osm.lanelet2osm import L2OSMConverter
+from opendrive2lanelet.io.network_cache import NetworkCache, load_opendrive_network
 
 __author__ = "Samir Tabriz"
 __version__ = "1.0.0"
@@ -43,25 +42,21 @@ __status__ = "Released"
 
 # class used to convert opendrive map to lanelet2 map
 class Opendrive2Lanelet2Convertor:
-    def __init__(self, path):
+    def __init__(self, path, cache_dir=None, max_chord_error=None):
         self.input_file_path = path
+        self.cache = NetworkCache(cache_dir) if cache_dir else None
+        self.max_chord_error = max_chord_error
 
     def convert(self, output_file_path):
-        # Open File
-        file_in = open(self.input_file_path.format(os.path.dirname(os.path.realpath(__file__))), "r")
-        
-        # Parse XML
-        tree = etree.parse(file_in)
-        root = tree.getroot()
-        open_drive = parse_opendrive(root)
+        # Parse XML and build CommonRoad Lanelet1 network
+        open_drive, road_network = load_opendrive_network(
+            self.input_file_path.format(os.path.dirname(os.path.realpath(__file__))),
+            self.cache,
+            max_chord_error=self.max_chord_error,
+        )
 
         # Access
-        header = root.find('header')
-        geoReference = header.find('geoReference').text
-
-        # Build CommonRoad Lanelet1 network
-        road_network = Network()
-        road_network.load_opendrive(open_drive)
+        geoReference = open_drive.header.geo_reference
 
         simple_geoReference = geoReference
 
@@ -73,12 +68,12 @@ class Opendrive2Lanelet2Convertor:
             simple_geoReference = simple_geoReference.replace(geoidgrids_tag, '')
             print('Used conversion projection is ' + simple_geoReference)
 
-        file_in.close()
-
         # Convert to Lanelet2 OSM
         osm_converter = L2OSMConverter(simple_geoReference)
         
-        osm_map = osm_converter(road_network.export_commonroad_scenario())
+        osm_map = osm_converter(
+            road_network.export_commonroad_scenario(max_chord_error=self.max_chord_error)
+        )
 
         # Add georeference back to osm
         geo_tag = etree.Element('geoReference')
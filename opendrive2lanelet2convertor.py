@@ -31,34 +31,41 @@ from lxml import etree
 
 from opendrive2lanelet.opendriveparser.parser import parse_opendrive
 from opendrive2lanelet.network import Network
+from opendrive2lanelet.io.xodr_file import strip_compression_suffix
 from opendrive2lanelet2.convertor.opendrive2lanelet2convertor import Opendrive2Lanelet2Convertor
 
 def main(argv):
 
     inputfile = ''
     outputfile = ''
+    cachedir = None
+    maxchorderror = None
     try:
-        opts, args = getopt.getopt(argv,"hi:o:",["ifile=","ofile="])
+        opts, args = getopt.getopt(argv,"hi:o:c:e:",["ifile=","ofile=","cachedir=","maxchorderror="])
     except getopt.GetoptError:
-        print('opendrive2lanelet2convertor.py -i <inputfile> -o <outputfile>')
+        print('opendrive2lanelet2convertor.py -i <inputfile> -o <outputfile> [-c <cachedir>] [-e <maxchorderror>]')
         sys.exit(2)
     for opt, arg in opts:
         if opt == '-h':
-            print('opendrive2lanelet2convertor.py -i <inputfile> -o <outputfile>')
+            print('opendrive2lanelet2convertor.py -i <inputfile> -o <outputfile> [-c <cachedir>] [-e <maxchorderror>]')
             sys.exit()
         elif opt in ("-i", "--ifile"):
             inputfile = arg
         elif opt in ("-o", "--ofile"):
             outputfile = arg
+        elif opt in ("-c", "--cachedir"):
+            cachedir = arg
+        elif opt in ("-e", "--maxchorderror"):
+            maxchorderror = float(arg)
     if(inputfile is not None and outputfile is not None):
-        if not inputfile.endswith(".xodr"):
+        if not strip_compression_suffix(inputfile).endswith(".xodr"):
             print('Input file must be OpenDRIVE .xodr file')
             sys.exit()
         if not outputfile.endswith(".osm"):
             print('Output file must be Lanelet2 .osm file')
             sys.exit()
         
-        open_drive2_lanelet2_convertor = Opendrive2Lanelet2Convertor(inputfile)
+        open_drive2_lanelet2_convertor = Opendrive2Lanelet2Convertor(inputfile, cachedir, maxchorderror)
         open_drive2_lanelet2_convertor.convert(outputfile)
 
 if __name__== "__main__":
@@ -28,7 +28,10 @@ setup(
         "scipy>=1.3.0",
         "lmfit"
     ],
-    extras_require={"GUI": ["PyQt5>=5.12.2", "matplotlib>=3.1.0"]},
+    extras_require={
+        "GUI": ["PyQt5>=5.12.2", "matplotlib>=3.1.0"],
+        "zstd": ["zstandard>=0.13.0"],
+    },
     python_requires=">=3.6",
     entry_points={
         "console_scripts": [
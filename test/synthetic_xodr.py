@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+"""Generator of synthetic OpenDRIVE files for the tests and benchmarks.
+
+The roads are placed in a grid and are not connected geometrically,
+but each road links to its predecessor and successor in the same row.
+All geometry types and lane sections with links and widths are used,
+so every part of the parser is exercised.
+"""
+
+import argparse
+
+__author__ = "Benjamin Orthen"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["Priority Program SPP 1835 Cooperative Interacting Automobiles"]
+__version__ = "1.1.2"
+__maintainer__ = "Benjamin Orthen"
+__email__ = "commonroad-i06@in.tum.de"
+__status__ = "Released"
+
+GEOMETRIES = (
+    "<line/>",
+    '<arc curvature="0.01"/>',
+    '<spiral curvStart="0.01" curvEnd="-0.005"/>',
+    '<poly3 a="0" b="0" c="0.001" d="0"/>',
+    '<paramPoly3 aU="0" bU="20" cU="0" dU="0" aV="0" bV="0" cV="0.8" dV="0" pRange="arcLength"/>',
+)
+
+GEOMETRY_LENGTH = 20.0
+
+ROW_LENGTH = 100
+
+
+def _lane(lane_id: int, lane_type: str = "driving") -> str:
+    return (
+        f'<lane id="{lane_id}" type="{lane_type}" level="false">'
+        f'<link><predecessor id="{lane_id}"/><successor id="{lane_id}"/></link>'
+        '<width sOffset="0" a="3.5" b="0" c="0" d="0"/>'
+        '<width sOffset="10" a="3.5" b="0.01" c="0" d="0"/>'
+        "</lane>"
+    )
+
+
+def _lane_section(s_pos: float) -> str:
+    return (
+        f'<laneSection s="{s_pos}">'
+        f'<left>{_lane(2, "sidewalk")}{_lane(1)}</left>'
+        '<center><lane id="0" type="none" level="false"/></center>'
+        f'<right>{_lane(-1)}{_lane(-2)}{_lane(-3, "sidewalk")}</right>'
+        "</laneSection>"
+    )
+
+
+def road_xml(road_id: int, num_roads: int, geometries_per_road: int = 3) -> str:
+    """Create the XML string of one road.
+
+    Args:
+      road_id: Id of the road, starting at 1.
+      num_roads: Number of roads in the file.
+      geometries_per_road: Number of geometry elements in the plan view. (Default value = 3)
+
+    Returns:
+      XML string of the road element.
+    """
+    row, column = divmod(road_id - 1, ROW_LENGTH)
+    x_start = column * geometries_per_road * GEOMETRY_LENGTH * 1.5
+    y_start = row * 100.0
+    length = geometries_per_road * GEOMETRY_LENGTH
+
+    link = "<link>"
+    if column > 0:
+        link += f'<predecessor elementType="road" elementId="{road_id - 1}" contactPoint="end"/>'
+    if column + 1 < ROW_LENGTH and road_id < num_roads:
+        link += f'<successor elementType="road" elementId="{road_id + 1}" contactPoint="start"/>'
+    link += "</link>"
+
+    geometries = "".join(
+        f'<geometry s="{i * GEOMETRY_LENGTH}" x="{x_start + i * GEOMETRY_LENGTH}" '
+        f'y="{y_start}" hdg="0" length="{GEOMETRY_LENGTH}">'
+        f"{GEOMETRIES[(road_id + i) % len(GEOMETRIES)]}</geometry>"
+        for i in range(geometries_per_road)
+    )
+
+    return (
+        f'<road name="road{road_id}" length="{length}" id="{road_id}" junction="-1">'
+        f"{link}"
+        '<type s="0" type="town"><speed max="50" unit="km/h"/></type>'
+        f"<planView>{geometries}</planView>"
+        '<elevationProfile><elevation s="0" a="0" b="0" c="0" d="0"/></elevationProfile>'
+        "<lateralProfile/>"
+        '<lanes><laneOffset s="0" a="0" b="0" c="0" d="0"/>'
+        f"{_lane_section(0)}{_lane_section(length / 2)}</lanes>"
+        "</road>"
+    )
+
+
+def write_synthetic_xodr(file_name: str, num_roads: int, geometries_per_road: int = 3):
+    """Write a synthetic OpenDRIVE file.
+
+    Args:
+      file_name: Path of the file to write.
+      num_roads: Number of roads.
+      geometries_per_road: Number of geometry elements per road. (Default value = 3)
+    """
+    with open(file_name, "w") as file_out:
+        file_out.write('<?xml version="1.0" standalone="yes"?>\n<OpenDRIVE>\n')
+        file_out.write(
+            '<header revMajor="1" revMinor="4" name="synthetic" version="1" '
+            'north="0" south="0" east="0" west="0"/>\n'
+        )
+        for road_id in range(1, num_roads + 1):
+            file_out.write(road_xml(road_id, num_roads, geometries_per_road))
+            file_out.write("\n")
+        file_out.write("</OpenDRIVE>\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic xodr file.")
+    parser.add_argument("output", help="name of the xodr file")
+    parser.add_argument("-n", "--num-roads", type=int, default=10000)
+    parser.add_argument("-g", "--geometries-per-road", type=int, default=3)
+    args = parser.parse_args()
+
+    write_synthetic_xodr(args.output, args.num_roads, args.geometries_per_road)
+
+
+if __name__ == "__main__":
+    main()
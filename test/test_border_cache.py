@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""Tests of the sample cache which is shared by all Borders."""
+
+import gc
+import unittest
+
+import numpy as np
+
+from opendrive2lanelet.opendriveparser.elements.roadPlanView import PlanView
+from opendrive2lanelet.plane_elements.border import (
+    Border,
+    BorderSampleCache,
+    CacheStatistics,
+)
+
+__author__ = "Benjamin Orthen"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["Priority Program SPP 1835 Cooperative Interacting Automobiles"]
+__version__ = "1.1.2"
+__maintainer__ = "Benjamin Orthen"
+__email__ = "commonroad-i06@in.tum.de"
+__status__ = "Released"
+
+
+def create_border(width: float = 1.0) -> Border:
+    """Create a Border with a constant width next to a straight plan view."""
+    plan_view = PlanView()
+    plan_view.addLine([0.0, 0.0], 0.0, 10.0)
+
+    border = Border()
+    border.reference = plan_view
+    border.width_coefficient_offsets = [0.0]
+    border.width_coefficients = [[width, 0.0, 0.0, 0.0]]
+    return border
+
+
+class TestBorderSampleCache(unittest.TestCase):
+    """Eviction and statistics of BorderSampleCache."""
+
+    def setUp(self):
+        self.cache = BorderSampleCache(3)
+        self.owner_a = self.cache.new_owner()
+        self.owner_b = self.cache.new_owner()
+
+    def test_evicts_least_recently_used_of_all_owners(self):
+        self.cache.put(self.owner_a, 1, "a1")
+        self.cache.put(self.owner_a, 2, "a2")
+        self.cache.put(self.owner_b, 1, "b1")
+        self.assertEqual(self.cache.get(self.owner_a, 1), "a1")
+
+        self.cache.put(self.owner_b, 2, "b2")
+
+        self.assertEqual(len(self.cache), 3)
+        self.assertIsNone(self.cache.get(self.owner_a, 2))
+        self.assertEqual(self.cache.get(self.owner_b, 1), "b1")
+        self.assertEqual(
+            self.cache.statistics(self.owner_a), CacheStatistics(1, 1, 1)
+        )
+        self.assertEqual(
+            self.cache.statistics(self.owner_b), CacheStatistics(1, 0, 2)
+        )
+        self.assertEqual(self.cache.statistics(), CacheStatistics(2, 1, 3))
+
+    def test_weighted_entries(self):
+        self.cache.put(self.owner_a, 1, "a1")
+        self.cache.put(self.owner_a, 2, "a2")
+        self.cache.put(self.owner_b, 1, "b1", weight=2)
+
+        self.assertEqual(len(self.cache), 3)
+        self.assertIsNone(self.cache.get(self.owner_a, 1))
+        self.assertEqual(self.cache.get(self.owner_a, 2), "a2")
+
+        # entries larger than the cache are not stored
+        self.cache.put(self.owner_a, 3, "a3", weight=4)
+        self.assertIsNone(self.cache.get(self.owner_a, 3))
+        self.assertEqual(self.cache.statistics(), CacheStatistics(1, 2, 3))
+
+    def test_clear_owner(self):
+        self.cache.put(self.owner_a, 1, "a1")
+        self.cache.put(self.owner_b, 1, "b1")
+        self.cache.get(self.owner_a, 1)
+
+        self.cache.clear(self.owner_a)
+
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.statistics(self.owner_a), CacheStatistics())
+        self.assertEqual(self.cache.get(self.owner_b, 1), "b1")
+
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.statistics(), CacheStatistics())
+
+
+class TestBorderCache(unittest.TestCase):
+    """Caching of Border.calc and Border.calc_many in the shared cache."""
+
+    def setUp(self):
+        self.default_cache = Border.sample_cache
+        Border.sample_cache = BorderSampleCache(8)
+
+    def tearDown(self):
+        Border.sample_cache = self.default_cache
+
+    def test_calc_many_is_cached(self):
+        border = create_border()
+        positions = np.linspace(0, 10, 5)
+
+        coords, _ = border.calc_many(positions)
+        coords[:] = 0
+        cached_coords, _ = border.calc_many(positions)
+
+        self.assertEqual(border.cache_statistics, CacheStatistics(1, 1, 5))
+        np.testing.assert_allclose(cached_coords[:, 1], np.ones(5))
+        np.testing.assert_allclose(cached_coords[:, 0], positions, atol=1e-12)
+
+    def test_size_is_bounded_for_all_borders(self):
+        borders = [create_border(width) for width in (1.0, 2.0, 3.0)]
+        for border in borders:
+            border.calc_many(np.linspace(0, 10, 5))
+            border.calc(5.0)
+
+        self.assertLessEqual(len(Border.sample_cache), 8)
+        self.assertEqual(borders[0].cache_statistics, CacheStatistics(0, 2, 0))
+        self.assertEqual(borders[2].cache_statistics, CacheStatistics(0, 2, 6))
+
+    def test_samples_of_collected_borders_are_removed(self):
+        border = create_border()
+        border.calc_many(np.linspace(0, 10, 5))
+        self.assertEqual(len(Border.sample_cache), 5)
+
+        del border
+        gc.collect()
+
+        self.assertEqual(len(Border.sample_cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
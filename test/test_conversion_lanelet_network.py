@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""Tests of the planning of lanelet concatenations in ConversionLaneletNetwork."""
+
+import unittest
+
+from opendrive2lanelet.conversion_lanelet_network import (
+    ConversionLaneletNetwork,
+    _find_chain_start,
+)
+
+__author__ = "Benjamin Orthen"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["Priority Program SPP 1835 Cooperative Interacting Automobiles"]
+__version__ = "1.1.2"
+__maintainer__ = "Benjamin Orthen"
+__email__ = "commonroad-i06@in.tum.de"
+__status__ = "Released"
+
+
+class TestFindChainStart(unittest.TestCase):
+    """Lookup of the first lanelet of a chain."""
+
+    def test_not_concatenated(self):
+        self.assertEqual(_find_chain_start({2: 1}, 5), 5)
+        self.assertEqual(_find_chain_start({2: 1}, 1), 1)
+
+    def test_halves_paths(self):
+        concatenated_to = {2: 1, 3: 2, 4: 3, 5: 4}
+
+        self.assertEqual(_find_chain_start(concatenated_to, 5), 1)
+        self.assertEqual(concatenated_to, {2: 1, 3: 1, 4: 3, 5: 3})
+
+        self.assertEqual(_find_chain_start(concatenated_to, 5), 1)
+        self.assertEqual(_find_chain_start(concatenated_to, 4), 1)
+        self.assertEqual(concatenated_to, {2: 1, 3: 1, 4: 1, 5: 1})
+
+
+class TestPlanConcatenation(unittest.TestCase):
+    """Resolution of groups of (lanelet, successor) pairs into chains."""
+
+    def plan(self, concatenate_lanelets):
+        return ConversionLaneletNetwork._plan_concatenation(concatenate_lanelets)
+
+    def test_chain(self):
+        self.assertEqual(self.plan([[(1, 2), (2, 3), (3, 4)]]), [[1, 2, 3, 4]])
+
+    def test_chain_defined_backwards(self):
+        self.assertEqual(self.plan([[(3, 4)], [(2, 3)], [(1, 2)]]), [[1, 2, 3, 4]])
+
+    def test_disjoint_chains(self):
+        self.assertEqual(
+            self.plan([[(1, 2), (10, 11)], [(2, 3)], [(11, 12)]]),
+            [[1, 2, 3], [10, 11, 12]],
+        )
+
+    def test_pair_of_removed_lanelet(self):
+        # 2 is already concatenated to 1, so its successor is appended to 1
+        self.assertEqual(self.plan([[(1, 2)], [(2, 3)]]), [[1, 2, 3]])
+
+    def test_pair_with_removed_successor(self):
+        # 2 is already concatenated to 1, so the chain of 1 is appended to 3
+        self.assertEqual(self.plan([[(1, 2)], [(3, 2)]]), [[3, 1, 2]])
+
+    def test_branch(self):
+        self.assertEqual(self.plan([[(1, 2)], [(1, 3)]]), [[1, 2, 3]])
+
+    def test_cycle(self):
+        self.assertEqual(self.plan([[(1, 2), (2, 3), (3, 1)]]), [[1, 2, 3]])
+        self.assertEqual(self.plan([[(1, 2)], [(2, 1)]]), [[1, 2]])
+
+    def test_lanelet_concatenated_to_itself(self):
+        self.assertEqual(self.plan([[(1, 1)]]), [])
+        self.assertEqual(self.plan([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
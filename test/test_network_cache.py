@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""Tests of the on-disk cache of parsed OpenDRIVE files and loaded networks."""
+
+import os
+import tempfile
+import unittest
+
+from opendrive2lanelet.io.network_cache import NetworkCache, load_opendrive_network
+from opendrive2lanelet.network import Network
+from opendrive2lanelet.opendriveparser.elements.opendrive import OpenDrive
+
+from synthetic_xodr import write_synthetic_xodr
+
+__author__ = "Benjamin Orthen"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["Priority Program SPP 1835 Cooperative Interacting Automobiles"]
+__version__ = "1.1.2"
+__maintainer__ = "Benjamin Orthen"
+__email__ = "commonroad-i06@in.tum.de"
+__status__ = "Released"
+
+
+class TestNetworkCache(unittest.TestCase):
+    """Storing, loading and eviction of cache entries."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        self.cache = NetworkCache(self.cache_dir)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def store_entry(self, key: str, mtime: float) -> str:
+        """Store an empty entry and set its time of last use."""
+        self.cache.store(key, OpenDrive(), Network())
+        entry_path = self.cache._entry_path(key)
+        os.utime(entry_path, (mtime, mtime))
+        return entry_path
+
+    def test_cache_dir_is_private(self):
+        self.store_entry("a", 1000)
+
+        self.assertEqual(os.stat(self.cache_dir).st_mode & 0o777, 0o700)
+        self.assertEqual(os.stat(self.cache._entry_path("a")).st_mode & 0o077, 0)
+
+    def test_evicts_least_recently_used_entries(self):
+        entry_a = self.store_entry("a", 1000)
+        self.cache.max_size = 2 * os.path.getsize(entry_a)
+        entry_b = self.store_entry("b", 2000)
+
+        # loading marks an entry as recently used
+        self.assertIsNotNone(self.cache.load("a"))
+        self.store_entry("c", 3000)
+
+        self.assertTrue(os.path.isfile(entry_a))
+        self.assertFalse(os.path.isfile(entry_b))
+        self.assertIsNone(self.cache.load("b"))
+
+    def test_recovers_from_corrupt_entry(self):
+        with tempfile.TemporaryDirectory() as xodr_dir:
+            xodr_file = os.path.join(xodr_dir, "synthetic.xodr")
+            write_synthetic_xodr(xodr_file, 2)
+
+            key = self.cache.key(xodr_file)
+            load_opendrive_network(xodr_file, self.cache)
+            entry_path = self.cache._entry_path(key)
+            with open(entry_path, "r+b") as file_out:
+                file_out.truncate(os.path.getsize(entry_path) // 2)
+
+            self.assertIsNone(self.cache.load(key))
+            self.assertFalse(os.path.isfile(entry_path))
+
+            opendrive, _ = load_opendrive_network(xodr_file, self.cache)
+            self.assertEqual(len(opendrive.roads), 2)
+            self.assertIsNotNone(self.cache.load(key))
+
+    def test_refuses_writable_cache_dir(self):
+        self.store_entry("a", 1000)
+        os.chmod(self.cache_dir, 0o777)
+
+        with self.assertRaises(PermissionError):
+            self.cache.load("a")
+        with self.assertRaises(PermissionError):
+            self.cache.store("b", OpenDrive(), Network())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""Tests of the lookup of roads and junctions by their id."""
+
+import pickle
+import unittest
+
+from opendrive2lanelet.opendriveparser.elements.junction import Junction
+from opendrive2lanelet.opendriveparser.elements.opendrive import OpenDrive
+from opendrive2lanelet.opendriveparser.elements.road import Road
+
+__author__ = "Benjamin Orthen"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["Priority Program SPP 1835 Cooperative Interacting Automobiles"]
+__version__ = "1.1.2"
+__maintainer__ = "Benjamin Orthen"
+__email__ = "commonroad-i06@in.tum.de"
+__status__ = "Released"
+
+
+def create_road(road_id: int) -> Road:
+    """Create an empty road with an id."""
+    road = Road()
+    road.id = road_id
+    return road
+
+
+def create_junction(junction_id: int) -> Junction:
+    """Create an empty junction with an id."""
+    junction = Junction()
+    junction.id = junction_id
+    return junction
+
+
+class TestGetRoad(unittest.TestCase):
+    """OpenDrive.getRoad after modifications of OpenDrive.roads."""
+
+    def setUp(self):
+        self.opendrive = OpenDrive()
+        self.roads = [create_road(road_id) for road_id in range(5)]
+        for road in self.roads[:3]:
+            self.opendrive.addRoad(road)
+
+        # build the index before the modification
+        self.assertIs(self.opendrive.getRoad(0), self.roads[0])
+
+    def assertRoads(self, road_ids):
+        """Check that exactly the roads with these ids are found."""
+        for road in self.roads:
+            if road.id in road_ids:
+                self.assertIs(self.opendrive.getRoad(road.id), road)
+            else:
+                self.assertIsNone(self.opendrive.getRoad(road.id))
+
+    def test_append(self):
+        self.opendrive.addRoad(self.roads[3])
+        self.assertRoads({0, 1, 2, 3})
+
+    def test_insert(self):
+        self.opendrive.roads.insert(0, self.roads[3])
+        self.assertRoads({0, 1, 2, 3})
+
+    def test_remove(self):
+        self.opendrive.roads.remove(self.roads[1])
+        self.assertRoads({0, 2})
+
+    def test_slice_assignment(self):
+        self.opendrive.roads[0:2] = [self.roads[3], self.roads[4]]
+        self.assertRoads({2, 3, 4})
+
+    def test_item_assignment(self):
+        self.opendrive.roads[1] = self.roads[4]
+        self.assertRoads({0, 2, 4})
+
+    def test_extend(self):
+        self.opendrive.roads.extend(self.roads[3:])
+        self.assertRoads({0, 1, 2, 3, 4})
+
+    def test_inplace_add(self):
+        roads = self.opendrive.roads
+        roads += self.roads[3:]
+        self.assertRoads({0, 1, 2, 3, 4})
+
+    def test_delete(self):
+        del self.opendrive.roads[:2]
+        self.assertRoads({2})
+
+    def test_pop(self):
+        self.opendrive.roads.pop()
+        self.assertRoads({0, 1})
+
+    def test_clear(self):
+        self.opendrive.roads.clear()
+        self.assertRoads(set())
+
+    def test_first_road_of_an_id_is_found(self):
+        duplicate = create_road(1)
+        self.opendrive.addRoad(duplicate)
+        self.assertIs(self.opendrive.getRoad(1), self.roads[1])
+
+        self.opendrive.roads.reverse()
+        self.assertIs(self.opendrive.getRoad(1), duplicate)
+
+        # the sort is stable, so the duplicate stays in front of the first road
+        self.opendrive.roads.sort(key=lambda road: road.id)
+        self.assertIs(self.opendrive.getRoad(1), duplicate)
+
+        self.opendrive.roads.remove(duplicate)
+        self.assertIs(self.opendrive.getRoad(1), self.roads[1])
+
+    def test_pickle(self):
+        opendrive = pickle.loads(pickle.dumps(self.opendrive))
+        self.assertEqual([road.id for road in opendrive.roads], [0, 1, 2])
+        self.assertEqual(opendrive.getRoad(2).id, 2)
+
+        opendrive.addRoad(create_road(3))
+        self.assertEqual(opendrive.getRoad(3).id, 3)
+
+
+class TestGetJunction(unittest.TestCase):
+    """OpenDrive.getJunction after modifications of OpenDrive.junctions."""
+
+    def setUp(self):
+        self.opendrive = OpenDrive()
+        self.junctions = [
+            create_junction(junction_id) for junction_id in (10, 20, 30)
+        ]
+        self.opendrive.addJunction(self.junctions[0])
+        self.assertIsNone(self.opendrive.getJunction(20))
+
+    def test_modifications(self):
+        self.opendrive.addJunction(self.junctions[1])
+        self.assertIs(self.opendrive.getJunction(20), self.junctions[1])
+
+        self.opendrive.junctions.insert(0, self.junctions[2])
+        self.assertIs(self.opendrive.getJunction(30), self.junctions[2])
+
+        self.opendrive.junctions[0:1] = []
+        self.assertIsNone(self.opendrive.getJunction(30))
+
+        self.opendrive.junctions.extend([self.junctions[2]])
+        self.assertIs(self.opendrive.getJunction(30), self.junctions[2])
+
+        self.opendrive.junctions.remove(self.junctions[0])
+        self.assertIsNone(self.opendrive.getJunction(10))
+        self.assertIs(self.opendrive.getJunction(20), self.junctions[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+"""Equivalence of the tree parser and the serial and parallel streaming parser."""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from lxml import etree
+
+from opendrive2lanelet.opendriveparser.parser import (
+    parse_opendrive,
+    parse_opendrive_stream,
+    _parse_opendrive_stream_in_parallel,
+)
+
+from synthetic_xodr import road_xml
+
+__author__ = "Benjamin Orthen"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["Priority Program SPP 1835 Cooperative Interacting Automobiles"]
+__version__ = "1.1.2"
+__maintainer__ = "Benjamin Orthen"
+__email__ = "commonroad-i06@in.tum.de"
+__status__ = "Released"
+
+NUM_ROADS = 6
+
+# junction 20 is defined before, junction 10 after the roads which reference it,
+# junction 99 is referenced by road 6 but never defined
+JUNCTION_IDS = {3: 10, 4: 10, 5: 20, 6: 99}
+
+
+def junction_xml(junction_id: int, connecting_road_ids) -> str:
+    """Create the XML string of a junction with one connection per connecting road."""
+    connections = "".join(
+        f'<connection id="{i}" incomingRoad="1" connectingRoad="{road_id}" '
+        'contactPoint="start"><laneLink from="-1" to="-1"/>'
+        '<laneLink from="-2" to="-2"/></connection>'
+        for i, road_id in enumerate(connecting_road_ids)
+    )
+    return (
+        f'<junction id="{junction_id}" name="junction{junction_id}">'
+        f"{connections}</junction>"
+    )
+
+
+def write_xodr_with_junctions(file_name: str):
+    """Write a small OpenDRIVE file with junctions before and after their roads."""
+    with open(file_name, "w") as file_out:
+        file_out.write('<?xml version="1.0" standalone="yes"?>\n<OpenDRIVE>\n')
+        file_out.write(
+            '<header revMajor="1" revMinor="4" name="junctions" version="1" '
+            'north="0" south="0" east="0" west="0"/>\n'
+        )
+        file_out.write(junction_xml(20, [5]))
+        for road_id in range(1, NUM_ROADS + 1):
+            road = road_xml(road_id, NUM_ROADS)
+            if road_id in JUNCTION_IDS:
+                road = road.replace(
+                    'junction="-1"', f'junction="{JUNCTION_IDS[road_id]}"'
+                )
+            file_out.write(road + "\n")
+        file_out.write(junction_xml(10, [3, 4]))
+        file_out.write("</OpenDRIVE>\n")
+
+
+def describe(obj, visited: dict):
+    """Describe an object graph by nested tuples of its class names and attributes.
+
+    Objects which occur more than once are described by the order of their first
+    occurrence, so the descriptions of two graphs are equal if the graphs have
+    the same values and the same shared objects.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, np.ndarray):
+        return tuple(obj.ravel().tolist())
+    if isinstance(obj, (list, tuple)):
+        return tuple(describe(item, visited) for item in obj)
+    if isinstance(obj, dict):
+        return tuple((key, describe(value, visited)) for key, value in obj.items())
+
+    if id(obj) in visited:
+        return ("visited", visited[id(obj)])
+    visited[id(obj)] = len(visited)
+
+    attributes = dict(getattr(obj, "__dict__", {}))
+    for cls in type(obj).__mro__:
+        for slot in getattr(cls, "__slots__", ()):
+            if hasattr(obj, slot):
+                attributes[slot] = getattr(obj, slot)
+
+    return (type(obj).__name__,) + tuple(
+        (name, describe(value, visited))
+        for name, value in sorted(attributes.items())
+    )
+
+
+def describe_opendrive(opendrive) -> tuple:
+    """Describe the header, junctions and roads of an OpenDrive object."""
+    visited = {}
+    return (
+        describe(opendrive.header, visited),
+        describe(list(opendrive.junctions), visited),
+        describe(list(opendrive.roads), visited),
+    )
+
+
+class TestParserEquivalence(unittest.TestCase):
+    """All parsers create the same OpenDrive object."""
+
+    @classmethod
+    def setUpClass(cls):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            xodr_file = os.path.join(tmp_dir, "junctions.xodr")
+            write_xodr_with_junctions(xodr_file)
+
+            cls.tree = parse_opendrive(etree.parse(xodr_file).getroot())
+            cls.stream = parse_opendrive_stream(xodr_file)
+            cls.parallel = _parse_opendrive_stream_in_parallel(xodr_file, 2)
+
+    def test_junctions_are_resolved(self):
+        for opendrive in (self.tree, self.stream, self.parallel):
+            self.assertEqual(len(opendrive.roads), NUM_ROADS)
+            for road in opendrive.roads:
+                junction_id = JUNCTION_IDS.get(road.id)
+                if junction_id in (10, 20):
+                    self.assertIs(road.junction, opendrive.getJunction(junction_id))
+                    self.assertTrue(road.junction.connections)
+                else:
+                    self.assertIsNone(road.junction)
+
+    def test_stream_equals_tree(self):
+        self.assertEqual(
+            describe_opendrive(self.stream), describe_opendrive(self.tree)
+        )
+
+    def test_parallel_stream_equals_tree(self):
+        self.assertEqual(
+            describe_opendrive(self.parallel), describe_opendrive(self.tree)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+"""Tests of the packed ids of ParametricLanes and ConversionLanelets."""
+
+import unittest
+
+from opendrive2lanelet.utils import (
+    decode_road_section_lane_width_id,
+    encode_road_section_lane_width_id,
+    format_road_section_lane_width_id,
+)
+
+__author__ = "Benjamin Orthen"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["Priority Program SPP 1835 Cooperative Interacting Automobiles"]
+__version__ = "1.1.2"
+__maintainer__ = "Benjamin Orthen"
+__email__ = "commonroad-i06@in.tum.de"
+__status__ = "Released"
+
+
+class TestRoadSectionLaneWidthId(unittest.TestCase):
+    """Encoding and decoding of road, section, lane and width ids."""
+
+    def assertRoundTrip(self, *ids):
+        encoded_id = encode_road_section_lane_width_id(*ids)
+        self.assertNotEqual(encoded_id, 0)
+        self.assertEqual(decode_road_section_lane_width_id(encoded_id), ids)
+
+    def test_round_trip(self):
+        self.assertRoundTrip(501, 1, -1, -1)
+        self.assertRoundTrip(0, 0, 0, 0)
+        self.assertRoundTrip(12, 3, 2, 5)
+
+    def test_negative_lane_ids(self):
+        for lane_id in (-1, -2, -5, -100):
+            self.assertRoundTrip(7, 2, lane_id, 0)
+
+        # ids of the same lane section with lanes of opposite sides differ
+        self.assertNotEqual(
+            encode_road_section_lane_width_id(7, 2, -1, 0),
+            encode_road_section_lane_width_id(7, 2, 1, 0),
+        )
+
+    def test_missing_lane_id(self):
+        encoded_id = encode_road_section_lane_width_id(7, 2, None, -1)
+        self.assertEqual(
+            decode_road_section_lane_width_id(encoded_id), (7, 2, None, -1)
+        )
+        self.assertNotIn(
+            encoded_id,
+            [
+                encode_road_section_lane_width_id(7, 2, lane_id, -1)
+                for lane_id in range(-2047, 2048)
+            ],
+        )
+
+    def test_field_boundaries(self):
+        for ids in (
+            (0, 0, -2047, -1),
+            (0, 0, 2047, 4093),
+            (0, 65535, 0, 0),
+            (2 ** 23 - 1, 65535, 2047, 4093),
+            (2 ** 40, 0, 0, 0),
+        ):
+            with self.subTest(ids=ids):
+                self.assertRoundTrip(*ids)
+
+        # the largest road id of an int64 id
+        self.assertLess(
+            encode_road_section_lane_width_id(2 ** 23 - 1, 65535, 2047, 4093), 2 ** 63
+        )
+
+    def test_out_of_range(self):
+        for ids in (
+            (0, -1, 0, 0),
+            (0, 65536, 0, 0),
+            (0, 0, -2048, 0),
+            (0, 0, 2048, 0),
+            (0, 0, 0, -2),
+            (0, 0, 0, 4094),
+        ):
+            with self.subTest(ids=ids):
+                with self.assertRaises(ValueError):
+                    encode_road_section_lane_width_id(*ids)
+
+    def test_format(self):
+        encoded_id = encode_road_section_lane_width_id(501, 1, -1, -1)
+        self.assertEqual(format_road_section_lane_width_id(encoded_id), "501.1.-1.-1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+"""Regression test of the vectorized vertex calculation of ParametricLanes."""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from opendrive2lanelet.network import Network
+from opendrive2lanelet.opendriveparser.parser import parse_opendrive_stream
+
+from synthetic_xodr import write_synthetic_xodr
+
+__author__ = "Benjamin Orthen"
+__copyright__ = "TUM Cyber-Physical Systems Group"
+__credits__ = ["Priority Program SPP 1835 Cooperative Interacting Automobiles"]
+__version__ = "1.1.2"
+__maintainer__ = "Benjamin Orthen"
+__email__ = "commonroad-i06@in.tum.de"
+__status__ = "Released"
+
+
+def calc_vertices_per_point(parametric_lane, precision: float = 0.5):
+    """Calculate the vertices of a ParametricLane point by point with calc_border."""
+    num_steps = int(max(3, np.ceil(parametric_lane.length / float(precision))))
+    left_vertices = []
+    right_vertices = []
+    for pos in np.linspace(0, parametric_lane.length, num_steps):
+        left_vertices.append(parametric_lane.calc_border("inner", pos)[0])
+        right_vertices.append(parametric_lane.calc_border("outer", pos)[0])
+    return np.array(left_vertices), np.array(right_vertices)
+
+
+class TestCalcVertices(unittest.TestCase):
+    """Compare ParametricLane.calc_vertices with the calculation point by point."""
+
+    @classmethod
+    def setUpClass(cls):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            xodr_file = os.path.join(tmp_dir, "synthetic.xodr")
+            write_synthetic_xodr(xodr_file, 20)
+            cls.network = Network()
+            cls.network.load_opendrive(parse_opendrive_stream(xodr_file))
+
+    def test_calc_vertices_equals_calc_border(self):
+        parametric_lanes = [
+            parametric_lane
+            for parametric_lane_group in self.network._planes
+            for parametric_lane in parametric_lane_group.parametric_lanes
+        ]
+        self.assertTrue(parametric_lanes)
+
+        for parametric_lane in parametric_lanes:
+            expected = calc_vertices_per_point(parametric_lane)
+            self.network.clear_border_caches()
+            actual = parametric_lane.calc_vertices()
+            for expected_vertices, actual_vertices in zip(expected, actual):
+                self.assertEqual(expected_vertices.shape, actual_vertices.shape)
+                self.assertTrue(
+                    np.allclose(expected_vertices, actual_vertices, rtol=0, atol=1e-9),
+                    f"Vertices of {parametric_lane.id_} differ.",
+                )
+
+
+class TestMaxChordError(unittest.TestCase):
+    """Adaptive precalculation of the plan views by Network.load_opendrive."""
+
+    def test_plan_views_are_sampled_adaptively(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            xodr_file = os.path.join(tmp_dir, "synthetic.xodr")
+            write_synthetic_xodr(xodr_file, 5)
+            opendrive = parse_opendrive_stream(xodr_file)
+
+        plan_views = [
+            road.planView
+            for road in opendrive.roads
+            if road.planView.should_precalculate > 0
+        ]
+        self.assertTrue(plan_views)
+
+        Network().load_opendrive(opendrive)
+        num_fixed_samples = [
+            len(plan_view._precalculation) for plan_view in plan_views
+        ]
+
+        Network().load_opendrive(opendrive, max_chord_error=0.01)
+        for plan_view, num_samples in zip(plan_views, num_fixed_samples):
+            self.assertLess(len(plan_view._precalculation), num_samples)
+
+            # the geometries of the synthetic roads are not continuous, so only
+            # the middles of the intervals which end inside a geometry are checked
+            positions = plan_view._precalculation[:, 0]
+            inside = ~np.isin(positions[1:], plan_view._geo_lengths)
+            s_positions = ((positions[:-1] + positions[1:]) / 2)[inside]
+            expected, _ = plan_view.calc_geometry(s_positions)
+            actual, _ = plan_view.calc_many(s_positions)
+            self.assertLessEqual(
+                np.max(np.linalg.norm(actual - expected, axis=1)), 0.01
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()